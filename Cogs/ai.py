@@ -134,23 +134,18 @@ class Ai(commands.Cog):
                 await ctx.send("Invalid input. Please respond with a number.")
                 
                 
-    async def generate_image(self, prompt: str) -> str:
+    async def generate_image(self, prompt: str) -> bytes:
      headers = {"Authorization": f"Bearer {self.api_key}"}
      payload = {"inputs": prompt, "options": {"wait_for_model": True}}
 
      max_retries = 3
-     output_dir = Path("Data/commands/ai/images")
-     output_dir.mkdir(parents=True, exist_ok=True)
 
      for attempt in range(max_retries):
         async with aiohttp.ClientSession() as session:
             async with session.post(self.huggingface_url, headers=headers, json=payload) as response:
                 if response.status == 200:
-                    image_bytes = await response.read()
-                    output_path = output_dir / f"generated_image_{attempt}.png"
-                    with open(output_path, "wb") as image_file:
-                        image_file.write(image_bytes)
-                    return str(output_path)
+                    # Handed straight to discord.File, concurrent prompts never share a file
+                    return await response.read()
                 elif response.status == 500:
                     error_message = await response.text()
                     if "CUDA out of memory" in error_message and attempt < max_retries - 1:
@@ -165,8 +160,8 @@ class Ai(commands.Cog):
      try:
         async with ctx.typing():
             message = await ctx.reply('> **Please wait while I generate your prompt...**', mention_author=False)
-            image_path = await self.generate_image(prompt)
-            image_file = discord.File(image_path, filename="generated_image.png")
+            image_bytes = await self.generate_image(prompt)
+            image_file = discord.File(BytesIO(image_bytes), filename="generated_image.png")
             
             # Create a description string properly
             description = f'**Prompt:** ```{prompt}```\n**Prompt Length:** {len(prompt)} characters'
@@ -18,6 +18,8 @@ from PIL import Image, ImageDraw, ImageFont, ImageSequence
 from Imports.discord_imports import * 
 from Data.const import primary_color, error_custom_embed, Help_Select_Embed_Mapping, Help_Embed_Mapping, banner_url, get_banner_color
 from Imports.log_imports import logger
+from Data.assets import assets
+from Data.render import render_service
 
 
 import textwrap
@@ -148,13 +150,10 @@ class Select(discord.ui.Select):
             else:
                 logger.warning(f"No thumbnail URL found for cog '{cog_name}'.")
 
-            # Attach the generated image if it exists
-            image_path = 'Data/commands/help/set_image/cog_image.png'
-            file = None
-            if os.path.exists(image_path):
-                with open(image_path, 'rb') as f:
-                    file = discord.File(f, filename='cog_image.png')
-                self.cog_embed2.set_image(url='attachment://cog_image.png')
+            # Attach the category banner, rendered once per category and then served from memory
+            image_bytes = await render_service.render(Options_ImageGenerator.render_image, cog_name, cache_key=Options_ImageGenerator.cache_key(cog_name))
+            file = discord.File(BytesIO(image_bytes), filename='cog_image.png')
+            self.cog_embed2.set_image(url='attachment://cog_image.png')
 
             # Add commands to the embed
             cog = self.bot.get_cog(cog_name)
@@ -207,14 +206,14 @@ class HelpMenu(discord.ui.View):
 
 
 class Options_ImageGenerator:
+    # Configurable values
+    font_path_header = "Data/commands/help/menu/initial/style/assets/font/valentine.ttf"
+    font_path_base = "Data/commands/help/menu/initial/style/assets/font/dizhitl-italic.ttf"
+    character_path = "Data/commands/help/menu/initial/style/assets/character.png"
+    background_path = "Data/commands/help/menu/initial/style/assets/background.png"
+
     def __init__(self, cog_name):
         """Initialize the ImageGenerator with cog-specific data and load resources."""
-        # Configurable values
-        self.font_path_header = "Data/commands/help/menu/initial/style/assets/font/valentine.ttf"
-        self.font_path_base = "Data/commands/help/menu/initial/style/assets/font/dizhitl-italic.ttf"
-        self.character_path = "Data/commands/help/menu/initial/style/assets/character.png"
-        self.background_path = "Data/commands/help/menu/initial/style/assets/background.png"
- 
         # Font sizes
         self.header_font_size = 35
         self.base_font_size = 12
@@ -229,10 +228,7 @@ class Options_ImageGenerator:
         # Text content
         self.cog_name = cog_name
         self.header_text = f"{cog_name.replace('_', ' ')}"
-        self.description_text = self._wrap_text(
-            f"{Help_Select_Embed_Mapping.embeds[cog_name.lower()]['description'] or '...'}", 
-            max_width=500
-        )
+        self.description_text = self._wrap_text(self.description(cog_name), max_width=500)
 
         # Layout positions
         self.character_pos = (5, 5)
@@ -248,46 +244,16 @@ class Options_ImageGenerator:
 
         # Load fonts and images
         self._load_resources()
-        self._apply_color_replacements()
 
     def _load_resources(self):
-        """Load the fonts and images required for generating the image."""
-        self.header_font = ImageFont.truetype(self.font_path_header, self.header_font_size)
-        self.base_font = ImageFont.truetype(self.font_path_base, self.base_font_size)
-        self.character = Image.open(self.character_path).convert("RGBA")
-        self.background = Image.open(self.background_path).convert("RGBA")
-
-        # Resize character image
-        self._resize_character()
-
-    def _resize_character(self):
-        """Resize the character image to a percentage of its original size."""
-        new_width = round(self.character.width * self.character_scale)
-        new_height = round(self.character.height * self.character_scale)
-        self.character = self.character.resize((new_width, new_height))
-
-    def _apply_color_replacements(self):
-        """Replace specific colors in the background image with colors from replacement images, solid colors, or transparency."""
-        bg_array = np.array(self.background)
-
-        for old_hex, replacement in self.color_replacements_map.items():
-            old_color = tuple(int(old_hex[i:i+2], 16) for i in (0, 2, 4))
-            if replacement == 'transparent':  # If replacement is transparency
-                mask = cv2.inRange(bg_array[:, :, :3], np.array(old_color) - 10, np.array(old_color) + 10)
-                bg_array[mask > 0] = [0, 0, 0, 0]  # Set the pixels to fully transparent
-            elif replacement.startswith('http'):  # Replacement is an image URL
-                replacement_img = self._download_image(replacement)
-                replacement_img = replacement_img.resize((self.background.width, self.background.height))
-                replacement_array = np.array(replacement_img)[:, :, :3]
-
-                mask = cv2.inRange(bg_array[:, :, :3], np.array(old_color) - 10, np.array(old_color) + 10)
-                bg_array[mask > 0, :3] = replacement_array[mask > 0]
-            else:  # Replacement is a solid color hex code
-                replacement_color = tuple(int(replacement[i:i+2], 16) for i in (1, 3, 5))
-                mask = cv2.inRange(bg_array[:, :, :3], np.array(old_color) - 10, np.array(old_color) + 10)
-                bg_array[mask > 0, :3] = replacement_color
-
-        self.background = Image.fromarray(bg_array, 'RGBA')
+        """Fetch the fonts and images from the shared asset cache, decoded and scaled once per process."""
+        self.header_font = assets.font(self.font_path_header, self.header_font_size)
+        self.base_font = assets.font(self.font_path_base, self.base_font_size)
+        self.character = assets.image(self.character_path, scale=self.character_scale)
+        self.background = assets.image(self.background_path, replacements=self.color_replacements_map)
+        # Background with the character already pasted, only the text is drawn per image
+        self.base_layer = assets.composite(self.background_path, self.character_path, self.character_scale,
+                                           self.character_pos, self.color_replacements_map)
 
     def _wrap_text(self, text, max_width):
         """Wrap text to fit within the specified width."""
@@ -296,7 +262,7 @@ class Options_ImageGenerator:
         current_line = []
 
         draw = ImageDraw.Draw(Image.new('RGBA', (1, 1)))  # Dummy image to get draw object
-        font = ImageFont.truetype(self.font_path_base, self.base_font_size)  # Use base font size
+        font = assets.font(self.font_path_base, self.base_font_size)  # Use base font size
 
         for word in words:
             current_line.append(word)
@@ -320,21 +286,11 @@ class Options_ImageGenerator:
         # Draw description text
         draw.text((text_x, text_y), self.description_text, font=self.base_font, fill=self.base_font_color)
 
-    def _download_image(self, url):
-        """Download an image from a URL."""        
-        response = requests.get(url)
-        response.raise_for_status()  # Ensure we notice bad responses
-        return Image.open(BytesIO(response.content)).convert("RGBA")
-
     def create_image(self):
         """Generate the complete image with the background, character, and text."""        
-        bg = self.background.copy()
+        bg = self.base_layer.copy()
         draw = ImageDraw.Draw(bg)
 
-        # Paste the character image onto the background
-        character_x, character_y = self.character_pos
-        bg.paste(self.character, (character_x, character_y), self.character)
-
         # Draw all text onto the image
         text_x = self.character.width + self.text_x_offset
         text_y = self.text_y_offset
@@ -342,6 +298,20 @@ class Options_ImageGenerator:
 
         return bg
 
+    @staticmethod
+    def description(cog_name):
+        return f"{Help_Select_Embed_Mapping.embeds[cog_name.lower()]['description'] or '...'}"
+
+    @classmethod
+    def cache_key(cls, cog_name):
+        """Everything the image depends on, computed from the inputs alone; equal keys render equal PNGs."""
+        return (cls.__name__, cog_name, cls.description(cog_name), assets.signature(cls.font_path_header, cls.font_path_base, cls.character_path, cls.background_path))
+
+    @classmethod
+    def render_image(cls, cog_name):
+        """Builds and draws the image in one call, so the asset loading and wrapping run on the render pool too."""
+        return cls(cog_name).create_image()
+
     def save_image(self, file_path):
         """Save the generated image to the given file path."""        
         img = self.create_image()
@@ -364,15 +334,22 @@ class Options_ImageGenerator:
 
 
 class ImageGenerator:
-    def __init__(self, ctx):
+    # Configurable values
+    font_path_header = "Data/commands/help/menu/initial/style/assets/font/valentine.ttf"
+    font_path_base = "Data/commands/help/menu/initial/style/assets/font/dizhitl-italic.ttf"
+    character_path = "Data/commands/help/menu/initial/style/assets/character.png"
+    background_path = "Data/commands/help/menu/initial/style/assets/background.png"
+    text2_options = [
+        "how can I help you today?",
+        "need help with something?",
+        "what can I do for you?",
+        "how may I assist you?"
+    ]
+    text3 = "Command: [option]?"
+
+    def __init__(self, ctx, greeting=None):
         """Initialize the ImageGenerator with user-specific data and load resources."""
         self.user_name = ctx.author.display_name
-        
-        # Configurable values
-        self.font_path_header = "Data/commands/help/menu/initial/style/assets/font/valentine.ttf"
-        self.font_path_base = "Data/commands/help/menu/initial/style/assets/font/dizhitl-italic.ttf"
-        self.character_path = "Data/commands/help/menu/initial/style/assets/character.png"
-        self.background_path = "Data/commands/help/menu/initial/style/assets/background.png"
 
         # Color replacements
         self.color_replacements_map = {
@@ -396,14 +373,7 @@ class ImageGenerator:
 
         # Text content
         self.text1 = self._truncate_text(f"{ctx.me.display_name} Help", 350)  # Truncate user_name if needed
-        self.text2_options = [
-            "how can I help you today?",
-            "need help with something?",
-            "what can I do for you?",
-            "how may I assist you?"
-        ]
-        self.text2 = f"Hello {self.user_name}, {random.choice(self.text2_options)}"
-        self.text3 = "Command: [option]?"
+        self.text2 = f"Hello {self.user_name}, {greeting or random.choice(self.text2_options)}"
 
         # Layout positions
         self.character_pos = (5, 5)
@@ -421,7 +391,7 @@ class ImageGenerator:
     def _truncate_text(self, text, max_width):
         """Truncate text to fit within the specified width."""
         draw = ImageDraw.Draw(Image.new('RGBA', (1, 1)))  # Dummy image to get draw object
-        font = ImageFont.truetype(self.font_path_header, self.header_font_size)  # Use header font size
+        font = assets.font(self.font_path_header, self.header_font_size)  # Use header font size
 
         # Check if text fits within the specified width
         while draw.textbbox((0, 0), text, font=font)[2] > max_width:
@@ -431,53 +401,15 @@ class ImageGenerator:
         return text
 
     def _load_resources(self):
-        """Load the fonts and images required for generating the help menu image."""
-        self.font = ImageFont.truetype(self.font_path_header, self.header_font_size)
-        self.base_font = ImageFont.truetype(self.font_path_base, self.base_font_size)
-        self.command_font = ImageFont.truetype(self.font_path_base, self.command_font_size)
-        self.character = Image.open(self.character_path).convert("RGBA")
-        self.background = Image.open(self.background_path).convert("RGBA")
-
-        # Process color replacements
-        if self.color_replacements_map:
-            self._apply_color_replacements()
-
-        self._resize_character()
-
-    def _download_image(self, url):
-        """Download an image from a URL and return it as a PIL Image."""
-        response = requests.get(url)
-        response.raise_for_status()
-        return Image.open(BytesIO(response.content))
-
-    def _apply_color_replacements(self):
-        """Replace specific colors in the background image with colors from replacement images, solid colors, or transparency."""
-        bg_array = np.array(self.background)
-
-        for old_hex, replacement in self.color_replacements_map.items():
-            old_color = tuple(int(old_hex[i:i+2], 16) for i in (0, 2, 4))
-            if replacement == 'transparent':  # If replacement is transparency
-                mask = cv2.inRange(bg_array[:, :, :3], np.array(old_color) - 10, np.array(old_color) + 10)
-                bg_array[mask > 0] = [0, 0, 0, 0]  # Set the pixels to fully transparent
-            elif replacement.startswith('http'):  # Replacement is an image URL
-                replacement_img = self._download_image(replacement)
-                replacement_img = replacement_img.resize((self.background.width, self.background.height))
-                replacement_array = np.array(replacement_img)[:, :, :3]
-
-                mask = cv2.inRange(bg_array[:, :, :3], np.array(old_color) - 10, np.array(old_color) + 10)
-                bg_array[mask > 0, :3] = replacement_array[mask > 0]
-            else:  # Replacement is a solid color hex code
-                replacement_color = tuple(int(replacement[i:i+2], 16) for i in (1, 3, 5))
-                mask = cv2.inRange(bg_array[:, :, :3], np.array(old_color) - 10, np.array(old_color) + 10)
-                bg_array[mask > 0, :3] = replacement_color
-
-        self.background = Image.fromarray(bg_array, 'RGBA')
-
-    def _resize_character(self):
-        """Resize the character image to a percentage of its original size."""
-        new_width = round(self.character.width * self.character_scale)
-        new_height = round(self.character.height * self.character_scale)
-        self.character = self.character.resize((new_width, new_height))
+        """Fetch the fonts and images from the shared asset cache, decoded and scaled once per process."""
+        self.font = assets.font(self.font_path_header, self.header_font_size)
+        self.base_font = assets.font(self.font_path_base, self.base_font_size)
+        self.command_font = assets.font(self.font_path_base, self.command_font_size)
+        self.character = assets.image(self.character_path, scale=self.character_scale)
+        self.background = assets.image(self.background_path, replacements=self.color_replacements_map)
+        # Background with the character already pasted, only the text is drawn per image
+        self.base_layer = assets.composite(self.background_path, self.character_path, self.character_scale,
+                                           self.character_pos, self.color_replacements_map)
 
     def _draw_text(self, draw, text_x, text_y):
         """Draw all text on the image."""
@@ -493,13 +425,9 @@ class ImageGenerator:
 
     def create_image(self):
         """Generate the complete image with the background, character, and text."""
-        bg = self.background.copy()
+        bg = self.base_layer.copy()
         draw = ImageDraw.Draw(bg)
 
-        # Paste the character image onto the background
-        character_x, character_y = self.character_pos
-        bg.paste(self.character, (character_x, character_y), self.character)
-
         # Draw all text onto the image
         text_x = self.character.width + self.text_x_offset
         text_y = self.text_y_offset
@@ -507,6 +435,17 @@ class ImageGenerator:
 
         return bg
 
+    @classmethod
+    def cache_key(cls, ctx, greeting):
+        """Everything the image depends on, computed from the inputs alone; equal keys render equal PNGs."""
+        return (cls.__name__, ctx.me.display_name, ctx.author.display_name, greeting, cls.text3,
+                assets.signature(cls.font_path_header, cls.font_path_base, cls.character_path, cls.background_path))
+
+    @classmethod
+    def render_image(cls, ctx, greeting):
+        """Builds and draws the image in one call, so the asset loading and truncation run on the render pool too."""
+        return cls(ctx, greeting).create_image()
+
     def save_image(self, file_path):
         """Save the generated image to the given file path."""
         img = self.create_image()
@@ -636,32 +575,23 @@ class Help(commands.Cog):
                 self.cog_commands = cog_commands
                 self._update_command_mapping()
 
-                # Create the image slideshow
-                image_generator = ImageGenerator(
-                    ctx=ctx                    
-                )
-                image_file_path = 'Data/commands/help/set_image/image.png'
-                image_generator.save_image(file_path=image_file_path)
-
-                # Upload the image file to Discord
-                with open(image_file_path, 'rb') as file:
-                    help_embed = discord.Embed(
-                        color=primary_color_value,
-                        description=(
-                            f"Use `{ctx.prefix}help <command>` to get more information about a specific command.\n\n"
-                            f"- For more help, visit the [support server](https://discord.gg/9QTMkjsteF)."
-                        )
-                    )
-                    
-                    select_view = Select(self.cog_commands, self.bot, primary_color_value)
-                    options = HelpMenu(self.bot, primary_color_value, select_view)
+                # Render the menu banner on the render pool
+                greeting = random.choice(ImageGenerator.text2_options)
+                image_bytes = await render_service.render(ImageGenerator.render_image, ctx, greeting, cache_key=ImageGenerator.cache_key(ctx, greeting))
 
-                    help_embed.set_image(url='attachment://image.png')
-                    await ctx.send(embed=help_embed, file=discord.File(file, 'image.png'), view=options, reference=ctx.message, allowed_mentions=discord.AllowedMentions.none())
+                help_embed = discord.Embed(
+                    color=primary_color_value,
+                    description=(
+                        f"Use `{ctx.prefix}help <command>` to get more information about a specific command.\n\n"
+                        f"- For more help, visit the [support server](https://discord.gg/9QTMkjsteF)."
+                    )
+                )
+                
+                select_view = Select(self.cog_commands, self.bot, primary_color_value)
+                options = HelpMenu(self.bot, primary_color_value, select_view)
 
-                # Ensure file cleanup if necessary
-                if os.path.exists(image_file_path):
-                    os.remove(image_file_path)
+                help_embed.set_image(url='attachment://image.png')
+                await ctx.send(embed=help_embed, file=discord.File(BytesIO(image_bytes), 'image.png'), view=options, reference=ctx.message, allowed_mentions=discord.AllowedMentions.none())
 
             except Exception as e:
                 logger.error(f"Error sending HelpMenu: {e}")
@@ -7,12 +7,12 @@ from datetime import datetime, timezone, timedelta
 # Third-Party Library Imports
 import json
 import numpy as np
-import motor.motor_asyncio
 from pymongo.errors import PyMongoError
 
 from Imports.discord_imports import *
 from Cogs.quest import Quest_Data, primary_color
 from Data.const import error_custom_embed
+from Data.database import database
 
 # Configure the logger
 logger = logging.getLogger(__name__)
@@ -98,8 +98,9 @@ class Memo(discord.ui.View):
         self.message = message
         self.bot = bot
 
-        self.quest_data = Quest_Data(bot)
-        self.memo_data = Memo_Data(bot)
+        # The loaded cogs, not a fresh pair per game
+        self.quest_data = bot.get_cog('Quest_Data') or Quest_Data(bot)
+        self.memo_data = bot.get_cog('Memo_Data') or Memo_Data(bot)
 
         # Ensure emojis are a list
         if not isinstance(self.emojis, list):
@@ -262,13 +263,7 @@ class Memo_Data(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.DB_NAME = 'Memo'
-
-        # Initialize MongoDB connection
-        mongo_url = os.getenv('MONGO_URI')
-
-        if not mongo_url:
-            raise ValueError("No MONGO_URI found in environment variables")
-        self.mongoConnect = motor.motor_asyncio.AsyncIOMotorClient(mongo_url)
+        self.mongoConnect = database.client
 
     async def get_user_highscore(self, guild_id, user_id):
         """Get the highscore for a user in a specific guild."""
@@ -16,7 +16,6 @@ import sqlite3
 import random
 import threading
 import asyncio
-import pandas as pd
 from tqdm import tqdm
 import multiprocessing
 from functools import lru_cache
@@ -32,7 +31,6 @@ import aiohttp
 import requests
 import psutil
 import imagehash
-import motor.motor_asyncio
 from PIL import Image, ImageChops
 
 
@@ -53,6 +51,16 @@ from Imports.discord_imports import *
 from discord.ext import tasks
 from Imports.log_imports import logger
 from Data.const import error_custom_embed, primary_color
+from Data.database import database
+from Data.pokemon.names import pokemon_names
+from Data.pokemon.pokedex import pokedex
+from Data.pokemon.pokeapi import pokeapi, PokeAPIError
+from Data.pokemon.types import type_chart, require_type_chart
+from Data.pokemon.dex_store import dex_store, slim_pokemon
+from Data.pokemon.moves import move_db, learnset, version_groups
+from Data.pokemon.evolutions import evolution_graph
+from Data.pokemon.dex_cache import dex_embed_cache
+from Data.pokemon.forms import form_catalog
 
 
 # Configure logging
@@ -433,21 +441,24 @@ class PokemonPredictor:
 class PokemonData:
     def __init__(self):
         self.DB_NAME = 'Pokemon_SH'
-        
-        # Initialize MongoDB connection
-        mongo_url = os.getenv('MONGO_URI')
-        if not mongo_url:
-            raise ValueError("No MONGO_URI found in environment variables")
-        self.mongoConnect = motor.motor_asyncio.AsyncIOMotorClient(mongo_url)
+        self.mongoConnect = database.client
         self.db = self.mongoConnect[self.DB_NAME]
         self.users_collection = self.db['users_pokemon']
 
-        # Load the CSV file containing Pokémon descriptions
-        self.pokemon_df = pd.read_csv('Data/pokemon/pokemon_description.csv')
+        # Name index built from the Pokémon description CSV
+        self.name_index = pokemon_names
 
     async def check_pokemon_exists(self, pokemon_name):
-        # Check if the Pokémon exists in the CSV file
-        return not self.pokemon_df[self.pokemon_df['slug'].str.lower() == pokemon_name.lower()].empty
+        # Check if the Pokémon (or any of its alternate names) exists in the CSV file
+        return pokemon_name in self.name_index
+
+    async def resolve_pokemon_name(self, pokemon_name):
+        # Resolve any language alias to the canonical slug
+        return self.name_index.resolve(pokemon_name)
+
+    async def suggest_pokemon_names(self, pokemon_name, limit=3):
+        # Closest known slugs for a misspelled name
+        return self.name_index.suggest(pokemon_name, limit)
 
     async def get_user_pokemon(self, user_id):
         # Get the user's Pokémon list from the database
@@ -641,6 +652,25 @@ class Pokemon(commands.Cog):
      else:
         await ctx.send("No image found to predict.")
          
+    async def cog_load(self):
+        # Fail here rather than inside a command when the type chart was never built
+        require_type_chart()
+        await dex_store.import_legacy_json()
+        # Warm the move database in the background, it is persisted so this is only slow once
+        self.move_warmup = asyncio.create_task(move_db.populate())
+        # With an offline bundle every species' forms can be prepared up front at no network cost
+        self.form_warmup = asyncio.create_task(form_catalog.populate()) if pokeapi.bundle is not None else None
+
+    async def cog_unload(self):
+        # Stop the warm-ups before the session they fetch through is closed
+        warmups = [task for task in (getattr(self, 'move_warmup', None), getattr(self, 'form_warmup', None)) if task is not None]
+        for task in warmups:
+            task.cancel()
+        await asyncio.gather(*warmups, return_exceptions=True)
+        await dex_store.close()
+        await form_catalog.save()
+        await pokeapi.close()
+
     @commands.Cog.listener()
     async def on_message(self, message):
         # Check if the message is from the specified author and contains an embed
@@ -745,11 +775,13 @@ class Pokemon(commands.Cog):
         already_have_pokemon = []
 
         for pokemon_name in pokemon_names:
-            # Check if the Pokémon exists in the database (from CSV)
-            exists = await self.data_handler.check_pokemon_exists(pokemon_name.lower())
-            if not exists:
-                not_exist_pokemon.append(pokemon_name)
+            # Resolve the name (any language) to the slug used by the predictor
+            slug = await self.data_handler.resolve_pokemon_name(pokemon_name)
+            if not slug:
+                suggestions = await self.data_handler.suggest_pokemon_names(pokemon_name)
+                not_exist_pokemon.append(f"{pokemon_name} (did you mean: {', '.join(suggestions)}?)" if suggestions else pokemon_name)
                 continue
+            pokemon_name = slug
 
             # Check if the Pokémon is already in the user's list
             if any(p.lower() == pokemon_name.lower() for p in user_pokemon):
@@ -785,6 +817,8 @@ class Pokemon(commands.Cog):
         not_in_list_pokemon = []
 
         for pokemon_name in pokemon_names:
+            pokemon_name = await self.data_handler.resolve_pokemon_name(pokemon_name) or pokemon_name
+
             # Check if the Pokémon is in the user's list
             if not any(p.lower() == pokemon_name.lower() for p in user_pokemon):
                 not_in_list_pokemon.append(pokemon_name)
@@ -831,67 +865,71 @@ class Pokemon(commands.Cog):
             is_form = form is not None
 
             args = args.replace("shiny ", "")
-            pokemon_id = args
+            # Resolve any alias (Bisasam, フシギダネ, mr mime...) to its slug without a network round trip
+            pokemon_id = pokemon_names.resolve(args) or args
 
 
                  
-        folder_path = "Data"
-        os.makedirs(folder_path, exist_ok=True)
-        pokemon_folder_path = os.path.join(folder_path, "pokemon")
-        os.makedirs(pokemon_folder_path, exist_ok=True)
-        file_path = os.path.join(pokemon_folder_path, "pokemon.json")
-
-        if not os.path.exists(file_path):
-            with open(file_path, 'w') as file:
-                file.write("{}")  # Creating an empty JSON file
-        
-        pokemon_data = {}
-
-        if os.path.exists(file_path):
-            with open(file_path, 'r') as file:
-                pokemon_data = json.load(file)
-
-            if str(pokemon_id) in pokemon_data:
-                existing_data = pokemon_data[str(pokemon_id)]
+        # Per-key lookup in the dex store (memory first, then disk)
+        if not is_form:
+            existing_data = await dex_store.get(pokemon_id)
+            if existing_data is not None:
                 return await self.send_pokemon_info(ctx, existing_data, type="mega" if is_mega else "shiny" if is_shiny else None,color=primary_color)
 
         if is_form:
-            url = f"https://pokeapi.co/api/v2/pokemon-form/{pokemon_id}-{form}"
+            url = f"pokemon-form/{pokemon_id}-{form}"
         else:
-            url = f"https://pokeapi.co/api/v2/pokemon/{pokemon_id}"
+            url = f"pokemon/{pokemon_id}"
          
-        response = requests.get(url)
-        if response.status_code != 200:
+        data = await pokeapi.get(url)
+        if data is None:
             if is_form:
                 
                 return await ctx.send(f"Form data not found for `{pokemon_id}`.")
             else:
-                return await ctx.send(f"Pokemon `{pokemon_id}` not found.")
+                suggestions = pokemon_names.suggest(str(pokemon_id), 3)
+                did_you_mean = f" Did you mean {', '.join(f'`{name}`' for name in suggestions)}?" if suggestions else ""
+                return await ctx.send(f"Pokemon `{pokemon_id}` not found.{did_you_mean}")
 
-        try:
-            data = response.json()
-            if is_form:
-                await self.send_form_pokemon(ctx, data)
-            else:
-                await self.send_pokemon_info(ctx, data, type="mega" if is_mega else "shiny" if is_shiny else None,color=primary_color)
-
-            # Save or update JSON data in the Pokemon folder
-            pokemon_data[str(pokemon_id)] = data
-
-            with open(file_path, 'w') as file:
-                json.dump(pokemon_data, file)
-
-        except json.JSONDecodeError:
-            if isinstance(pokemon_id, int):
-                await ctx.send(f"Failed to parse JSON data for `{pokemon_id}`.")
-
-                
+        if is_form:
+            await self.send_form_pokemon(ctx, data)
+        else:
+            # Store a slimmed copy under the id, the name and whatever alias was asked for
+            data = slim_pokemon(data)
+            await dex_store.set_many([pokemon_id, data['id'], data['name']], data)
+            await self.send_pokemon_info(ctx, data, type="mega" if is_mega else "shiny" if is_shiny else None,color=primary_color)
+
+
+    @app_commands.command(name="dex", description="Displays Pokemon dex information.")
+    @app_commands.describe(pokemon="The Pokémon's name in any language, prefix with shiny for the shiny sprite.")
+    async def dex_slash(self, interaction: discord.Interaction, pokemon: str):
+        ctx = await commands.Context.from_interaction(interaction)
+        await self.pokemon(ctx, args=pokemon)
+
+    @dex_slash.autocomplete("pokemon")
+    async def dex_autocomplete(self, interaction: discord.Interaction, current: str):
+        shiny = current.lower().startswith("shiny ")
+        prefix = current[len("shiny "):] if shiny else current
+        return [
+            app_commands.Choice(name=f"✨ {name}" if shiny else name, value=f"shiny {slug}" if shiny else slug)
+            for name, slug in pokemon_names.complete(prefix, limit=25)
+        ]
                 
     async def send_pokemon_info(self, ctx, data, type, color):
     
      name = data['name'].capitalize()
      id = data['id']
 
+     # Repeat lookups of the same species, form and variant skip rendering entirely
+     cache_key = (data['species']['name'], data['name'], type)
+     cached = dex_embed_cache.get(cache_key)
+     if cached is not None:
+        embed = discord.Embed.from_dict(cached['embed'])
+        embed.color = color
+        self.bot.add_view(Pokebuttons(cached['view']['alt_names_str'], cached['view']['name']))
+        return await ctx.reply(embed=embed, view=Pokebuttons(**cached['view'], color=color), mention_author=False)
+     cacheable = True
+
      types = [t['type']['name'].capitalize() for t in data['types']]
      pokemon_type_unformatted = types
      
@@ -901,33 +939,21 @@ class Pokemon(commands.Cog):
     
     
      pokemon_name = name
-     base_url = "https://pokeapi.co/api/v2/pokemon-species/"
      if type == "mega":
                         print("Getting Mega Evolution")
-                        mega_url = f"https://pokeapi.co/api/v2/pokemon/{pokemon_name.lower()}-mega"
-                        mega_response = requests.get(mega_url)
-                        print(requests.get(mega_url))
-                        if mega_response.status_code == 200:
-                            try:
-                                mega_data = mega_response.json()
-                                data_species = mega_response.json()  # Corrected line
-
-                            except json.JSONDecodeError:
-                                await ctx.send(f"Failed to parse JSON data for mega evolution of `{pokemon_name}`.")
-                        else:
+                        mega_data = await pokeapi.get(f"pokemon/{pokemon_name.lower()}-mega")
+                        data_species = mega_data or {}
+                        if mega_data is None:
+                            cacheable = False
                             await ctx.send(f"Mega evolution data not found for `{pokemon_name}`.")
      else:
             print("Getting Basic Pokemon")
-            url = f"{base_url}{pokemon_name.lower()}/"
-            response_species = requests.get(url)
-            if response_species.status_code != 200:
+            data_species = await pokeapi.get(f"pokemon-species/{pokemon_name.lower()}")
+            if data_species is None:
+             # Without species data the embed lacks names, flavor text and gender, never cache it
+             cacheable = False
              # Fetch form data if species data not found
-             url = f"https://pokeapi.co/api/v2/pokemon-form/{pokemon_name.lower()}/"
-             form_response = requests.get(url)
-             if form_response.status_code == 200:
-                 data_species = form_response.json()
-            else:
-                 data_species = response_species.json()
+             data_species = await pokeapi.get(f"pokemon-form/{pokemon_name.lower()}") or {}
            
     
              
@@ -975,32 +1001,6 @@ class Pokemon(commands.Cog):
         await find_pokemon_description(pokemon_name)
         print(f"Error: An unexpected error occurred - {e}")
 
-     def get_pokemon_description(pokemon_id, file_path='Data/pokemon/pokemon_description.csv'):
-      with open(file_path, mode='r', encoding='utf-8') as csv_file:
-        reader = csv.DictReader(csv_file)
-        
-        for row in reader:
-            if row['id'] == str(pokemon_id):
-                return row['description']
-       
-      return "Pokémon ID not found"
-    
-     def get_pokemon_region(pokemon_id, file_path='Data/pokemon/pokemon_description.csv'):
-        try:
-            with open(file_path, mode='r', encoding='utf-8') as csv_file:
-                reader = csv.DictReader(csv_file)
-                for row in reader:
-                    if row['id'] == str(pokemon_id):
-                        return row['region']
-        except FileNotFoundError:
-            return None
-        except PermissionError:
-            return None
-        except Exception as e:
-            print(f"An error occurred: {e}")
-            return None
-        return None
-     
      def get_pokemon_alternate_names(data_species, pokemon_name):
       try:
        if data_species:
@@ -1012,15 +1012,14 @@ class Pokemon(commands.Cog):
       except KeyError:
         return None  # or handle the missing key case accordingly
     
-     region = get_pokemon_region(id) or None
+     region = pokedex.region(id)
 
 
-     pokemon_description = get_pokemon_description(id)
+     pokemon_description = pokedex.description(id)
      
      
-     species_url = data['species']['url']
-     species_data = requests.get(species_url).json()
-     species_name = species_data['name']
+     # The payload already names its species, no need to fetch it again
+     species_name = data['species']['name']
    
         
      if type == "shiny":
@@ -1028,18 +1027,13 @@ class Pokemon(commands.Cog):
       image_thumb = data['sprites']['versions']['generation-v']['black-white']['animated']['front_shiny']
      elif type == "mega":
                         print("Getting Mega Evolution")
-                        mega_url = f"https://pokeapi.co/api/v2/pokemon/{pokemon_name.lower()}-mega"
-                        mega_response = requests.get(mega_url)
-                        print(requests.get(mega_url))
-                        if mega_response.status_code == 200:
-                            try:
-                                mega_data = mega_response.json()
+                        # Already fetched above, served from the client's cache
+                        mega_data = await pokeapi.get(f"pokemon/{pokemon_name.lower()}-mega")
+                        if mega_data is not None:
                                 # Redefine data for mega evolution
                                 data = mega_data
                                 image_url = mega_data['sprites']['other']['official-artwork']['front_default']
                                 image_thumb = mega_data['sprites']['versions']['generation-v']['black-white']['animated']['front_default']
-                            except json.JSONDecodeError:
-                                await ctx.send(f"Failed to parse JSON data for mega evolution of `{pokemon_name}`.")
                         else:
                             await ctx.send(f"Mega evolution data not found for `{pokemon_name}`.")
      else:
@@ -1047,7 +1041,7 @@ class Pokemon(commands.Cog):
       image_thumb = data['sprites']['versions']['generation-v']['black-white']['animated']['front_default']
 
    
-     height, weight = (float(int(data['height'])) / 10, float(int(data['weight'])) / 10)
+     height, weight = measure(data.get('height'), 'm'), measure(data.get('weight'), 'kg')
      max_stat = 255
      bar_length = 13  # Length of the level bar
      fixed_bar_length = 13
@@ -1088,17 +1082,6 @@ class Pokemon(commands.Cog):
      # color = mot.color
     
     
-     def get_pokemon_species_data(name):
-      response = requests.get(f'https://pokeapi.co/api/v2/pokemon-species/{name.lower()}')
-      if response.status_code == 200:
-        species_data = response.json()
-        return species_data
-      else:
-        return None
-
-      
-    
-     
      language_codes = ["ja", "ja", "ja", "en", "de", "fr"]
       # Define a mapping between language codes and flag emojis
      flag_mapping = {
@@ -1145,111 +1128,26 @@ class Pokemon(commands.Cog):
       alt_names_str = "No alternate names available."
       print(alt_names_str)
         
-     def organize_pokemon_names_by_region(pokemon_name):
-      region = get_pokemon_region(data_species,pokemon_name)
-    
-      if region:
-        result = f"Region: {region.capitalize()}\n"
-        
-        # Fetch alternative names from the PokeAPI
-        alternate_names = get_pokemon_alternate_names(data_species,pokemon_name)
-
-        if alternate_names:
-            alt_names_info = {}
-
-            for name, lang in alternate_names:
-                key = name.lower()
-
-                flag = flag_mapping.get(lang, None)
-                if key not in alt_names_info and flag is not None:
-                    alt_names_info[key] = f"{flag} {name.capitalize()}"
-
-            name_list = sorted(list(alt_names_info.values()), key=lambda x: x.split(' ')[1],reverse=True)
-            alt_names_str = "\n".join(f"`{name_list}`")
-            
-            result += alt_names_str
-        else:
-            result += "No alternate names available."
-      else:
-        result = "Region information not available."
-    
-      return result
-    
-     p = organize_pokemon_names_by_region(name)
-        
-     print(p)
-     async def get_type_chart(max_retries=3):
-      url = 'https://pokeapi.co/api/v2/type'
-
-      for attempt in range(max_retries):
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        type_chart = {}
-                        types_data = (await response.json())['results']
-
-                        for type_data in types_data:
-                            type_name = type_data['name']
-                            effectiveness_url = type_data['url']
-
-                            async with session.get(effectiveness_url) as effectiveness_response:
-                                if effectiveness_response.status == 200:
-                                    damage_relations = (await effectiveness_response.json())['damage_relations']
-                                    type_chart[type_name] = {
-                                        'double_damage_to': [],
-                                        'half_damage_to': [],
-                                        'no_damage_to': [],
-                                        'double_damage_from': [],
-                                        'half_damage_from': [],
-                                        'no_damage_from': []
-                                    }
-
-                                    for key, values in damage_relations.items():
-                                        for value in values:
-                                            type_chart[type_name][key].append(value['name'])
-
-                        return type_chart
-                    else:
-                        # Handle other HTTP response codes if needed
-                        print(f"Error: HTTP request failed with status code {response.status}")
-                        return None
-        except aiohttp.ClientError as e:
-            print(f"Error: aiohttp client error - {e}")
-        except Exception as e:
-            print(f"Error: An unexpected error occurred - {e}")
-
-        # If the attempt is not the last one, wait for a while before retrying
-        if attempt < max_retries - 1:
-            await asyncio.sleep(2 ** attempt)
-
-   
-    
-     def find_pokemon_weaknesses(pokemon_info, type_chart):
+     def find_pokemon_weaknesses(pokemon_info):
       if pokemon_info is None:
         print("Failed to retrieve Pokemon info.")
         return None, None
 
       types = [t['type']['name'] for t in pokemon_info['types']]
+      matchups = type_chart.matchups(types)
 
-      weaknesses = set()
-      strengths = set()
-
-      for pokemon_type in types:
-        weaknesses.update(type_chart.get(pokemon_type, {}).get('double_damage_from', []))
-        strengths.update(type_chart.get(pokemon_type, {}).get('double_damage_to', []))
-
-      weaknesses.discard('')
- 
-      # Capitalize the output
-      weaknesses = {weakness.capitalize() for weakness in weaknesses}
-      strengths = {strength.capitalize() for strength in strengths}
+      # 4x weaknesses first, marked as such
+      weaknesses = [f"{weakness.capitalize()} (4×)" for weakness in matchups['double_weaknesses']]
+      weaknesses += [weakness.capitalize() for weakness in matchups['weaknesses']]
+      strengths = [strength.capitalize() for strength in type_chart.strengths(types)]
 
       return weaknesses, strengths
 
-    
-    
-     type_chart = await get_type_chart()
+     def find_pokemon_resistances(pokemon_info):
+      types = [t['type']['name'] for t in pokemon_info['types']]
+      matchups = type_chart.matchups(types)
+      return [t.capitalize() for t in matchups['resistances']], [t.capitalize() for t in matchups['immunities']]
+
     
 
      def get_pokemon_gender_ratio_display(data_species):
@@ -1339,9 +1237,9 @@ class Pokemon(commands.Cog):
 
     
      """
-     type_chart = await get_type_chart()
      pokemon_info = data
-     weaknesses, strengths = find_pokemon_weaknesses(pokemon_info, type_chart)
+     weaknesses, strengths = find_pokemon_weaknesses(pokemon_info)
+     resistances, immunities = find_pokemon_resistances(pokemon_info)
      label_width = max(len("Type"), len("Weaknesses"), len("Strengths"))
 
     
@@ -1373,6 +1271,15 @@ class Pokemon(commands.Cog):
       weaknesses_formatted,
       ''
       )
+
+     def format_branches(items):
+      if not items:
+        return '╚ None'
+      return '\n'.join([f'╠ {item}' for item in items[:-1]] + [f'╚ {items[-1]}'])
+
+     wes += "\n\n● Resistances\n" + format_branches(resistances)
+     if immunities:
+      wes += "\n\n● Immunities\n" + format_branches(immunities)
      
      pokemon_type_result = (
       "● Type\n"
@@ -1387,25 +1294,6 @@ class Pokemon(commands.Cog):
      print(pokemon_type)
 
 
-     """" Weakness stuff  """
-     weaknesses, _ = find_pokemon_weaknesses(pokemon_info, type_chart)
-
-     result = "{0}"
-
-     weaknesses_formatted = '\n'.join([f'    {i}. {weakness}' for i, weakness in enumerate(weaknesses, start=1)]) if weaknesses else 'None'
-
-     output_weak = result.format(weaknesses_formatted)
-     print(output_weak)
-    
-     """" Strengths stuff  """
-     _ , strengths = find_pokemon_weaknesses(pokemon_info, type_chart)
-
-     result = "{0}"
-
-     strengths_formatted = '\n'.join([f'    {i}. {strength}' for i, strength in enumerate(strengths, start=1)]) if strengths else 'None'
-
-     output_strength = result.format(strengths_formatted)
-     print(output_strength)
     
 
 
@@ -1433,8 +1321,8 @@ class Pokemon(commands.Cog):
         region = None
         
      appearance_info = [
-      f"**Height:** {height:.2f} m",
-      f"**Weight:** {weight:.2f} kg"
+      f"**Height:** {height}",
+      f"**Weight:** {weight}"
      ]
      appearance = '\n'.join(appearance_info)
     
@@ -1470,7 +1358,7 @@ class Pokemon(commands.Cog):
 
 
   
-     appearance = f"Height: {height:.2f} m\nWeight: {weight:.2f} kg\t\t" if gender is not None and gender != "♂ 50% - ♀ 50%" else f"Height: {height:.2f} m\nWeight: {weight:.2f} kg"
+     appearance = f"Height: {height}\nWeight: {weight}\t\t" if gender is not None and gender != "♂ 50% - ♀ 50%" else f"Height: {height}\nWeight: {weight}"
 
      gender_info = None
 
@@ -1511,11 +1399,23 @@ class Pokemon(commands.Cog):
            
 
     
-     h_w = f"Height: {height:.2f} m\nWeight: {weight:.2f} kg"
+     h_w = f"Height: {height}\nWeight: {weight}"
      print('is_shiny: ',type)      
      self.bot.add_view(Pokebuttons(alt_names_str,species_name))
      
-     await ctx.reply(embed=embed,view=Pokebuttons(alt_names_str,species_name,formatted_base_stats,type,wes,pokemon_type,base_stats,image_url,h_w,image_thumb,pokemon_dex_name,color,data,gender_differ,region, description,gender_info), mention_author=False)
+     view_params = dict(
+        alt_names_str=alt_names_str, name=species_name, formatted_base_stats=formatted_base_stats, type=type, wes=wes,
+        pokemon_type=pokemon_type, base_stats=base_stats, image_url=image_url, h_w=h_w, image_thumb=image_thumb,
+        pokemon_dex_name=pokemon_dex_name, pokemon_data=data, gender_differ=gender_differ, region=region,
+        description=description, gender_info=gender_info
+     )
+     view = await Pokebuttons.create(**view_params, color=color)
+     # An unprepared species means its form list came back incomplete
+     if form_catalog.varieties(species_name) is None:
+        cacheable = False
+     if cacheable:
+        dex_embed_cache.set(cache_key, embed, dict(view_params, pokemon_forms=view.pokemon_forms))
+     await ctx.reply(embed=embed,view=view, mention_author=False)
     
 
             
@@ -1526,7 +1426,8 @@ class Pokebuttons(discord.ui.View):
 
     def __init__(self, alt_names_str=None, name=None, formatted_base_stats=None, type=None, wes=None,
                  pokemon_type=None, base_stats=None, image_url=None, h_w=None, image_thumb=None,
-                 pokemon_dex_name=None, color=None, pokemon_data=None, gender_differ=None, region=None, description=None, gender_info=None):
+                 pokemon_dex_name=None, color=None, pokemon_data=None, gender_differ=None, region=None, description=None, gender_info=None,
+                 pokemon_forms=None):
         super().__init__(timeout=None)
         self.alt_names_str = alt_names_str
         self.pokemon_name = name
@@ -1545,11 +1446,10 @@ class Pokebuttons(discord.ui.View):
         self.region = region
         self.description = description
         self.gender_info = gender_info
+        self.pokemon_forms = pokemon_forms
         
         
-        # Add PokeSelect to the view
-        pokemon_forms = self.get_pokemon_forms()
-        
+        # Add PokeSelect to the view (forms are fetched by the caller, never inside the constructor)
         if pokemon_forms and len(pokemon_forms) > 1:
             self.add_item(PokeSelect(pokemon_forms, self.image_url, self.alt_names_str, self.pokemon_shiny,self.gender_info))
         
@@ -1568,23 +1468,18 @@ class Pokebuttons(discord.ui.View):
         # Load Pokémon images from the file
         self.pokemon_images = self.load_pokemon_images()
         
-    def get_pokemon_forms(self):
-        url = f"https://pokeapi.co/api/v2/pokemon-species/{self.pokemon_name.lower()}"
-        print(f"Requesting forms for {self.pokemon_name} from URL: {url}")
-        response = requests.get(url)
-        print(f"Response status code: {response.status_code}")
-        if response.status_code == 200:
-            forms = response.json().get('varieties', [])
-            form_details = []
-
-            for form in forms:
-                form_name = form['pokemon']['name']
-                form_url = f"https://pokeapi.co/api/v2/pokemon/{form_name.lower()}"
-                form_details.append({"name": form_name, "url": form_url})
-
-            return form_details
-
-        return []
+    @classmethod
+    async def create(cls, *args, pokemon_forms=None, **kwargs):
+        """Async factory: prepares the forms first so the constructor never waits on I/O."""
+        name = kwargs.get('name', args[1] if len(args) > 1 else None)
+        if pokemon_forms is None and name:
+            pokemon_forms = await cls.get_pokemon_forms(name)
+        return cls(*args, pokemon_forms=pokemon_forms, **kwargs)
+
+    @staticmethod
+    async def get_pokemon_forms(pokemon_name):
+        # Varieties come from the in-memory form catalog, prepared once per species
+        return [{"name": form_name} for form_name in await form_catalog.prepare(pokemon_name)]
     
     def load_pokemon_images(self):
          pokemon_images = {}
@@ -1668,113 +1563,46 @@ class Pokebuttons(discord.ui.View):
         # Fetch and display evolution chain when button is clicked
         try:
             await self.show_evolutions(button)
-        except requests.exceptions.RequestException as e:
-            await interaction.response.send_message(f"Error fetching Pokémon evolution chain: {str(e)}", ephemeral=True)
+        except PokeAPIError as e:
+            # discord.py passes the interaction first, so `button` is the interaction here
+            await button.response.send_message(embed=pokemon_error_embed(f"Error fetching Pokémon evolution chain: {e}"), ephemeral=True)
 
     async def show_evolutions(self, interaction: discord.Interaction):
         try:
-            # Fetch Pokémon evolution chain data
-            evolution_chain_data = await self.get_pokemon_evolution_chain(self.pokemon_name)
+            # The family comes from the local evolution graph
+            edges, final_forms = evolution_graph.family(self.pokemon_name)
 
-            if not evolution_chain_data:
+            if not final_forms:
                 await interaction.response.send_message(f"No evolution chain found for {self.pokemon_name.title()}.", ephemeral=True)
-                # Disable the button if no evolution chain found
-                self.disabled = True
-                await interaction.message.edit(view=self.view)
                 return
 
+            # Methods are fetched once per family and then served locally, single-stage species have none
+            if edges:
+                await evolution_graph.ensure_methods(self.pokemon_name)
+
             # Display the evolution chain
-            embeds = await self.display_evolution_chain(evolution_chain_data)
+            embeds = await self.display_evolution_chain(edges, final_forms)
             await interaction.response.send_message(embeds=embeds, ephemeral=True)
         except Exception as e:
             await interaction.response.send_message(f"Error fetching Pokémon evolution chain: {str(e)}", ephemeral=True)
 
-    async def get_pokemon_evolution_chain(self, pokemon_name):
-        async with aiohttp.ClientSession() as session:
-            species_url = f"https://pokeapi.co/api/v2/pokemon-species/{pokemon_name.lower()}/"
-            async with session.get(species_url) as response:
-                if response.status != 200:
-                    raise Exception(f"Error fetching species data for {pokemon_name}")
-
-                species_data = await response.json()
-                evolution_chain_url = species_data.get('evolution_chain', {}).get('url')
-                
-                if not evolution_chain_url:
-                    raise Exception(f"No evolution chain found for {pokemon_name}")
-
-            async with session.get(evolution_chain_url) as response:
-                if response.status != 200:
-                    raise Exception(f"Error fetching evolution chain data for {pokemon_name}")
-
-                evolution_chain_data = await response.json()
-                return evolution_chain_data.get('chain')
-        
-    async def display_evolution_chain(self, chain):
+    async def display_evolution_chain(self, edges, final_forms, max_embeds=10):
         embeds = []
-        queue = [chain]
-        final_forms = set()  # To keep track of Pokémon that are final forms
 
-        while queue:
-            current_chain = queue.pop(0)
-            species_name = current_chain['species']['name'].title()
-            
-            # Check if this is a final form
-            if not current_chain.get('evolves_to'):
-                final_forms.add(species_name)
-                continue
-            
-            for evolution in current_chain['evolves_to']:
-                details = evolution['evolution_details'][0]
-                next_pokemon_name = evolution['species']['name'].title()
-                method = await self.determine_evolution_method(species_name, details, next_pokemon_name)
-                
-                if method:
-                    embed = await self.create_pokemon_embed(species_name, method, next_pokemon_name)
-                    embeds.append(embed)
-                
-                # Add the next evolution stage to the queue
-                queue.append(evolution)
-        
-        # Handle final forms
-        if final_forms:
-            for final_form in final_forms:
-                embed = await self.create_pokemon_embed(final_form, "is the final form", final_form)
-                embeds.append(embed)
-    
-        return embeds 
-    async def determine_evolution_method(self, current_pokemon, evolution_details, next_pokemon):
-        trigger = evolution_details.get('trigger', {}).get('name')
-        item = evolution_details.get('item')
-        known_move_type = evolution_details.get('known_move_type')
-        time_of_day = evolution_details.get('time_of_day')
-        min_level = evolution_details.get('min_level')
-        min_happiness = evolution_details.get('min_happiness')
-        method = ""
-
-        if trigger == 'level-up':
-            # Handle leveling up with specific conditions
-            if known_move_type:
-                method += f"when leveled up while knowing a {known_move_type['name'].replace('-', ' ').title()} move"
-            else:
-                method = f"when leveled up"
-                if time_of_day:
-                    method += f" at {time_of_day.title()} time"
-                if min_level:
-                    method += f" starting from level {min_level}"
-                if min_happiness:
-                    method += " while holding a Friendship Bracelet"
-        elif trigger == 'use-item':
-            # Handle evolution using a specific item
-            if item:
-                method = f"using a {item['name'].replace('-', ' ').title()}"
-        elif trigger == 'trade':
-            # Handle trade evolution with or without an item
-            if item:
-                method = f"when traded holding a {item['name'].replace('-', ' ').title()}"
-            else:
-                method = f"when traded"
+        for current_id, next_id in edges:
+            species_name = evolution_graph.slug(current_id).title()
+            next_pokemon_name = evolution_graph.slug(next_id).title()
+            method = evolution_graph.method(current_id, next_id)
+            embeds.append(await self.create_pokemon_embed(species_name, method, next_pokemon_name))
+
+        # Handle final forms, as far as Discord's embed limit per message allows
+        for final_id in final_forms:
+            if len(embeds) >= max_embeds:
+                break
+            final_form = evolution_graph.slug(final_id).title()
+            embeds.append(await self.create_pokemon_embed(final_form, "is the final form", final_form))
 
-        return method
+        return embeds[:max_embeds]
 
     async def create_pokemon_embed(self, current_pokemon, method, next_pokemon):
      embed = discord.Embed()
@@ -1790,7 +1618,7 @@ class Pokebuttons(discord.ui.View):
         embed.description = f"```{current_pokemon} is the final form.```"
      else:
         # Normal evolution description
-        embed.description = f"```{current_pokemon} evolves into {next_pokemon} {method}```"
+        embed.description = f"```{current_pokemon} evolves into {next_pokemon} {method}".rstrip() + "```"
     
      return embed
 
@@ -1826,10 +1654,9 @@ class Pokebuttons(discord.ui.View):
 class PokeSelect(discord.ui.Select):
     def __init__(self, pokemon_forms, default_image_url, alt_names, pokemon_shiny, gender):
         options = []
-        for index, form in enumerate(pokemon_forms):
-            form_name = form['name']
-            form_url = f"https://pokeapi.co/api/v2/pokemon/{form_name.lower()}"
-            options.append(discord.SelectOption(label=form_name, value=form_url))
+        # Discord caps a select at 25 options
+        for form in pokemon_forms[:25]:
+            options.append(discord.SelectOption(label=form['name'], value=form['name']))
         super().__init__(placeholder="Form", options=options, custom_id="Select_Pokemon_Form")
         self.default_image_url = default_image_url
         self.alt_names = alt_names
@@ -1864,83 +1691,26 @@ class PokeSelect(discord.ui.Select):
     def get_flag(self, lang):
         return self.flag_mapping.get(lang)
 
-    def get_pokemon_description(self, pokemon_id, file_path='Data/pokemon/pokemon_description.csv'):
-        try:
-            with open(file_path, mode='r', encoding='utf-8') as csv_file:
-                reader = csv.DictReader(csv_file)
-                for row in reader:
-                    if row['id'] == str(pokemon_id):
-                        return row['description']
-        except FileNotFoundError:
-            return "File not found"
-        except PermissionError:
-            return "Permission denied"
-        except Exception as e:
-            print(f"An error occurred: {e}")
-            return f"An error occurred: {e}"
-        return "Pokémon ID not found"
-
-    def get_pokemon_region(self, pokemon_id, file_path='Data/pokemon/pokemon_description.csv'):
-        try:
-            with open(file_path, mode='r', encoding='utf-8') as csv_file:
-                reader = csv.DictReader(csv_file)
-                for row in reader:
-                    if row['id'] == str(pokemon_id):
-                        return row['region']
-        except FileNotFoundError:
-            return None
-        except PermissionError:
-            return None
-        except Exception as e:
-            print(f"An error occurred: {e}")
-            return None
-        return None
-
-    def get_alternate_names(self, pokemon_name):
+    def get_alternate_names(self, form):
         alternate_names = []
-        form_endpoint = f"https://pokeapi.co/api/v2/pokemon-form/{pokemon_name}"
-        try:
-            response = requests.get(form_endpoint)
-            response.raise_for_status()
-            data = response.json()
-            for name_data in data['names']:
-                lang = name_data['language']['name']
-                name = name_data['name']
-                flag = self.flag_mapping.get(lang)
-                if flag and name.lower() != lang.lower():
-                    alternate_names.append((name, lang))
-        except requests.exceptions.RequestException:
-            species_endpoint = f"https://pokeapi.co/api/v2/pokemon/{pokemon_name}"
-            try:
-                response = requests.get(species_endpoint)
-                response.raise_for_status()
-                data = response.json()
-                for name_data in data['names']:
-                    lang = name_data['language']['name']
-                    name = name_data['name']
-                    flag = self.flag_mapping.get(lang)
-                    if flag and name.lower() != lang.lower():
-                        alternate_names.append((name, lang))
-            except requests.exceptions.RequestException as e:
-                print(f"Error fetching alternate names: {e}")
+        for name, lang in form['names']:
+            flag = self.flag_mapping.get(lang)
+            if flag and name.lower() != lang.lower():
+                alternate_names.append((name, lang))
         return alternate_names
 
     async def callback(self, interaction: discord.Interaction):
         await interaction.response.defer()
-        selected_form_url = self.values[0]
-        response = requests.get(selected_form_url)
-
-        if response.status_code == 200:
-            data = response.json()
-            official_artwork_url = None
-            if 'sprites' in data and 'other' in data['sprites']:
-                if 'official-artwork' in data['sprites']['other']:
-                    if self.pokemon_type == 'shiny':
-                        official_artwork_url = data['sprites']['other']['official-artwork']['front_shiny']
-                        image_thumb = data['sprites']['versions']['generation-v']['black-white']['front_shiny']
-                    else:
-                        official_artwork_url = data['sprites']['other']['official-artwork']['front_default']
-                        image_thumb = data['sprites']['versions']['generation-v']['black-white']['front_default']
+        # Forms were prepared before the view was built, switching is an in-memory lookup
+        form = form_catalog.form(self.values[0])
+
+        if form is not None:
+            if self.pokemon_type == 'shiny':
+                official_artwork_url = form['artwork_shiny']
+                image_thumb = form['thumb_shiny']
+            else:
+                official_artwork_url = form['artwork']
+                image_thumb = form['thumb']
 
             embed = interaction.message.embeds[0]
             if official_artwork_url:
@@ -1948,59 +1718,52 @@ class PokeSelect(discord.ui.Select):
             else:
                 embed.set_image(url=self.default_image_url)
 
-            pokemon_data = requests.get(selected_form_url).json()
-            if pokemon_data:
-                description = self.get_pokemon_description(pokemon_data['id'])
-                height, weight = (float(int(pokemon_data['height'])) / 10, float(int(pokemon_data['weight'])) / 10)
-                footer_text = f"Height: {height:.2f} m\nWeight: {weight:.2f} kg" if self.gender is None else f"Height: {height:.2f} m\nWeight: {weight:.2f} kg\t\t" + self.gender
-                embed.title = f"#{pokemon_data['id']} — {pokemon_data['name'].replace('-', ' ').title()}" if self.pokemon_type != 'shiny' else f"#{pokemon_data['id']} — ✨ {pokemon_data['name'].replace('-', ' ').title()}"
-                embed.description = description
-                if image_thumb: 
-                 embed.set_footer(icon_url=str(image_thumb), text=footer_text)
+            description = pokedex.description(form['id'])
+            height, weight = measure(form.get('height'), 'm'), measure(form.get('weight'), 'kg')
+            footer_text = f"Height: {height}\nWeight: {weight}" if self.gender is None else f"Height: {height}\nWeight: {weight}\t\t" + self.gender
+            embed.title = f"#{form['id']} — {form['name'].replace('-', ' ').title()}" if self.pokemon_type != 'shiny' else f"#{form['id']} — ✨ {form['name'].replace('-', ' ').title()}"
+            embed.description = description
+            if image_thumb: 
+             embed.set_footer(icon_url=str(image_thumb), text=footer_text)
+            else:
+             embed.set_footer(text=footer_text)
+
+            # Remove previous Names field if it exists
+            names_field = next((field for field in embed.fields if field.name == 'Names'), None)
+            embed.clear_fields() # Clear Fields
+
+            # Add Region field
+            pokemon_region = pokedex.region(form['id'])
+            if pokemon_region and pokemon_region in self.region_mappings:
+                region_emoji = self.region_mappings[pokemon_region]
+                embed.add_field(name='Region', value=f"{region_emoji} {pokemon_region.title()}", inline=True)
+
+            # Add alternate names
+            if names_field:
+                alternate_names = self.get_alternate_names(form)
+                alt_names_info = {}
+                for name, lang in alternate_names:
+                    key = name.lower()
+                    flag = self.flag_mapping.get(lang, None)
+                    if name.lower() != lang.lower() and flag is not None:
+                        name_with_flag = f"{flag} {name}"
+                        alt_names_info[key] = name_with_flag
+
+                sorted_names_by_length = dict(sorted(alt_names_info.items(), key=lambda item: len(item[1])))
+
+                if len(sorted_names_by_length) != len(alt_names_info):
+                    sorted_names_by_name = dict(sorted(alt_names_info.items(), key=lambda item: item[1]))
+                    name_list = sorted(list(sorted_names_by_name.values()))
                 else:
-                 embed.set_footer(text=footer_text)
-
-
-                # Remove previous Names field if it exists
-                names_field = next((field for field in embed.fields if field.name == 'Names'), None)
-                if names_field:
-                    embed.remove_field(embed.fields.index(names_field))
-                
-                embed.clear_fields() # Clear Fields
-                
-                # Add Region field
-                pokemon_region = self.get_pokemon_region(pokemon_data['id'])
-                if pokemon_region and pokemon_region in self.region_mappings:
-                    region_emoji = self.region_mappings[pokemon_region]
-                    embed.add_field(name='Region', value=f"{region_emoji} {pokemon_region.title()}", inline=True)
-                    
-                # Add alternate names
-                if names_field:
-                    alternate_names = self.get_alternate_names(pokemon_data['name'])
-                    alt_names_info = {}
-                    for name, lang in alternate_names:
-                        key = name.lower()
-                        flag = self.flag_mapping.get(lang, None)
-                        if name.lower() != lang.lower() and flag is not None:
-                            name_with_flag = f"{flag} {name}"
-                            alt_names_info[key] = name_with_flag
-
-                    sorted_names_by_length = dict(sorted(alt_names_info.items(), key=lambda item: len(item[1])))
-
-                    if len(sorted_names_by_length) != len(alt_names_info):
-                        sorted_names_by_name = dict(sorted(alt_names_info.items(), key=lambda item: item[1]))
-                        name_list = sorted(list(sorted_names_by_name.values()))
-                    else:
-                        name_list = sorted(list(sorted_names_by_length.values()))
+                    name_list = sorted(list(sorted_names_by_length.values()))
 
-                    alt_names_str = "\n".join(name_list[:6])
+                alt_names_str = "\n".join(name_list[:6])
+                if alt_names_str:
                     embed.add_field(name='Names', value=alt_names_str, inline=True)
 
-                
-
             await interaction.message.edit(embed=embed)
         else:
-            await interaction.response.send_message("Error fetching data for the selected form.", ephemeral=True)
+            await interaction.followup.send("Error fetching data for the selected form.", ephemeral=True)
 
         
         
@@ -2041,51 +1804,120 @@ class Strength_weakness(discord.ui.View):
         
         
     async def show_moves(self, interaction: discord.Interaction):
+        if not self.pokemon_data:
+            # pokeapi.get answers None when the Pokémon could not be fetched
+            await interaction.followup.send(embed=pokemon_error_embed("Move data is unavailable for this Pokémon."), ephemeral=True)
+            return
         try:
-            moves_data = await self.get_pokemon_moves()
-            embed = discord.Embed(title=f"{self.pokemon_data['name'].title().replace('-', ' ')}'s — Moveset", color=self.color)
-            
-            for level, move_info in sorted(moves_data.items()):
-                move_name = move_info['name'].title().replace('-', ' ')
-                move_power = move_info['power']
-                move_accuracy = move_info['accuracy']
-                move_effect = move_info['effect']
-                
-                embed.add_field(name=f"(Level {level}) : {move_name}", 
-                                value=f"`Power:` **{move_power}**\n`Accuracy:` **{move_accuracy}**\n> ```Effect: {move_effect}```", 
-                                inline=True)
-
-            await interaction.followup.send(embed=embed, ephemeral=True)
-
-        except requests.exceptions.RequestException as e:
-            await interaction.followup.send(f"Error fetching moves data: {str(e)}", ephemeral=True)
-        except IndexError:
-            await interaction.followup.send("Error: Move data is incomplete or unavailable.", ephemeral=True)
-
-    async def get_pokemon_moves(self):
-        moves_data = {}
-        moves = self.pokemon_data.get('moves', [])
-        for move in moves:
-            move_name = move['move']['name']
-            level = [version_group_details['level_learned_at'] for version_group_details in move['version_group_details']]
-            if level:
-                move_url = move['move']['url']
-                move_data = await self.fetch_move_details(move_url)
-                move_power = move_data.get('power', 'N/A')
-                move_accuracy = move_data.get('accuracy', 'N/A')
-                move_effect_entries = move_data.get('effect_entries', [])
-                move_effect = move_effect_entries[0]['short_effect'] if move_effect_entries else 'N/A'
-                moves_data.setdefault(level[0], {'name': move_name, 'power': move_power, 'accuracy': move_accuracy, 'effect': move_effect})
-        return moves_data
-
-
-    async def fetch_move_details(self, move_url):
-        response = requests.get(move_url)
-        if response.status_code == 200:
-            move_data = response.json()
-            return move_data
-
-        return {}
+            view = await Moveset_View.create(self.pokemon_data, self.color)
+            await interaction.followup.send(embed=view.build_embed(), view=view, ephemeral=True)
+        except PokeAPIError as e:
+            await interaction.followup.send(embed=pokemon_error_embed(f"Error fetching moves data: {e}"), ephemeral=True)
+        except (KeyError, IndexError, TypeError) as e:
+            logger.error(f"Incomplete move data for {self.pokemon_data.get('name')}: {e}")
+            await interaction.followup.send(embed=pokemon_error_embed("Move data is incomplete or unavailable."), ephemeral=True)
+
+
+def measure(value, unit):
+    """PokeAPI heights and weights are in decimetres and hectograms; some forms have none."""
+    return f"{float(value) / 10:.2f} {unit}" if value is not None else "N/A"
+
+
+def pokemon_error_embed(message):
+    return discord.Embed(description=f"```{message}```", color=discord.Color.red())
+
+
+class Moveset_View(discord.ui.View):
+    # 25 fields per embed at most, and each move field is ~150 characters of the 6000 limit
+    per_page = 12
+
+    def __init__(self, pokemon_data, color, version_group=None):
+        super().__init__(timeout=300)
+        self.pokemon_data = pokemon_data
+        self.color = color
+        self.previous_button = Moveset_Button("◀", "previous")
+        self.next_button = Moveset_Button("▶", "next")
+        self.add_item(self.previous_button)
+        self.add_item(self.next_button)
+
+        groups = version_groups(pokemon_data)
+        if len(groups) > 1:
+            # Newest version groups first, a select holds 25 options at most
+            self.add_item(Moveset_Select(list(reversed(groups))[:25]))
+
+        self.set_version_group(version_group)
+
+    @classmethod
+    async def create(cls, pokemon_data, color):
+        # Only fetches moves the local database has never seen, a no-op once it is warm
+        await move_db.ensure(move['move']['name'] for move in pokemon_data.get('moves', []))
+        return cls(pokemon_data, color)
+
+    def set_version_group(self, version_group):
+        self.version_group, self.entries = learnset(self.pokemon_data, version_group)
+        self.page = 0
+        self.max_pages = max(1, -(-len(self.entries) // self.per_page))
+        self.update_buttons()
+
+    def update_buttons(self):
+        self.previous_button.disabled = self.page <= 0
+        self.next_button.disabled = self.page >= self.max_pages - 1
+
+    def build_embed(self):
+        # Only the visible page is rendered
+        embed = discord.Embed(title=f"{self.pokemon_data['name'].title().replace('-', ' ')}'s — Moveset", color=self.color)
+        start = self.page * self.per_page
+        for level, move_name in self.entries[start:start + self.per_page]:
+            move_info = move_db.get(move_name) or {}
+            move_power = move_info.get('power') or 'N/A'
+            move_accuracy = move_info.get('accuracy') or 'N/A'
+            move_effect = move_info.get('effect', 'N/A')
+
+            embed.add_field(name=f"(Level {level}) : {move_name.title().replace('-', ' ')}",
+                            value=f"`Power:` **{move_power}**\n`Accuracy:` **{move_accuracy}**\n> ```Effect: {move_effect[:300]}```",
+                            inline=True)
+
+        if not self.entries:
+            embed.description = "No level-up moves found."
+        version = (self.version_group or 'N/A').replace('-', ' ').title()
+        embed.set_footer(text=f"{version} — Page {self.page + 1}/{self.max_pages}")
+        return embed
+
+
+class Moveset_Button(discord.ui.Button):
+    def __init__(self, label, direction):
+        super().__init__(label=label, style=discord.ButtonStyle.gray)
+        self.direction = direction
+
+    async def callback(self, interaction: discord.Interaction):
+        view = self.view
+        try:
+            view.page += -1 if self.direction == "previous" else 1
+            view.page = min(max(view.page, 0), view.max_pages - 1)
+            view.update_buttons()
+            embed = view.build_embed()
+        except (KeyError, IndexError, TypeError) as e:
+            logger.error(f"Could not page the moveset: {e}")
+            await interaction.response.send_message(embed=pokemon_error_embed("Move data is incomplete or unavailable."), ephemeral=True)
+            return
+        await interaction.response.edit_message(embed=embed, view=view)
+
+
+class Moveset_Select(discord.ui.Select):
+    def __init__(self, groups):
+        options = [discord.SelectOption(label=group.replace('-', ' ').title(), value=group) for group in groups]
+        super().__init__(placeholder="Game", options=options, row=1)
+
+    async def callback(self, interaction: discord.Interaction):
+        view = self.view
+        try:
+            view.set_version_group(self.values[0])
+            embed = view.build_embed()
+        except (KeyError, IndexError, TypeError) as e:
+            logger.error(f"Could not switch the moveset to {self.values[0]}: {e}")
+            await interaction.response.send_message(embed=pokemon_error_embed("Move data is incomplete or unavailable."), ephemeral=True)
+            return
+        await interaction.response.edit_message(embed=embed, view=view)
 
 
 def setup(bot):
@@ -13,17 +13,23 @@ import discord
 import random
 import logging
 from io import BytesIO
-from concurrent.futures import ThreadPoolExecutor
 from PIL import Image, ImageDraw, ImageFont, ImageSequence
 
 
 # Third-Party Library Imports
 import json
 import numpy as np
-import motor.motor_asyncio
-from pymongo.errors import PyMongoError
+from pymongo import UpdateOne, ReturnDocument
+from pymongo.errors import PyMongoError, DuplicateKeyError
 
 # Project-Specific Imports
+from Data.assets import assets
+from Data.render import render_service
+from Data.channel_activity import channel_activity
+from Data.database import database
+from Data.guild_settings import guild_settings
+from Data.quest_index import active_quests
+from Data.quest_members import MEMBERS_COLLECTION, COUNTERS_COLLECTION, counter_id, ensure_member_indexes, member_filter, migrate_members
 from Data.const import Quest_Progress, error_custom_embed, primary_color, ShopEmbed,QuestEmbed, Quest_Prompt, Quest_Completed_Embed, AnyaImages, TutorialMission
 from Imports.discord_imports import *
 from Imports.log_imports import *
@@ -104,22 +110,11 @@ class Quest(commands.Cog):
             if quests:
                 view = Quest_View(self.bot, quests, ctx)
                 embeds = await view.generate_messages()
-                # Initialize the ImageGenerator class
-                image_generator = ImageGenerator(ctx, text='Here are the quests you need to complete. Each quest has a specific objective, progress, and reward. Click on the location link to navigate to the respective channel where the quest can be completed.')  # Pass the quest message as text to the image generator
-                # Generate the image
-                img = image_generator.create_image()
-                # Save the image as a BytesIO object to send as an embed
-                img_bytes = BytesIO()
-                img.save(img_bytes, format='PNG')
-                img_bytes.seek(0)  # Reset the pointer to the start of the BytesIO object
-
-                image_generator = ImageGenerator(
-                    ctx=ctx, 
-                    text='Here are the quests you need to complete. Each quest has a specific objective, progress, and reward. Click on the location link to navigate to the respective channel where the quest can be completed.'
-                )
-
-                image_generator.save_image(file_path="Data/Images/generated_image.png")
-                file = discord.File("Data/Images/generated_image.png", filename='image.png')
+                # Render the banner on the render pool, the event loop only awaits the PNG bytes
+                text = 'Here are the quests you need to complete. Each quest has a specific objective, progress, and reward. Click on the location link to navigate to the respective channel where the quest can be completed.'
+                # The banner is the same for everyone, so after the first render it comes from the PNG cache
+                image_bytes = await render_service.render(ImageGenerator.render_image, ctx, text, cache_key=ImageGenerator.cache_key(text))
+                file = discord.File(BytesIO(image_bytes), filename='image.png')
     
                 # Set the image in the embed using the attachment URL
                 embeds.set_image(url=f"attachment://image.png")
@@ -214,15 +209,12 @@ class Quest(commands.Cog):
         user_id = str(ctx.author.id)
 
         # Fetch the user's inventory from the database
-        db = self.quest_data.mongoConnect[self.quest_data.DB_NAME]
-        server_collection = db['Servers']
-
-        user_data = await server_collection.find_one(
-            {'guild_id': guild_id, f'members.{user_id}': {'$exists': True}},
-            {f'members.{user_id}.inventory.tool'}
+        user_data = await self.quest_data.members.find_one(
+            member_filter(guild_id, user_id),
+            {'inventory.tool': 1}
         )
 
-        inventory = user_data.get('members', {}).get(user_id, {}).get('inventory', {}).get('tool', {})
+        inventory = (user_data or {}).get('inventory', {}).get('tool', {})
 
         if not inventory:
             await ctx.reply(
@@ -437,8 +429,7 @@ class Quest_View(View):
                 # Skip the quest and move to the next available one
                 continue
 
-        # If you want to set an image, here’s how you can handle it (optional):
-        file = discord.File("Data/Images/generated_image.png", filename='image.png')
+        # The banner is attached by the caller from memory
         embed.set_image(url=f"attachment://image.png")
 
         return embed
@@ -711,14 +702,15 @@ class Quest_Button(discord.ui.View):
             
             
 class ImageGenerator:
+    # Configurable values
+    font_path_header = "Data/commands/help/menu/initial/style/assets/font/valentine.ttf"
+    font_path_base = "Data/commands/help/menu/initial/style/assets/font/dizhitl-italic.ttf"
+    character_path = "Data/commands/help/menu/initial/style/assets/character_quest.png"
+    background_path = "Data/commands/help/menu/initial/style/assets/background.png"
+    header_text = 'Anya Quest!'
+
     def __init__(self, ctx, text):
         """Initialize the ImageGenerator with cog-specific data and load resources."""
-        # Configurable values
-        self.font_path_header = "Data/commands/help/menu/initial/style/assets/font/valentine.ttf"
-        self.font_path_base = "Data/commands/help/menu/initial/style/assets/font/dizhitl-italic.ttf"
-        self.character_path = "Data/commands/help/menu/initial/style/assets/character_quest.png"
-        self.background_path = "Data/commands/help/menu/initial/style/assets/background.png"
- 
         # Font sizes
         self.header_font_size = 35
         self.base_font_size = 11
@@ -731,7 +723,6 @@ class ImageGenerator:
         self.character_scale = 0.4
 
         # Text content
-        self.header_text = 'Anya Quest!'
         self.description_text = text
 
         # Layout positions
@@ -748,57 +739,16 @@ class ImageGenerator:
 
         # Load fonts and images
         self._load_resources()
-        self._apply_color_replacements()
 
     def _load_resources(self):
-        """Load the fonts and images required for generating the image."""
-        try:
-            self.header_font = ImageFont.truetype(self.font_path_header, self.header_font_size)
-        except Exception:
-            self.header_font = ImageFont.load_default()
-
-        try:
-            self.base_font = ImageFont.truetype(self.font_path_base, self.base_font_size)
-        except Exception:
-            self.base_font = ImageFont.load_default()
-
-        self.character = Image.open(self.character_path).convert("RGBA")
-        self.background = Image.open(self.background_path).convert("RGBA")
-
-        # Resize character image
-        self._resize_character()
-
-    def _resize_character(self):
-        """Resize the character image to a percentage of its original size."""
-        new_width = round(self.character.width * self.character_scale)
-        new_height = round(self.character.height * self.character_scale)
-        self.character = self.character.resize((new_width, new_height))
-
-    def _apply_color_replacements(self):
-        """Replace specific colors in the background image."""
-        bg_array = np.array(self.background).copy()
-
-        for old_hex, replacement in self.color_replacements_map.items():
-            old_color = tuple(int(old_hex[i:i+2], 16) for i in (0, 2, 4))
-            lower_bound = np.array(old_color) - 10
-            upper_bound = np.array(old_color) + 10
-
-            if replacement == 'transparent':  # Replace with transparency
-                mask = cv2.inRange(bg_array[:, :, :3], lower_bound, upper_bound)
-                bg_array[mask > 0] = [0, 0, 0, 0]
-            elif replacement.startswith('http'):  # Replace with image from URL
-                replacement_img = self._download_image(replacement)
-                replacement_img = replacement_img.resize((self.background.width, self.background.height))
-                replacement_array = np.array(replacement_img)[:, :, :3]
-
-                mask = cv2.inRange(bg_array[:, :, :3], lower_bound, upper_bound)
-                bg_array[mask > 0, :3] = replacement_array[mask > 0]
-            else:  # Replace with solid color
-                replacement_color = tuple(int(replacement[i:i+2], 16) for i in (1, 3, 5))
-                mask = cv2.inRange(bg_array[:, :, :3], lower_bound, upper_bound)
-                bg_array[mask > 0, :3] = replacement_color
-
-        self.background = Image.fromarray(bg_array, 'RGBA')
+        """Fetch the fonts and images from the shared asset cache, decoded and scaled once per process."""
+        self.header_font = assets.font(self.font_path_header, self.header_font_size)
+        self.base_font = assets.font(self.font_path_base, self.base_font_size)
+        self.character = assets.image(self.character_path, scale=self.character_scale)
+        self.background = assets.image(self.background_path, replacements=self.color_replacements_map)
+        # Background with the character already pasted, only the text is drawn per image
+        self.base_layer = assets.composite(self.background_path, self.character_path, self.character_scale,
+                                           self.character_pos, self.color_replacements_map)
 
     def _wrap_text(self, text, max_width):
         """Wrap text to fit within the specified width."""
@@ -833,22 +783,10 @@ class ImageGenerator:
         wrapped_text = self._wrap_text(self.description_text, text_box_width)
         draw.multiline_text((text_x + self.text_box_margin, text_y), wrapped_text, font=self.base_font, fill=self.base_font_color)
 
-    def _download_image(self, url):
-        """Download an image from a URL."""
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-            return Image.open(BytesIO(response.content)).convert("RGBA")
-        except Exception as e:
-            print(f"Error downloading image: {e}")
-            raise
-
     def create_image(self):
         """Generate the complete image with the background, character, and text."""
-        bg = self.background.copy()
+        bg = self.base_layer.copy()
         draw = ImageDraw.Draw(bg)
-        character_x, character_y = self.character_pos
-        bg.paste(self.character, (character_x, character_y), self.character)
 
         # Use the adjusted text_x with proper margin for wrapping
         text_x = self.character.width + self.text_x_offset - 45
@@ -858,6 +796,16 @@ class ImageGenerator:
 
         return bg
 
+    @classmethod
+    def cache_key(cls, text):
+        """Everything the image depends on, computed from the inputs alone; equal keys render equal PNGs."""
+        return (cls.__name__, cls.header_text, text, assets.signature(cls.font_path_header, cls.font_path_base, cls.character_path, cls.background_path))
+
+    @classmethod
+    def render_image(cls, ctx, text):
+        """Builds and draws the image in one call, so the asset loading runs on the render pool too."""
+        return cls(ctx, text).create_image()
+
     def save_image(self, file_path):
         """Save the generated image to the given file path."""
         img = self.create_image()
@@ -880,12 +828,30 @@ class Quest_Data(commands.Cog):
         self.DB_NAME = 'Quest'
         self.quest_content_file = 'Data/commands/quest/quest_content.txt'
 
-        # Initialize MongoDB connection
-        mongo_url = os.getenv('MONGO_URI')
+        # Shared client, views and commands creating their own Quest_Data no longer open a pool each
+        self.mongoConnect = database.client
+
+    @property
+    def members(self):
+        """One document per (guild, user) holding that member's quests, inventory and stella points."""
+        return self.mongoConnect[self.DB_NAME][MEMBERS_COLLECTION]
 
-        if not mongo_url:
-            raise ValueError("No MONGO_URI found in environment variables")
-        self.mongoConnect = motor.motor_asyncio.AsyncIOMotorClient(mongo_url)
+    async def cog_load(self):
+        db = self.mongoConnect[self.DB_NAME]
+        try:
+            await ensure_member_indexes(db)
+        except PyMongoError as e:
+            logger.error(f"Error occurred while creating member indexes: {e}")
+
+        # Members is only read from now on, so a deploy that skipped the one-off migration
+        # would show every user as having no quests; the migration is safe to rerun here
+        try:
+            if await db['Servers'].find_one({'members': {'$exists': True}}, {'_id': 1}):
+                logger.warning(f"Legacy Servers.members data found, migrating into {self.DB_NAME}.{MEMBERS_COLLECTION}")
+                guilds, members = await migrate_members(db)
+                logger.info(f"Migrated {members} members from {guilds} guilds")
+        except PyMongoError as e:
+            logger.error(f"Legacy member migration failed, run `python -m Data.quest_members`: {e}")
 
     async def handle_error(self, interaction, error, title):
         await error_custom_embed(self.bot, interaction, str(error), title=title)
@@ -898,47 +864,40 @@ class Quest_Data(commands.Cog):
     async def store_roles_for_guild(self, guild_id, role_ids):
         """Store or override the roles for the guild."""
         collection = self.mongoConnect[self.DB_NAME].roles
-        guild_data = await collection.find_one({"guild_id": guild_id})
-        
-        if guild_data:
-            # Update the existing roles
-            await collection.update_one(
-                {"guild_id": guild_id},
-                {"$set": {"roles": role_ids}}
-            )
-        else:
-            # Insert a new document for the guild if it doesn't exist
-            await collection.insert_one({"guild_id": guild_id, "roles": role_ids})
-    
+        guild_settings.invalidate(guild_id, 'roles')
+        await collection.update_one(
+            {"guild_id": guild_id},
+            {"$set": {"roles": role_ids}},
+            upsert=True
+        )
+        guild_settings.set(guild_id, 'roles', role_ids)
+
     async def get_roles_for_guild(self, guild_id):
         """Retrieve the stored roles for the guild."""
+        roles = guild_settings.get(guild_id, 'roles')
+        if roles is not guild_settings.MISSING:
+            return roles
         collection = self.mongoConnect[self.DB_NAME].roles
-        guild_data = await collection.find_one({"guild_id": guild_id})
-        if guild_data:
-            return guild_data['roles']
-        return []
+        guild_data = await collection.find_one({"guild_id": guild_id}, {"roles": 1})
+        return guild_settings.set(guild_id, 'roles', guild_data['roles'] if guild_data else [])
 
     async def get_user_inventory_count(self, guild_id: str, user_id: str, material_name: str) -> int:
      try:
-        db = self.mongoConnect[self.DB_NAME]
-        server_collection = db['Servers']
-        
         # Query to find the user's inventory entry
-        user_data = await server_collection.find_one(
-            {'guild_id': guild_id, f'members.{user_id}': {'$exists': True}},
-            {f'members.{user_id}.inventory.{material_name}': 1}
+        user_data = await self.members.find_one(
+            member_filter(guild_id, user_id),
+            {f'inventory.{material_name}': 1}
         )
-        
+
         if user_data:
             # Check if the material_name exists in the user's inventory
-            if 'inventory' in user_data['members'][user_id] and material_name in user_data['members'][user_id]['inventory']:
-                return user_data['members'][user_id]['inventory'].get(material_name, 0)
+            if material_name in user_data.get('inventory', {}):
+                return user_data['inventory'].get(material_name, 0)
             else:
                 # If the material_name does not exist, create a slot for it with default value 0
-                await server_collection.update_one(
-                    {'guild_id': guild_id},
-                    {'$set': {f'members.{user_id}.inventory.{material_name}': 0}},
-                    upsert=True
+                await self.members.update_one(
+                    member_filter(guild_id, user_id),
+                    {'$set': {f'inventory.{material_name}': 0}}
                 )
                 return 0
         else:
@@ -946,69 +905,59 @@ class Quest_Data(commands.Cog):
      except PyMongoError as e:
         logger.error(f"Error occurred while getting user inventory count: {e}")
         return 0
-    
+
     async def add_item_to_inventory(self, guild_id: str, user_id: str, material_name: str, quantity: int) -> None:
         try:
-            db = self.mongoConnect[self.DB_NAME]
-            server_collection = db['Servers']
-            await server_collection.update_one(
-                {'guild_id': guild_id, f'members.{user_id}': {'$exists': True}},
-                {'$inc': {f'members.{user_id}.inventory.{material_name}': quantity}},
+            await self.members.update_one(
+                member_filter(guild_id, user_id),
+                {'$inc': {f'inventory.{material_name}': quantity}},
                 upsert=True
             )
         except PyMongoError as e:
             logger.error(f"Error occurred while adding item to inventory: {e}")
             raise e
-        
+
     async def get_existing_tool_id(self, guild_id: str, user_id: str, tool_name: str) -> str:
         """Fetches the existing un_tool_id for the tool from the inventory."""
         try:
-            db = self.mongoConnect[self.DB_NAME]
-            server_collection = db['Servers']
-            user_data = await server_collection.find_one(
-                {'guild_id': guild_id, f'members.{user_id}': {'$exists': True}},
-                {f'members.{user_id}.inventory.tool.{tool_name}': 1}
+            user_data = await self.members.find_one(
+                member_filter(guild_id, user_id),
+                {f'inventory.tool.{tool_name}': 1}
             )
 
             # Check if the tool has an existing un_tool_id
-            tool_data = user_data.get('members', {}).get(user_id, {}).get('inventory', {}).get('tool', {}).get(tool_name, {})
+            tool_data = (user_data or {}).get('inventory', {}).get('tool', {}).get(tool_name, {})
             return tool_data.get('un_tool_id', None)
         except PyMongoError as e:
             logger.error(f"Error occurred while getting existing tool ID: {e}")
             return None
-            
+
     async def get_quantity(self, guild_id: str, user_id: str, material_name: str) -> int:
      """
      Retrieves the quantity of a specific material in a user's inventory.
      If the material does not exist, returns 0.
      """
      try:
-        db = self.mongoConnect[self.DB_NAME]
-        server_collection = db['Servers']
-
         # Fetch the user's inventory and get the quantity for the specific material
-        user_data = await server_collection.find_one(
-            {'guild_id': guild_id, f'members.{user_id}': {'$exists': True}},
-            {f'members.{user_id}.inventory.tool.{material_name}.quantity': 1}
+        user_data = await self.members.find_one(
+            member_filter(guild_id, user_id),
+            {f'inventory.tool.{material_name}.quantity': 1}
         )
 
         # Retrieve the quantity or default to 0 if not found
-        quantity = user_data.get('members', {}).get(user_id, {}).get('inventory', {}).get('tool', {}).get(material_name, {}).get('quantity', 0)
+        quantity = (user_data or {}).get('inventory', {}).get('tool', {}).get(material_name, {}).get('quantity', 0)
         return quantity
      except PyMongoError as e:
         logger.error(f"Error occurred while retrieving quantity for {material_name}: {e}")
         raise e
-     
+
     async def add_tool_to_inventory(self, guild_id: str, user_id: str, material_name: str, quantity: int) -> None:
      try:
-        db = self.mongoConnect[self.DB_NAME]
-        server_collection = db['Servers']
-
         # Increment the material quantity while ensuring the structure includes a `quantity` field
-        await server_collection.update_one(
-            {'guild_id': guild_id, f'members.{user_id}': {'$exists': True}},
+        await self.members.update_one(
+            member_filter(guild_id, user_id),
             {
-                '$inc': {f'members.{user_id}.inventory.tool.{material_name}.quantity': quantity}
+                '$inc': {f'inventory.tool.{material_name}.quantity': quantity}
             },
             upsert=True
         )
@@ -1020,41 +969,35 @@ class Quest_Data(commands.Cog):
 
     async def remove_tool_from_inventory(self, guild_id: str, user_id: str, tool_name: str) -> None:
      try:
-        db = self.mongoConnect[self.DB_NAME]
-        server_collection = db['Servers']
-
         # Fetch the current quantity of the tool in the user's inventory
         current_quantity = await self.get_quantity(guild_id, user_id, tool_name)
 
         if current_quantity > 0:
             # Decrease the quantity by 1
-            await server_collection.update_one(
-                {'guild_id': guild_id, f'members.{user_id}': {'$exists': True}},
-                {'$inc': {f'members.{user_id}.inventory.tool.{tool_name}.quantity': -1}},
+            await self.members.update_one(
+                member_filter(guild_id, user_id),
+                {'$inc': {f'inventory.tool.{tool_name}.quantity': -1}},
                 upsert=True
             )
         else:
             logger.warning(f"{user_id} does not have the tool `{tool_name}` in their inventory.")
-            await server_collection.update_one(
-                {'guild_id': guild_id, f'members.{user_id}': {'$exists': True}},
-                {'$set': {f'members.{user_id}.inventory.tool.{tool_name}.quantity': 0}},
+            await self.members.update_one(
+                member_filter(guild_id, user_id),
+                {'$set': {f'inventory.tool.{tool_name}.quantity': 0}},
                 upsert=True
             )
 
      except PyMongoError as e:
         logger.error(f"Error occurred while removing tool from inventory: {e}")
-        raise e 
-     
+        raise e
+
     async def create_un_tool_id(self, guild_id, user_id, tool):
      """Create a new unique tool ID for the user and tool."""
-    
+
      # Helper function to generate a short, 6-digit unique ID for the tool
      def generate_short_uuid():
         return ''.join(random.choices(string.digits, k=6) + 1000)  # Only digits now
 
-     db = self.mongoConnect[self.DB_NAME]
-     server_collection = db['Servers']
-
      try:
         # Generate a new 6-digit ID
         un_tool_id = generate_short_uuid()
@@ -1063,38 +1006,33 @@ class Quest_Data(commands.Cog):
         tool_data = {'un_tool_id': un_tool_id}
 
         # Use upsert to ensure the tool is added with the generated un_tool_id
-        result = await server_collection.update_one(
-            {'guild_id': guild_id, f'members.{user_id}': {'$exists': True}},
-            {'$set': {f'members.{user_id}.inventory.tool.{tool}': tool_data}},
+        result = await self.members.update_one(
+            member_filter(guild_id, user_id),
+            {'$set': {f'inventory.tool.{tool}': tool_data}},
             upsert=True  # Ensures the tool is inserted if missing
         )
 
         # Debugging info
         logger.debug(f"Generated new un_tool_id: {un_tool_id} for tool '{tool}'")
         logger.debug(f"Database update result: {result.raw_result}")
-        
+
         return un_tool_id
      except Exception as e:
         logger.error(f"Error in create_un_tool_id for tool '{tool}' (guild: {guild_id}, user: {user_id}): {e}")
         raise  # Re-raise the exception after logging it
 
-    
-     
     async def get_un_tool_id(self, guild_id, user_id, tool):
         """Fetch the unique tool ID for the user and tool."""
-        db = self.mongoConnect[self.DB_NAME]
-        server_collection = db['Servers']
-
         # Check if the tool exists in the user's inventory
-        user_tool_data = await server_collection.find_one(
-            {'guild_id': guild_id, f'members.{user_id}.inventory.tool.{tool}': {'$exists': True}},
-            {f'members.{user_id}.inventory.tool.{tool}': 1}
+        user_tool_data = await self.members.find_one(
+            dict(member_filter(guild_id, user_id), **{f'inventory.tool.{tool}': {'$exists': True}}),
+            {f'inventory.tool.{tool}': 1}
         )
 
         if user_tool_data:
             try:
                 # Access the tool data safely
-                tool_data = user_tool_data['members'][user_id]['inventory']['tool'].get(tool)
+                tool_data = user_tool_data['inventory']['tool'].get(tool)
 
                 if isinstance(tool_data, dict) and 'un_tool_id' in tool_data:
                     # Return the un_tool_id if it exists
@@ -1111,249 +1049,281 @@ class Quest_Data(commands.Cog):
             # If the tool does not exist in the user's inventory
             logger.error(f"Tool {tool} does not exist in the inventory.")
             return None
+
     async def remove_all_server_quests(self, guild_id: str) -> None:
      try:
-        db = self.mongoConnect[self.DB_NAME]
-        server_collection = db['Servers']
-
-        # Update documents where quests field is missing or not an array
-        await server_collection.update_many(
-            {
-                'guild_id': guild_id,
-                'members.quests': {'$exists': False}
-            },
-            {'$set': {'members.$.quests': []}}
-        )
-
         # Remove all quests for all users in the server
-        await server_collection.update_many(
+        await self.members.update_many(
             {'guild_id': guild_id},
-            {'$set': {'members.$[].quests': []}}
+            {'$set': {'quests': []}}
         )
+        active_quests.clear_guild(guild_id)
 
         logger.debug(f"All server quests removed for guild {guild_id}.")
      except PyMongoError as e:
         logger.error(f"Error occurred while removing all server quests: {e}")
         raise e
 
-    
     async def get_server_quest_count(self, guild_id: str) -> int:
         try:
-            db = self.mongoConnect[self.DB_NAME]
-            server_collection = db['Servers']
-            guild_data = await server_collection.find_one({'guild_id': guild_id})
-            if guild_data:
-                members_data = guild_data.get('members', {})
-                total_quests = sum(len(member.get('quests', [])) for member in members_data.values())
-                return total_quests
-            else:
-                return 0
+            # Summed on the server, only the total comes back
+            result = await self.members.aggregate([
+                {'$match': {'guild_id': guild_id}},
+                {'$group': {'_id': None, 'total': {'$sum': {'$size': {'$ifNull': ['$quests', []]}}}}}
+            ]).to_list(length=1)
+            return result[0]['total'] if result else 0
         except PyMongoError as e:
             logger.error(f"Error occurred while getting server quest count: {e}")
             return 0
 
     async def get_beginner_quests(self, guild_id: str) -> List[Dict[str, Union[str, int]]]:
         try:
-            db = self.mongoConnect[self.DB_NAME]
-            server_collection = db['Servers']
-            guild_data = await server_collection.find_one({'guild_id': guild_id})
-            if guild_data:
-                beginner_quests = []
-                members_data = guild_data.get('members', {})
-                for member_id, member_data in members_data.items():
-                    quests = member_data.get('quests', [])
-                    for quest in quests:
-                        if quest.get('progress', 0) == 0:
-                            beginner_quests.append({
-                                'action': quest.get('action', ''),
-                                'method': quest.get('method', ''),
-                                'content': quest.get('content', ''),
-                                'times': quest.get('times', 0)
-                            })
-                return beginner_quests
-            else:
-                return []
+            cursor = self.members.aggregate([
+                {'$match': {'guild_id': guild_id, 'quests.progress': 0}},
+                {'$unwind': '$quests'},
+                {'$match': {'quests.progress': 0}},
+                {'$project': {
+                    '_id': 0,
+                    'action': {'$ifNull': ['$quests.action', '']},
+                    'method': {'$ifNull': ['$quests.method', '']},
+                    'content': {'$ifNull': ['$quests.content', '']},
+                    'times': {'$ifNull': ['$quests.times', 0]}
+                }}
+            ])
+            return await cursor.to_list(length=None)
         except PyMongoError as e:
             logger.error(f"Error occurred while getting beginner quests: {e}")
             return []
+
     async def set_quest_limit(self, guild_id: str, limit: int) -> None:
         try:
             db = self.mongoConnect[self.DB_NAME]
             server_collection = db['Servers']
+            guild_settings.invalidate(guild_id, 'quest_limit')
             await server_collection.update_one(
                 {'guild_id': guild_id},
                 {'$set': {'quest_limit': limit}},
                 upsert=True
             )
+            guild_settings.set(guild_id, 'quest_limit', limit)
         except PyMongoError as e:
             logger.error(f"Error occurred while setting quest limit: {e}")
             raise e
 
     async def get_quest_limit(self, guild_id: str) -> int:
+        quest_limit = guild_settings.get(guild_id, 'quest_limit')
+        if quest_limit is not guild_settings.MISSING:
+            return quest_limit
         try:
             db = self.mongoConnect[self.DB_NAME]
             server_collection = db['Servers']
-            guild_doc = await server_collection.find_one({'guild_id': guild_id})
-            if guild_doc:
-                return guild_doc.get('quest_limit', 25)  # Default to 25 if limit is not found
-            else:
-                return 25  # Default limit if not set
+            guild_doc = await server_collection.find_one({'guild_id': guild_id}, {'quest_limit': 1})
+            # Default to 25 if no limit is set
+            return guild_settings.set(guild_id, 'quest_limit', (guild_doc or {}).get('quest_limit', 25))
         except PyMongoError as e:
             logger.error(f"Error occurred while getting quest limit: {e}")
             raise e
-            
+
     async def find_user_in_server(self, user_id: str, guild_id: str) -> bool:
      try:
-        db = self.mongoConnect[self.DB_NAME]
-        server_collection = db['Servers']
-        server_data = await server_collection.find_one({'guild_id': guild_id})
-        
-        if server_data:
-            members_data = server_data.get('members', {})
-            return user_id in members_data
-        else:
-            return False
+        member = await self.members.find_one(member_filter(guild_id, user_id), {'_id': 1})
+        return member is not None
      except PyMongoError as e:
         logger.error(f"Error occurred while finding user in server: {e}")
         return False
-    
+
     async def find_users_in_server(self, guild_id: str):
      try:
-        db = self.mongoConnect[self.DB_NAME]
-        server_collection = db['Servers']
-        
         # Log the query being made
         logger.debug(f"Querying for guild_id: {guild_id}")
-        
-        # Find the guild document by its ID
-        guild_document = await server_collection.find_one({'guild_id': str(guild_id)})
-        
-        if guild_document:
-            # Extract the members data from the guild document
-            members_data = guild_document.get('members', {})
-            users_in_server = list(members_data.keys())  # Extract user IDs
-            
-            # logger.debug(f"Found {len(users_in_server)} users in server {guild_id}.")
-            return users_in_server
-        else:
-            logger.debug(f"No guild found with ID {guild_id}.")
-            return []
+
+        cursor = self.members.find({'guild_id': str(guild_id)}, {'user_id': 1, '_id': 0})
+        users_in_server = [member['user_id'] async for member in cursor]
+
+        if not users_in_server:
+            logger.debug(f"No members found for guild {guild_id}.")
+        return users_in_server
      except PyMongoError as e:
         logger.error(f"Error occurred while finding users in server: {e}")
         return []
 
     async def find_users_with_quest(self, guild_id: str, quest_id: int):
      try:
-        db = self.mongoConnect[self.DB_NAME]
-        server_collection = db['Servers']
-        
         # Log the query being made
         logger.debug(f"Querying for guild_id: {guild_id} with quest_id: {quest_id}")
-        
-        # Find the guild document by its ID
-        guild_document = await server_collection.find_one({'guild_id': str(guild_id)})
-        
-        if guild_document:
-            # Extract the members data from the guild document
-            members_data = guild_document.get('members', {})
-            users_with_quest = []
-            
-            # Iterate through each user and their quests to find the specified quest
-            for user_id, user_data in members_data.items():
-                quests = user_data.get('quests', [])
-                if any(quest['quest_id'] == quest_id for quest in quests):
-                    users_with_quest.append(user_id)
-            
-            # logger.debug(f"Found {len(users_with_quest)} users with quest ID {quest_id} in guild {guild_id}.")
-            return users_with_quest
-        else:
-            logger.debug(f"No guild found with ID {guild_id}.")
-            return []
+
+        cursor = self.members.find(
+            {'guild_id': str(guild_id), 'quests.quest_id': quest_id},
+            {'user_id': 1, '_id': 0}
+        )
+        return [member['user_id'] async for member in cursor]
      except PyMongoError as e:
         logger.error(f"Error occurred while finding users with quest: {e}")
         return []
-    
+
     async def find_quests_by_user_and_server(self, user_id: str, guild_id: str, interaction=None):
         try:
             await self.validate_input(user_id=user_id, guild_id=guild_id)
-            db = self.mongoConnect[self.DB_NAME]
-            server_collection = db['Servers']
-            server_data = await server_collection.find_one({'guild_id': guild_id})
-            if server_data:
-                member_data = server_data.get('members', {}).get(user_id, {})
-                quests = member_data.get('quests', [])
-                # logger.debug(f"Found {len(quests)} quests for user {user_id} in guild {guild_id}.")
-                if  len(quests) == 0:
-                    return None
-                return quests
-                
-            else:
-                # logger.debug("No server data found.")
-                return []
+            member_data = await self.members.find_one(member_filter(guild_id, user_id), {'quests': 1, '_id': 0})
+            quests = (member_data or {}).get('quests', [])
+            if len(quests) == 0:
+                return None
+            return quests
         except PyMongoError as e:
             logger.error(f"Error occurred while finding quests: {e}")
             if interaction:
                 await self.handle_error(interaction, e, title="Quest Finding")
             return None
 
+    async def load_active_quests(self):
+        """Fills the in-memory active quest index from every member that has open quests."""
+        try:
+            cursor = self.members.find(
+                {'quests.0': {'$exists': True}},
+                {'guild_id': 1, 'user_id': 1, 'quests': 1, '_id': 0}
+            )
+            async for member in cursor:
+                active_quests.load(member['guild_id'], member['user_id'], member['quests'])
+            active_quests.ready = True
+            logger.info(f"Active quest index warmed with {len(active_quests)} quests.")
+        except PyMongoError as e:
+            logger.error(f"Error occurred while loading active quests: {e}")
+
     async def insert_quest(self, guild_id: str, user_id: str, quest_data: dict, interaction=None):
         try:
             quest_data['progress'] = 0  # Add progress field with default value 0
             await self.validate_input(**quest_data)
-            db = self.mongoConnect[self.DB_NAME]
-            server_collection = db['Servers']
-            
-            # Append the quest data to the appropriate spot
-            await server_collection.update_one(
-                {'guild_id': guild_id, f'members.{user_id}.quests': {'$not': {'$elemMatch': {'quest_id': quest_data['quest_id']}}}},
-                {'$push': {f'members.{user_id}.quests': quest_data}},
+
+            # Append the quest unless the member already has one with this ID
+            await self.members.update_one(
+                dict(member_filter(guild_id, user_id), **{'quests.quest_id': {'$ne': quest_data['quest_id']}}),
+                {'$push': {'quests': quest_data}},
                 upsert=True
             )
+            # Own copy per member, the same quest_data is reused across a guild-wide fan-out
+            active_quests.add(guild_id, user_id, dict(quest_data))
             logger.debug(f"Inserted quest data for user {user_id} in guild {guild_id}.")
+        except DuplicateKeyError:
+            # The upsert collided with the member's own document: the quest is already there
+            logger.debug(f"User {user_id} in guild {guild_id} already has quest {quest_data['quest_id']}.")
         except (ValueError, PyMongoError) as e:
             logger.error(f"Error occurred while inserting quest: {e}")
             if interaction:
                 await self.handle_error(interaction, e, title="Quest Insertion")
 
+    async def get_max_quest_id(self, guild_id: str) -> int:
+        """Highest quest ID any member of the guild holds, 0 if none."""
+        result = await self.members.aggregate([
+            {'$match': {'guild_id': str(guild_id), 'quests.0': {'$exists': True}}},
+            {'$group': {'_id': None, 'max_id': {'$max': {'$max': '$quests.quest_id'}}}}
+        ]).to_list(length=1)
+        return (result[0]['max_id'] or 0) if result else 0
+
+    async def next_quest_id(self, guild_id: str, floor: int = 0) -> int:
+        """
+        Allocates the next quest ID of a guild, above `floor` when given.
+
+        Guild-wide and personal quests share the guild's counter, so an ID is
+        never handed out twice within a guild. One atomic update on the
+        Counters collection sets seq = max(seq, floor) + 1; the first
+        allocation seeds the counter above every ID members already hold.
+        """
+        counters = self.mongoConnect[self.DB_NAME][COUNTERS_COLLECTION]
+        _id = counter_id(guild_id)
+
+        def bump(floor):
+            return [{'$set': {'seq': {'$add': [{'$max': [{'$ifNull': ['$seq', 0]}, floor]}, 1]}}}]
+
+        counter = await counters.find_one_and_update(
+            {'_id': _id}, bump(floor), return_document=ReturnDocument.AFTER
+        )
+        if counter is not None:
+            return counter['seq']
+
+        floor = max(floor, await self.get_max_quest_id(guild_id))
+        # The max in the update keeps racing first allocations distinct
+        seed = bump(floor)
+        for attempt in range(2):
+            try:
+                counter = await counters.find_one_and_update(
+                    {'_id': _id}, seed, upsert=True, return_document=ReturnDocument.AFTER
+                )
+                return counter['seq']
+            except DuplicateKeyError:
+                # Another allocation created the counter between our update and upsert
+                if attempt:
+                    raise
+
+    async def insert_quest_bulk(self, guild_id: str, user_ids: list, quest_data: dict, batch_size=1000, progress=None) -> int:
+        """
+        Gives one quest to many members with a bulk_write per `batch_size` members.
+
+        `progress`, if given, is awaited as progress(done, total) after every batch.
+        Returns how many members received the quest.
+        """
+        quest_data['progress'] = 0
+        await self.validate_input(**quest_data)
+        total = len(user_ids)
+        inserted = 0
+
+        for start in range(0, total, batch_size):
+            batch = user_ids[start:start + batch_size]
+            result = await self.members.bulk_write([
+                UpdateOne(
+                    dict(member_filter(guild_id, user_id), **{'quests.quest_id': {'$ne': quest_data['quest_id']}}),
+                    {'$push': {'quests': quest_data}}
+                )
+                for user_id in batch
+            ], ordered=False)
+            inserted += result.modified_count
+            holders = batch
+            if result.matched_count < len(batch):
+                # Some filters matched nothing (no Members document, or the quest was already there);
+                # index only members whose document really holds the quest
+                cursor = self.members.find(
+                    {'guild_id': str(guild_id), 'user_id': {'$in': [str(user_id) for user_id in batch]},
+                     'quests.quest_id': quest_data['quest_id']},
+                    {'user_id': 1, '_id': 0}
+                )
+                holders = [member['user_id'] async for member in cursor]
+            for user_id in holders:
+                active_quests.add(guild_id, user_id, dict(quest_data))
+
+            done = start + len(batch)
+            logger.debug(f"Quest {quest_data['quest_id']} assigned to {done}/{total} members in guild {guild_id}.")
+            if progress:
+                await progress(done, total)
+
+        return inserted
+
     async def get_latest_quest_id(self, guild_id: str, user_id: str, interaction=None) -> int:
         try:
-            db = self.mongoConnect[self.DB_NAME]
-            server_collection = db['Servers']
-            server_data = await server_collection.find_one({'guild_id': guild_id})
-            if server_data:
-                member_data = server_data.get('members', {}).get(user_id, {})
-                quests = member_data.get('quests', [])
-                latest_quest = max([quest.get('quest_id', 0) for quest in quests], default=0)
-                logger.debug(f"Latest quest ID for user {user_id} in guild {guild_id}: {latest_quest}.")
-                return latest_quest
-            else:
-                # logger.debug(f"No server data found for user {user_id} in guild {guild_id}.")
-                return 0
+            member_data = await self.members.find_one(member_filter(guild_id, user_id), {'quests.quest_id': 1, '_id': 0})
+            quests = (member_data or {}).get('quests', [])
+            latest_quest = max([quest.get('quest_id', 0) for quest in quests], default=0)
+            logger.debug(f"Latest quest ID for user {user_id} in guild {guild_id}: {latest_quest}.")
+            return latest_quest
         except PyMongoError as e:
             logger.error(f"Error occurred while getting latest quest ID: {e}")
             if interaction:
                 await self.handle_error(interaction, e, title="Latest Quest ID")
             return 0
-        
+
     async def store_server_quest(self, guild_id: str, quest_data: dict):
      try:
         db = self.mongoConnect[self.DB_NAME]
         server_collection = db['Servers']
         
-        # Find the server document by guild_id or create a new one if not exists
-        server_doc = await server_collection.find_one({'_id': guild_id})
-        if not server_doc:
-            server_doc = {'_id': guild_id, 'server_quest': []}
-        
-        # Assign a quest_id based on the current number of quests
-        quest_id = len(server_doc['server_quest']) + 1
-        quest_data['quest_id'] = quest_id
-        
-        # Append the quest data and update the document
-        server_doc['server_quest'].append(quest_data)
-        
-        # Update the document in MongoDB
-        await server_collection.update_one({'_id': guild_id}, {'$set': server_doc}, upsert=True)
+        # Quests created elsewhere already carry an ID from the guild counter
+        if 'quest_id' not in quest_data:
+            quest_data['quest_id'] = await self.next_quest_id(guild_id)
+
+        # Append the quest data to the server document, creating it if needed
+        await server_collection.update_one(
+            {'_id': guild_id},
+            {'$push': {'server_quest': dict(quest_data)}},
+            upsert=True
+        )
         
         logger.debug(f"Stored quest data for guild {guild_id}: {quest_data}")
         
@@ -1362,21 +1332,26 @@ class Quest_Data(commands.Cog):
         raise e
         
         
+    async def get_channels_for_guild(self, guild_id: str) -> list:
+        """The guild's redirect channel IDs, an empty list if none are set."""
+        channel_ids = guild_settings.get(guild_id, 'channels')
+        if channel_ids is not guild_settings.MISSING:
+            return channel_ids
+        db = self.mongoConnect[self.DB_NAME]
+        guild_data = await db['Servers'].find_one({'guild_id': guild_id}, {'channels': 1})
+        return guild_settings.set(guild_id, 'channels', (guild_data or {}).get('channels') or [])
+
     async def get_random_channel_for_guild(self, guild_id: str, fallback_channel=None):
         """
         Retrieve a random channel ID for the specified guild from the database.
         If no channels are found, return the fallback channel ID if provided.
         """
         try:
-            db = self.mongoConnect[self.DB_NAME]
-            server_collection = db['Servers']
-
-            # Fetch the channels for the guild from the database
-            guild_data = await server_collection.find_one({'guild_id': guild_id}, {'channels': 1})
+            # Fetch the channels for the guild, cached between redirect changes
+            channel_ids = await self.get_channels_for_guild(guild_id)
 
-            if guild_data and 'channels' in guild_data and guild_data['channels']:
+            if channel_ids:
                 # If channels are found, select a random one
-                channel_ids = guild_data['channels']
                 random_channel_id = random.choice(channel_ids)
                 logger.debug(f"Random channel ID selected: {random_channel_id} for guild {guild_id}")
                 return random_channel_id
@@ -1387,8 +1362,7 @@ class Quest_Data(commands.Cog):
         except PyMongoError as e:
             logger.error(f"Error occurred while retrieving random channel: {e}")
             return fallback_channel.id if fallback_channel else None    
-    
-    
+
     async def store_channels_for_guild(self, guild_id: str, channel_ids: list):
      """
      Store the provided list of channel IDs for the guild in the database, 
@@ -1397,6 +1371,7 @@ class Quest_Data(commands.Cog):
      try:
         db = self.mongoConnect[self.DB_NAME]
         server_collection = db['Servers']
+        guild_settings.invalidate(guild_id, 'channels')
         
         # Replace the document with the new channel IDs for the guild
         await server_collection.update_one(
@@ -1404,14 +1379,14 @@ class Quest_Data(commands.Cog):
             {'$set': {'channels': channel_ids}},  # This will replace the 'channels' field
             upsert=True
         )
+        guild_settings.set(guild_id, 'channels', channel_ids)
         
         logger.debug(f"Stored (overwritten) channels {channel_ids} for guild {guild_id}.")
         return True
      except PyMongoError as e:
         logger.error(f"Error occurred while storing channels: {e}")
         return False     
-    
-    
+
     async def server_quests(self, guild_id: str):
         try:
             db = self.mongoConnect[self.DB_NAME]
@@ -1427,18 +1402,17 @@ class Quest_Data(commands.Cog):
         except PyMongoError as e:
             logger.error(f"Error occurred while getting server quests: {e}")
             raise e
-    async def create_quest(self, guild_id: str, action: str, method: str, content: str, times: int, reward: int, interaction=None):
+    async def create_quest(self, guild_id: str, action: str, method: str, content: str, channel_id: int, times: int, reward: int, interaction=None, progress=None):
      try:
-        # Fetch a random channel for the guild, provide an interaction fallback
-        fallback_channel = discord.utils.get(interaction.guild.text_channels, name="general") if interaction else None
-        channel_id = await self.get_random_channel_for_guild(guild_id, fallback_channel=fallback_channel)
+        if not channel_id:
+            # Fetch a random channel for the guild, provide an interaction fallback
+            fallback_channel = discord.utils.get(interaction.guild.text_channels, name="general") if interaction else None
+            channel_id = await self.get_random_channel_for_guild(guild_id, fallback_channel=fallback_channel)
 
         if not channel_id:
             # Notify you or the user that no channels have been redirected for the guild
-            message = "No redirected channels found for this guild. Please use the command to set redirect channels first."
-            logger.error(message)
-            if interaction:
-                await interaction.send(message)
+            # The caller tells the user, the slash command in its deferred response
+            logger.error("No redirected channels found for this guild. Please use the command to set redirect channels first.")
             return  # Exit function, no channels to create the quest
         
         # Calculate reward as a random value between 4 and 20 times the `times` value
@@ -1457,29 +1431,25 @@ class Quest_Data(commands.Cog):
         # Validate the quest data
         await self.validate_input(**quest_data)
         
-        # Store the quest data in MongoDB
+        # Assign the quest ID and store the quest data in MongoDB
+        quest_id = await self.next_quest_id(guild_id)
+        quest_data['quest_id'] = quest_id
         await self.store_server_quest(guild_id, quest_data)
-
-        # Increment and assign the quest ID
-        quest_count = await self.get_server_quest_count(guild_id)
-        quest_data['quest_id'] = quest_count + 1
         
         # Insert the quest for each user in the server
         users_in_server = await self.find_users_in_server(guild_id)
         if not users_in_server:
             raise ValueError("No users found in the server.")
 
-        for user_id in users_in_server:
-            await self.insert_quest(guild_id, user_id, quest_data, interaction)
+        await self.insert_quest_bulk(guild_id, users_in_server, quest_data, progress=progress)
 
         logger.debug(f"Created quest for guild {guild_id} with action {action} and content {content}.")
         
-        return quest_count + 1  # Return the incremented quest count
+        return quest_id
 
      except (ValueError, PyMongoError) as e:
+        # Re-raised for the caller to report, it owns the (deferred) interaction response
         logger.error(f"Error occurred while creating quest: {e}")
-        if interaction:
-            await self.handle_error(interaction, e, title="Quest Creation")
         raise e
 
     async def create_member_quest(self, guild_id: str, user_id: str, action: str, method: str, content: str, times: int, interaction=None):
@@ -1509,7 +1479,7 @@ class Quest_Data(commands.Cog):
             if not user_exists:
                 raise ValueError("User not found in the server.")
 
-            quest_data['quest_id'] = quest_count + 1  # Set the quest_id to be the next number
+            quest_data['quest_id'] = await self.next_quest_id(guild_id)
             await self.insert_quest(guild_id, user_id, quest_data, interaction)
 
             logger.debug(f"Created member quest for user {user_id} in guild {guild_id} with action {action} and content {content}.")
@@ -1551,51 +1521,22 @@ class Quest_Data(commands.Cog):
      logger.debug(f"Selected emoji: {emoji}")
      return str(emoji)
     
-    async def get_most_active_channel(self, guild_id, threshold=5, message_limit=100, fallback_channel_id=None):
+    async def get_most_active_channel(self, guild_id, threshold=5, fallback_channel_id=None):
+     """
+     Picks one of the `threshold` busiest public text channels of the last half hour,
+     from the in-memory activity tracker, without calling the Discord API.
+     """
      try:
-        logger.debug('Entering get_most_active_channel function')
         guild = self.bot.get_guild(int(guild_id))
-        
+
         if guild:
-            logger.debug(f"Guild found: {guild.name} (ID: {guild_id})")
-            channel_activity = {}
+            open_channels = {
+                channel.id for channel in guild.text_channels
+                if channel.permissions_for(guild.default_role).send_messages
+            }
 
-            # Executor for concurrent task execution
-            with ThreadPoolExecutor() as executor:
-                loop = asyncio.get_event_loop()
-                
-                async def count_messages(channel):
-                    try:
-                        message_count = 0
-                        member_set = set()
-                        async for message in channel.history(limit=message_limit):
-                            message_count += 1
-                            if not message.author.bot:
-                                member_set.add(message.author.id)
-                        return channel.id, message_count, len(member_set)
-                    except Exception as e:
-                        logger.error(f"Error while processing channel {channel.name}: {e}")
-                        return None
-
-                # List of tasks for concurrent execution
-                tasks = [
-                    loop.run_in_executor(executor, count_messages, channel)
-                    for channel in guild.text_channels
-                    if channel.permissions_for(guild.default_role).send_messages
-                ]
-                
-                # Gather all results
-                results = await asyncio.gather(*tasks)
-
-                # Process the results
-                for result in results:
-                    if result:
-                        channel_id, message_count, member_count = result
-                        channel_activity[channel_id] = (message_count, member_count)
-                        logger.debug(f"Processed channel {channel_id}: {message_count} messages, {member_count} members")
-
-            # Sort channels by member count and message count
-            sorted_channels = sorted(channel_activity.items(), key=lambda x: (x[1][1], x[1][0]), reverse=True)
+            # Sorted by member count and message count
+            sorted_channels = channel_activity.ranked(guild_id, channel_ids=open_channels)
             if sorted_channels:
                 logger.debug(f"Sorted channels by activity: {sorted_channels}")
                 if len(sorted_channels) > threshold:
@@ -1622,21 +1563,18 @@ class Quest_Data(commands.Cog):
     async def insert_quest_existing_path(self, guild_id: str, user_id: str, quest_data: dict, interaction=None):
      try:
         await self.validate_input(**quest_data)
-        db = self.mongoConnect[self.DB_NAME]
-        server_collection = db['Servers']
 
-        # Check if the user exists in the server
-        server_data = await server_collection.find_one({'guild_id': guild_id, f'members.{user_id}': {'$exists': True}})
-        
-        if not server_data:
+        # Append the quest data to the user's quest list, only if the member exists
+        result = await self.members.update_one(
+            dict(member_filter(guild_id, user_id), **{'quests.quest_id': {'$ne': quest_data['quest_id']}}),
+            {'$push': {'quests': quest_data}}
+        )
+
+        if result.matched_count == 0:
             logger.debug(f"User ID {user_id} does not exist in guild {guild_id}.")
             return False
 
-        # Append the quest data to the user's quest list
-        await server_collection.update_one(
-            {'guild_id': guild_id, f'members.{user_id}.quests': {'$not': {'$elemMatch': {'quest_id': quest_data['quest_id']}}}},
-            {'$push': {f'members.{user_id}.quests': quest_data}}
-        )
+        active_quests.add(guild_id, user_id, dict(quest_data))
         logger.debug(f"Inserted quest data for user {user_id} in guild {guild_id}.")
         return True
      except (ValueError, PyMongoError) as e:
@@ -1644,7 +1582,7 @@ class Quest_Data(commands.Cog):
         if interaction:
             await self.handle_error(interaction, e, title="Quest Insertion")
         return False
-    
+
     async def add_new_quest(self, guild_id, message_author, action='send', method=None, chance=50):
      logger.debug(f"Attempting to add new quest for guild_id: {guild_id}, message_author: {message_author}, action: {action}, method: {method}, chance: {chance}")
      try:
@@ -1706,11 +1644,9 @@ class Quest_Data(commands.Cog):
 
         logger.debug(f"Generated quest content: {content}")
 
-        # Fetch the latest quest ID for the user in the guild
-        latest_quest_id = await self.get_latest_quest_id(guild_id, user_id)
-
-        # If latest_quest_id is None, set new_quest_id to 1
-        new_quest_id = 1 if latest_quest_id is None else latest_quest_id + 1
+        # Allocate from the guild counter, above any ID the member already holds
+        floor = max((quest.get('quest_id', 0) for quest in existing_quests), default=0)
+        new_quest_id = await self.next_quest_id(guild_id, floor)
 
         # Define the new quest data
         quest_data = {
@@ -1743,26 +1679,14 @@ class Quest_Data(commands.Cog):
         user_id = str(message_author.id)
 
         # Fetch all quests for the user in the specified guild
-        db = self.mongoConnect[self.DB_NAME]
-        server_collection = db['Servers']
-
-        # Find the guild document by guild_id
-        guild_document = await server_collection.find_one({'guild_id': str(guild_id)})
-
-        if not guild_document:
-            logger.debug(f"No guild found with ID {guild_id}.")
-            return False  # No guild data found
-
-        # Extract the members data
-        members_data = guild_document.get('members', {})
+        member_data = await self.members.find_one(member_filter(guild_id, user_id), {'quests.quest_id': 1})
 
         # Check if the user exists in the members data
-        if user_id not in members_data:
+        if not member_data:
             logger.debug(f"User ID {user_id} not found in the guild {guild_id}.")
             return False  # No quests to delete if user does not exist
 
-        user_data = members_data[user_id]
-        quests = user_data.get('quests', [])
+        quests = member_data.get('quests', [])
 
         if not quests:
             logger.debug("No quests found for the user. Nothing to delete.")
@@ -1772,7 +1696,7 @@ class Quest_Data(commands.Cog):
         for quest in quests:
             quest_id = quest.get('quest_id')
             deletion_success = await self.delete_quest(guild_id, quest_id, message_author)
-            
+
             if deletion_success:
                 logger.debug(f"Deleted quest_id: {quest_id} for user_id: {user_id} in guild_id: {guild_id}")
             else:
@@ -1784,197 +1708,136 @@ class Quest_Data(commands.Cog):
      except Exception as e:
         logger.error(f"Error occurred while deleting all quests: {e}")
         return False
-    
+
     async def add_user_to_server(self, user_id: str, guild_id: str):
         try:
-            db = self.mongoConnect[self.DB_NAME]
-            server_collection = db['Servers']
-            server_data = await server_collection.find_one({'guild_id': guild_id})
-            if not server_data:
-                server_data = {'guild_id': guild_id, 'members': {}}
-
-            members_data = server_data.get('members', {})
-            members_data[user_id] = {'quests': []}
-
-            await server_collection.update_one(
-                {'guild_id': guild_id},
-                {'$set': {'members': members_data}},
+            await self.members.update_one(
+                member_filter(guild_id, user_id),
+                {'$set': {'quests': []}},
                 upsert=True
             )
+            active_quests.clear_user(guild_id, user_id)
         except PyMongoError as e:
             logger.error(f"Error occurred while adding user to server: {e}")
 
-    
     async def delete_quest(self, guild_id: str, quest_id: int, interaction=None):
      try:
-        db = self.mongoConnect[self.DB_NAME]
-        server_collection = db['Servers']
-
         # Log the query being made
         logger.debug(f"Querying for guild_id: {guild_id} with quest_id: {quest_id}")
 
-        # Find the guild document by its ID
-        guild_document = await server_collection.find_one({'guild_id': str(guild_id)})
-
-        if not guild_document:
-            logger.debug(f"No guild found with ID {guild_id}.")
-            return
-
-        # Extract the members data from the guild document
-        members_data = guild_document.get('members', {})
-
-        # Loop through each member
-        for member_id, member_data in members_data.items():
-            # Extract quests for the current member
-            quests = member_data.get('quests', [])
-
-            # Log the current quests for the member
-            logger.debug(f"Current quests for user {member_id}: {quests}")
-
-            # Check if any quest matches the specified quest ID
-            if any(quest.get('quest_id') == quest_id for quest in quests):
-                # logger.debug(f"Found quest with ID {quest_id} for user {member_id} in guild {guild_id}.")
-                
-                # Remove the quests that match the quest_id
-                new_quests = [quest for quest in quests if quest.get('quest_id') != quest_id]
-
-                # Update the guild document with the modified member data
-                result = await server_collection.update_one(
-                    {'guild_id': str(guild_id)},
-                    {'$set': {f'members.{member_id}.quests': new_quests}}
-                )
+        # Pull the quest from every member holding it
+        result = await self.members.update_many(
+            {'guild_id': str(guild_id), 'quests.quest_id': quest_id},
+            {'$pull': {'quests': {'quest_id': quest_id}}}
+        )
+        active_quests.remove_quest(guild_id, quest_id)
 
-                if result.modified_count > 0:
-                    logger.debug(f"Deleted quest with ID {quest_id} for user {member_id} in guild {guild_id}.")
-                else:
-                    logger.debug(f"Failed to delete quest with ID {quest_id} for user {member_id} in guild {guild_id}.")
-            else:
-                logger.debug(f"No quest with ID {quest_id} found for user {member_id} in guild {guild_id} to delete.")
+        if result.modified_count > 0:
+            logger.debug(f"Deleted quest with ID {quest_id} for {result.modified_count} members in guild {guild_id}.")
+        else:
+            logger.debug(f"No quest with ID {quest_id} found in guild {guild_id} to delete.")
+        return result.modified_count
 
      except PyMongoError as e:
         logger.error(f"Error occurred while deleting quest: {e}")
         if interaction:
             await self.handle_error(interaction, e, title="Quest Deletion")
-   
+
     async def delete_quest_for_user(self, guild_id: str, user_id: str, quest_id: int, interaction=None):
      try:
-        db = self.mongoConnect[self.DB_NAME]
-        server_collection = db['Servers']
-
         # Log the query being made
         logger.debug(f"Querying for guild_id: {guild_id} with quest_id: {quest_id}")
 
-        # Find the guild document by its ID
-        guild_document = await server_collection.find_one({'guild_id': str(guild_id)})
-
-        if not guild_document:
-            logger.debug(f"No guild found with ID {guild_id}.")
-            return
-
-        # Extract the members data from the guild document
-        members_data = guild_document.get('members', {})
-
-        # Check if the specified user exists in the guild
-        if user_id not in members_data:
-            logger.debug(f"No user found with ID {user_id} in guild {guild_id}.")
-            return
-
-        # Extract quests for the specified user
-        user_quests = members_data[user_id].get('quests', [])
-
-        # Loop through the user's quests
-        for quest in user_quests:
-            if quest.get('quest_id') == quest_id:
-                user_quests.remove(quest)
-                logger.debug(f"Deleted quest with ID {quest_id} for user {user_id} in guild {guild_id}.")
-                break  # No need to continue searching once the quest is deleted
-
-        # Update the guild document with the modified member data
-        await server_collection.update_one(
-            {'guild_id': guild_id},
-            {'$set': {f'members.{user_id}.quests': user_quests}}
+        result = await self.members.update_one(
+            member_filter(guild_id, user_id),
+            {'$pull': {'quests': {'quest_id': quest_id}}}
         )
+        active_quests.remove(guild_id, user_id, quest_id)
+
+        if result.modified_count > 0:
+            logger.debug(f"Deleted quest with ID {quest_id} for user {user_id} in guild {guild_id}.")
+        else:
+            logger.debug(f"No quest with ID {quest_id} found for user {user_id} in guild {guild_id}.")
 
      except PyMongoError as e:
         logger.error(f"Error occurred while deleting quest for user: {e}")
         if interaction:
             await self.handle_error(interaction, e, title="Quest Deletion")
-    
+
+    async def complete_quest_for_user(self, guild_id: str, user_id: str, quest_id: int, reward: int):
+        """
+        Pulls a quest from the member and credits its reward in one atomic update.
+
+        Returns the new stella points balance, or None if the member no longer
+        had the quest (already completed or deleted), in which case nothing is credited.
+        """
+        try:
+            member = await self.members.find_one_and_update(
+                dict(member_filter(guild_id, user_id), **{'quests.quest_id': quest_id}),
+                {
+                    '$pull': {'quests': {'quest_id': quest_id}},
+                    '$inc': {'stella_points': reward}
+                },
+                projection={'stella_points': 1, '_id': 0},
+                return_document=ReturnDocument.AFTER
+            )
+            active_quests.remove(guild_id, user_id, quest_id)
+
+            if member is None:
+                logger.debug(f"Quest {quest_id} was already gone for user {user_id} in guild {guild_id}.")
+                return None
+            logger.debug(f"Quest {quest_id} completed for user {user_id} in guild {guild_id}, reward {reward}.")
+            return member['stella_points']
+        except PyMongoError as e:
+            logger.error(f"Error occurred while completing quest: {e}")
+            raise e
+
     async def update_quest_progress(self, guild_id: str, user_id: str, quest_id: int, progress: int):
         try:
-            db = self.mongoConnect[self.DB_NAME]
-            server_collection = db['Servers']
-            
             # Update the progress of the specified quest for the user
-            await server_collection.update_one(
-                {'guild_id': guild_id, f'members.{user_id}.quests.quest_id': quest_id},
-                {'$set': {f'members.{user_id}.quests.$.progress': progress}}
+            await self.members.update_one(
+                dict(member_filter(guild_id, user_id), **{'quests.quest_id': quest_id}),
+                {'$set': {'quests.$.progress': progress}}
             )
+            active_quests.set_progress(guild_id, user_id, quest_id, progress)
 
             logger.debug(f"Quest {quest_id} progress updated for user {user_id} in guild {guild_id}.")
         except PyMongoError as e:
             logger.error(f"Error occurred while updating quest progress: {e}")
             raise e
-            
+
     async def get_balance(self, user_id: str, guild_id: str):
         try:
-            db = self.mongoConnect[self.DB_NAME]
-            server_collection = db['Servers']
-
-            user_balance_key = f"members.{user_id}.stella_points"
-
-            user_data = await server_collection.find_one(
-                {'guild_id': guild_id},
-                {user_balance_key: 1, '_id': 0}
+            user_data = await self.members.find_one(
+                member_filter(guild_id, user_id),
+                {'stella_points': 1, '_id': 0}
             )
 
-            balance = user_data.get('members', {}).get(user_id, {}).get('stella_points', 0)
+            balance = (user_data or {}).get('stella_points', 0)
             return balance
         except PyMongoError as e:
             logger.error(f"Error occurred while getting balance: {e}")
             return 0
-        
+
     async def add_balance(self, user_id: str, guild_id: str, amount: int):
         try:
-            db = self.mongoConnect[self.DB_NAME]
-            server_collection = db['Servers']
-
-            user_balance_key = f"members.{user_id}.stella_points"
-
-            await server_collection.update_one(
-                {'guild_id': guild_id},
-                {
-                    '$inc': {user_balance_key: amount},
-                    '$setOnInsert': {
-                        'members.{user_id}.stella_points': 0,
-                    }
-                },
+            await self.members.update_one(
+                member_filter(guild_id, user_id),
+                {'$inc': {'stella_points': amount}},
                 upsert=True
             )
         except PyMongoError as e:
             logger.error(f"Error occurred while adding balance: {e}")
 
-
-
     async def initialize_balance(self, user_id: str, guild_id: str):
         try:
-            db = self.mongoConnect[self.DB_NAME]
-            server_collection = db['Servers']
-
-            user_balance_key = f"members.{user_id}.stella_points"
-
-            await server_collection.update_one(
-                {'guild_id': guild_id},
-                {
-                    '$setOnInsert': {
-                        user_balance_key: 0,
-                    }
-                },
-                upsert=True
+            await self.members.update_one(
+                dict(member_filter(guild_id, user_id), stella_points={'$exists': False}),
+                {'$set': {'stella_points': 0}}
             )
         except PyMongoError as e:
             logger.error(f"Error occurred while initializing balance: {e}")
-            
+
 class Quest_Slash(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -2028,24 +1891,40 @@ class Quest_Slash(commands.Cog):
             guild_id = str(interaction.guild_id)
             user_id = str(interaction.user.id)
             user = interaction.user
-            
+
+            # Handing the quest to every member can take several batches, answer before the token expires
+            await interaction.response.defer(thinking=True)
+
+            async def report_progress(done, total):
+                try:
+                    await interaction.edit_original_response(content=f"Assigning the quest... {done}/{total} members")
+                except discord.HTTPException as e:
+                    logger.warning(f"Could not update quest creation progress: {e}")
+
             # Create the quest
-            quest_id = await self.quest_data.create_quest(guild_id, action.value, method.value, content, channel.id, times, 0, interaction)
+            quest_id = await self.quest_data.create_quest(guild_id, action.value, method.value, content, channel.id, times, 0, interaction, progress=report_progress)
             if quest_id is not None:
                 # Create the quest embed
                 embed = await QuestEmbed.create_quest_embed(self.bot,"Created", quest_id, action.value, method.value, channel, times=times, content=content,user=user)
                 
-                # Send the embed
-                await interaction.response.send_message(embed=embed)
+                # Replace the progress text with the result
+                await interaction.edit_original_response(content=None, embed=embed)
                 logger.debug("Quest creation successful.")
             else:
-                await interaction.response.send_message("Try doing `...quest`", ephemeral=True)
+                await interaction.edit_original_response(
+                    content="No redirected channels found for this guild. Please use the command to set redirect channels first."
+                )
                 logger.debug("Failed to create the quest.")
                 
         except Exception as e:
             logger.error(f"An error occurred: {e}")
             traceback.print_exc()
-            await error_custom_embed(self.bot, interaction, e, title="Quest Creation")
+            if interaction.response.is_done():
+                # Deferred: the error replaces the progress text instead of arriving as a second message
+                error_embed = discord.Embed(title="Quest Creation", description=f"```bash\n{e}```", color=discord.Color.red())
+                await interaction.edit_original_response(content=None, embed=error_embed)
+            else:
+                await error_custom_embed(self.bot, interaction, e, title="Quest Creation")
 
     @quest_group.command(
         name="delete",
@@ -2056,27 +1935,13 @@ class Quest_Slash(commands.Cog):
      interaction: discord.Interaction,
      quest_id: int) -> None:
      try:
-        guild_id = interaction.guild.id
-        
-        # Find all users in the guild
-        users_in_guild = await self.quest_data.find_users_in_server(guild_id)
-        
-        if not users_in_guild:
-            await interaction.response.send_message("No users found in the server.", ephemeral=True)
-            return
-        
-        quest_deleted = False
-
-        for user_id in users_in_guild:
-            # Check if the quest exists for the user
-            quest_exists =  await self.quest_data.find_users_with_quest(guild_id, quest_id)
-            if quest_exists:
-                # Delete the quest for this user
-                await self.quest_data.delete_quest(guild_id, quest_id)
-                quest_deleted = True
-
-        if quest_deleted:
-            await interaction.response.send_message(f"The quest with ID {quest_id} has been deleted for all users who had it.", ephemeral=True)
+        guild_id = str(interaction.guild.id)
+
+        # Pull the quest from every member who has it in one update
+        deleted_count = await self.quest_data.delete_quest(guild_id, quest_id)
+
+        if deleted_count:
+            await interaction.response.send_message(f"The quest with ID {quest_id} has been deleted for all {deleted_count} users who had it.", ephemeral=True)
         else:
             await interaction.response.send_message("The specified quest does not exist for any user.", ephemeral=True)
         
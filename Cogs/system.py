@@ -19,6 +19,7 @@ from Imports.discord_imports import *
 from Imports.log_imports import *
 import Data.const as const 
 from Data.const import primary_color, timestamp_gen
+from Data.database import database
 
 
 class System(commands.Cog):
@@ -135,6 +136,20 @@ class System(commands.Cog):
         memory_usage = self.get_memory_usage()
         await ctx.send(f"Current memory usage: {memory_usage:.2f} MB")
 
+    @commands.command()
+    @commands.is_owner()
+    async def db_stats(self, ctx, top: int = 10):
+        """Shows the shared Mongo pool and the busiest collections by command time."""
+        pool = database.pool_stats()
+        stats = sorted(database.metrics.snapshot().items(), key=lambda item: item[1]['total_ms'], reverse=True)
+        lines = [f"pool: {pool}"]
+        for (namespace, command), entry in stats[:top]:
+            lines.append(
+                f"{namespace} {command}: {entry['count']} calls, {entry['failed']} failed, "
+                f"avg {entry['avg_ms']:.1f}ms, max {entry['max_ms']:.1f}ms"
+            )
+        await ctx.send("```\n" + "\n".join(lines) + "\n```")
+
     def get_memory_usage(self):
         """Returns the current memory usage of the bot."""
         process = psutil.Process(os.getpid())
@@ -6,6 +6,8 @@ from io import BytesIO
 import os
 
 from Imports.discord_imports import *
+from Data.assets import assets
+from Data.render import render_service
 
 class DiscordMessageConfig:
     """Configuration for a simulated Discord-style message display."""
@@ -45,7 +47,7 @@ class DiscordMessageImage:
     def load_font(self, size):
         """Loads a TTF font or defaults to PIL's built-in font."""
         if self.config.font_path and os.path.exists(self.config.font_path):
-            return ImageFont.truetype(self.config.font_path, size)
+            return assets.font(self.config.font_path, size)
         else:
             return ImageFont.load_default()
 
@@ -127,15 +129,12 @@ class MessageImageCog(commands.Cog):
             timestamp="Today at 12:34 PM"
         )
         
-        # Create the Discord message image
+        # Create the Discord message image on the render pool (the avatar download blocks too)
         message_image = DiscordMessageImage(config)
-        image = message_image.create_image()
+        image_bytes = await render_service.render(message_image.create_image)
 
-        # Save the image as a file
-        image.save("Data/test/message/discord_message.png")
-
-        # Send the image file as a response
-        await ctx.send(file=discord.File("Data/test/message/discord_message.png"))
+        # Send the image as a response
+        await ctx.send(file=discord.File(BytesIO(image_bytes), filename="discord_message.png"))
 
 
 # Setup function to add the cog to the bot
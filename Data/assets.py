@@ -0,0 +1,160 @@
+import os
+import threading
+from io import BytesIO
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+import requests
+from PIL import Image, ImageDraw, ImageFont
+
+
+def apply_color_replacements(image, replacements):
+    """Replaces colors (hex -> 'transparent', '#rrggbb' or an image URL) in an RGBA image, within a tolerance of 10."""
+    bg_array = np.array(image).copy()
+
+    for old_hex, replacement in replacements.items():
+        old_color = tuple(int(old_hex[i:i+2], 16) for i in (0, 2, 4))
+        mask = cv2.inRange(bg_array[:, :, :3], np.array(old_color) - 10, np.array(old_color) + 10)
+        if replacement == 'transparent':  # Replace with transparency
+            bg_array[mask > 0] = [0, 0, 0, 0]
+        elif replacement.startswith('http'):  # Replace with image from URL
+            response = requests.get(replacement)
+            response.raise_for_status()
+            replacement_img = Image.open(BytesIO(response.content)).convert("RGBA").resize((image.width, image.height))
+            replacement_array = np.array(replacement_img)[:, :, :3]
+            bg_array[mask > 0, :3] = replacement_array[mask > 0]
+        else:  # Replace with solid color
+            bg_array[mask > 0, :3] = tuple(int(replacement[i:i+2], 16) for i in (1, 3, 5))
+
+    return Image.fromarray(bg_array, 'RGBA')
+
+
+class AssetCache:
+    """
+    Process-wide cache of decoded fonts and images.
+
+    Every entry remembers the mtime of the files it was built from and is
+    rebuilt when one of them changes on disk. Returned images are shared,
+    callers copy() before drawing on them.
+
+    Entries are kept in LRU order and bounded by the decoded size of their
+    images, so per-user thumbnails and composites can not grow without limit
+    while the banner assets every render uses stay resident.
+    """
+
+    def __init__(self, max_bytes=128 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _sizeof(value):
+        if isinstance(value, Image.Image):
+            return value.width * value.height * len(value.getbands())
+        return 0
+
+    @staticmethod
+    def _mtimes(paths):
+        mtimes = []
+        for path in paths:
+            try:
+                mtimes.append(os.path.getmtime(path))
+            except (OSError, TypeError):
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def _cached(self, key, paths, loader):
+        mtimes = self._mtimes(paths)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] == mtimes:
+                self.entries.move_to_end(key)
+                return entry[1]
+        value = loader()
+        size = self._sizeof(value)
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous[2]
+            self.entries[key] = (mtimes, value, size)
+            self.size += size
+            while self.size > self.max_bytes and len(self.entries) > 1:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= evicted[2]
+        return value
+
+    def signature(self, *paths):
+        """mtimes of the given files, for keying renders that depend on them."""
+        return self._mtimes(paths)
+
+    def font(self, path, size):
+        """A TrueType font, or PIL's default font if the file is missing or unreadable."""
+        def load():
+            try:
+                return ImageFont.truetype(path, size)
+            except Exception:
+                return ImageFont.load_default()
+        return self._cached(('font', path, size), [path], load)
+
+    def image(self, path, scale=None, size=None, replacements=None):
+        """An RGBA image, optionally scaled by a factor or to a size and color-replaced."""
+        replacements = replacements or {}
+
+        def load():
+            with Image.open(path) as source:
+                image = source.convert("RGBA")
+            if scale is not None:
+                image = image.resize((round(image.width * scale), round(image.height * scale)))
+            if size is not None:
+                image = image.resize(size)
+            if replacements:
+                image = apply_color_replacements(image, replacements)
+            return image
+
+        key = ('image', path, scale, size, tuple(sorted(replacements.items())))
+        return self._cached(key, [path], load)
+
+    def composite(self, background_path, character_path, character_scale, character_pos, replacements=None):
+        """Background with the scaled character already pasted, the static layer of a banner."""
+        def load():
+            background = self.image(background_path, replacements=replacements).copy()
+            character = self.image(character_path, scale=character_scale)
+            background.paste(character, character_pos, character)
+            return background
+
+        key = ('composite', background_path, character_path, character_scale, character_pos,
+               tuple(sorted((replacements or {}).items())))
+        return self._cached(key, [background_path, character_path], load)
+
+    def circle_mask(self, size):
+        """Antialiasing-free circular alpha mask, one per size for the whole process."""
+        def load():
+            mask = Image.new('L', size, 0)
+            ImageDraw.Draw(mask).ellipse((0, 0, size[0], size[1]), fill=255)
+            return mask
+        return self._cached(('circle_mask', size), [], load)
+
+    def circle_thumbnail(self, path, size):
+        """LANCZOS-resized RGBA image cut to a circle, with transparent corners."""
+        def load():
+            with Image.open(path) as source:
+                image = source.resize(size, Image.LANCZOS).convert("RGBA")
+            return Image.composite(image, Image.new('RGBA', size, (255, 255, 255, 0)), self.circle_mask(size))
+        return self._cached(('circle_thumbnail', path, size), [path], load)
+
+    def dominant_color(self, path):
+        """The image resized to a single pixel, that pixel's value."""
+        def load():
+            with Image.open(path) as image:
+                return image.resize((1, 1)).getpixel((0, 0))
+        return self._cached(('dominant_color', path), [path], load)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+
+assets = AssetCache()
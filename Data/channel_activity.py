@@ -0,0 +1,90 @@
+import time
+from array import array
+
+
+class ChannelWindow:
+    """Message and author counts of one channel over the last `slots` buckets, as a ring buffer."""
+
+    __slots__ = ('bucket', 'stamps', 'counts', 'authors', 'last_bucket')
+
+    def __init__(self, slots, bucket):
+        self.bucket = bucket
+        self.stamps = array('q', [-1] * slots)
+        self.counts = array('I', [0] * slots)
+        # Unused slots still fall inside the window while the clock is below one window length
+        self.authors = [set() for _ in range(slots)]
+        self.last_bucket = -1
+
+    def record(self, author_id, now):
+        current = int(now // self.bucket)
+        slot = current % len(self.stamps)
+        if self.stamps[slot] != current:
+            # The slot still holds a bucket that has slid out of the window
+            self.stamps[slot] = current
+            self.counts[slot] = 0
+            self.authors[slot] = set()
+        self.counts[slot] += 1
+        if author_id is not None:
+            self.authors[slot].add(author_id)
+        self.last_bucket = current
+
+    def totals(self, now):
+        """(messages, distinct authors) within the window."""
+        current = int(now // self.bucket)
+        oldest = current - len(self.stamps)
+        messages = 0
+        authors = set()
+        for slot, stamp in enumerate(self.stamps):
+            if oldest < stamp <= current:
+                messages += self.counts[slot]
+                authors |= self.authors[slot]
+        return messages, len(authors)
+
+    def expired(self, now):
+        return int(now // self.bucket) - self.last_bucket >= len(self.stamps)
+
+
+class ChannelActivity:
+    """
+    Sliding-window activity of every text channel, fed by on_message.
+
+    Picking an active channel reads these counters instead of scanning
+    channel history through the Discord API.
+    """
+
+    def __init__(self, window=30 * 60, bucket=60):
+        self.slots = max(1, window // bucket)
+        self.bucket = bucket
+        self.guilds = {}
+
+    def record(self, guild_id, channel_id, author_id=None, now=None):
+        """Counts one message; pass author_id only for human authors."""
+        now = time.time() if now is None else now
+        channels = self.guilds.setdefault(str(guild_id), {})
+        window = channels.get(channel_id)
+        if window is None:
+            window = channels[channel_id] = ChannelWindow(self.slots, self.bucket)
+        window.record(author_id, now)
+
+    def ranked(self, guild_id, channel_ids=None, now=None):
+        """
+        [(channel_id, messages, authors)] of the guild's channels with activity in the window,
+        busiest first by distinct authors then messages, optionally limited to channel_ids.
+        """
+        now = time.time() if now is None else now
+        channels = self.guilds.get(str(guild_id), {})
+        activity = []
+        for channel_id, window in list(channels.items()):
+            if window.expired(now):
+                del channels[channel_id]
+                continue
+            if channel_ids is not None and channel_id not in channel_ids:
+                continue
+            messages, authors = window.totals(now)
+            if messages:
+                activity.append((channel_id, messages, authors))
+        activity.sort(key=lambda item: (item[2], item[1]), reverse=True)
+        return activity
+
+
+channel_activity = ChannelActivity()
@@ -18,6 +18,7 @@ from psutil import *  # Import all functions from psutil
 
 
 # Custom Imports
+from Data.assets import assets
 from Imports.discord_imports import *  # Import all necessary Discord-related classes/functions
 from openai import AsyncOpenAI  # Assuming AsyncOpenAI is the correct import from your module 
 
@@ -845,10 +846,8 @@ async def sdxl(prompt):
 
 
 def primary_color(image_path='Data/Images/bot_icon.png'):
-    image = Image.open(image_path)
-    # Resize the image to 1x1 pixel to get the dominant color
-    resized_image = image.resize((1, 1))
-    dominant_color = resized_image.getpixel((0, 0))
+    # The 1x1 resize is computed once and redone only when the icon changes on disk
+    dominant_color = assets.dominant_color(image_path)
     return discord.Color.from_rgb(dominant_color[0], dominant_color[1], dominant_color[2])
 
 # Async Functions
@@ -920,7 +919,11 @@ async def error_custom_embed(bot, ctx, e, title="Custom Error", thumbnail_url=An
         if isinstance(ctx, commands.Context):
             await ctx.reply(embed=error_embed)
         elif isinstance(ctx, discord.Interaction):
-            await ctx.response.send_message(embed=error_embed)
+            # Deferred or already answered interactions only take followups
+            if ctx.response.is_done():
+                await ctx.followup.send(embed=error_embed)
+            else:
+                await ctx.response.send_message(embed=error_embed)
     except discord.errors.Forbidden:
         missing_perms = ['embed_links']  # Add any other permissions the bot might be missing
         invite_link = generate_invite_link(bot, ctx, missing_perms)
@@ -0,0 +1,134 @@
+import os
+import time
+import logging
+
+import motor.motor_asyncio
+from pymongo import monitoring
+
+
+logger = logging.getLogger(__name__)
+
+
+def _env_int(name, default):
+    value = os.getenv(name)
+    try:
+        return int(value) if value else default
+    except ValueError:
+        logger.error(f"{name}={value!r} is not an integer, using {default}")
+        return default
+
+
+class CollectionMetrics(monitoring.CommandListener):
+    """
+    Per-collection command counters fed by the driver's command monitoring.
+
+    Every command the shared client sends is counted under
+    (database.collection, command) with its failures and total time, so a
+    hot or slow collection shows up without instrumenting each call site.
+    """
+
+    def __init__(self):
+        self.stats = {}
+        self.pending = {}
+
+    @staticmethod
+    def _target(event):
+        collection = event.command.get(event.command_name)
+        if not isinstance(collection, str):
+            # Admin and cursor commands (ping, getMore, ...) carry no collection name
+            collection = '-'
+        return f"{event.database_name}.{collection}", event.command_name
+
+    def _record(self, event, failed):
+        key = self.pending.pop((event.request_id, event.connection_id), None)
+        if key is None:
+            return
+        entry = self.stats.setdefault(key, {'count': 0, 'failed': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+        duration_ms = event.duration_micros / 1000
+        entry['count'] += 1
+        entry['failed'] += failed
+        entry['total_ms'] += duration_ms
+        entry['max_ms'] = max(entry['max_ms'], duration_ms)
+
+    def started(self, event):
+        self.pending[(event.request_id, event.connection_id)] = self._target(event)
+
+    def succeeded(self, event):
+        self._record(event, False)
+
+    def failed(self, event):
+        self._record(event, True)
+
+    def snapshot(self):
+        """{(namespace, command): {count, failed, total_ms, max_ms, avg_ms}}"""
+        return {
+            key: {**entry, 'avg_ms': entry['total_ms'] / entry['count'] if entry['count'] else 0.0}
+            for key, entry in self.stats.items()
+        }
+
+    def reset(self):
+        self.stats.clear()
+
+
+class DatabaseService:
+    """
+    The bot's single MongoDB client and connection pool.
+
+    Every cog and helper reads `database.client` instead of building its own
+    AsyncIOMotorClient, so the process keeps one pool and one set of
+    monitor threads no matter how many views or games are open. The client
+    is created on first use from MONGO_URI; pool size and timeouts come from
+    the MONGO_* environment variables below.
+    """
+
+    def __init__(self, uri=None):
+        self.uri = uri
+        self.metrics = CollectionMetrics()
+        self.started_at = None
+        self._client = None
+
+    def options(self):
+        return {
+            'maxPoolSize': _env_int('MONGO_MAX_POOL_SIZE', 50),
+            'minPoolSize': _env_int('MONGO_MIN_POOL_SIZE', 0),
+            'maxIdleTimeMS': _env_int('MONGO_MAX_IDLE_MS', 60000),
+            'waitQueueTimeoutMS': _env_int('MONGO_WAIT_QUEUE_TIMEOUT_MS', 10000),
+            'serverSelectionTimeoutMS': _env_int('MONGO_SERVER_SELECTION_TIMEOUT_MS', 5000),
+            'connectTimeoutMS': _env_int('MONGO_CONNECT_TIMEOUT_MS', 5000),
+            'socketTimeoutMS': _env_int('MONGO_SOCKET_TIMEOUT_MS', 20000),
+            'retryWrites': True,
+            'appname': os.getenv('MONGO_APP_NAME', 'anya-bot'),
+            'event_listeners': [self.metrics],
+        }
+
+    @property
+    def client(self):
+        if self._client is None:
+            uri = self.uri or os.getenv('MONGO_URI')
+            if not uri:
+                raise ValueError("No MONGO_URI found in environment variables")
+            self._client = motor.motor_asyncio.AsyncIOMotorClient(uri, **self.options())
+            self.started_at = time.time()
+        return self._client
+
+    def __getitem__(self, db_name):
+        return self.client[db_name]
+
+    def pool_stats(self):
+        if self._client is None:
+            return {'connected': False}
+        options = self._client.options.pool_options
+        return {
+            'connected': True,
+            'max_pool_size': options.max_pool_size,
+            'min_pool_size': options.min_pool_size,
+            'uptime_s': int(time.time() - self.started_at),
+        }
+
+    def close(self):
+        """Closes the pool's sockets; the driver reopens them if the client is used again."""
+        if self._client is not None:
+            self._client.close()
+
+
+database = DatabaseService()
@@ -0,0 +1,39 @@
+import time
+
+
+class GuildSettingsCache:
+    """
+    Per-guild settings (quest limit, redirect channels, roles) kept in memory for `ttl` seconds.
+
+    The commands that change a setting write the new value through, so the
+    TTL only bounds staleness from writes made outside this process.
+    """
+
+    MISSING = object()
+
+    def __init__(self, ttl=600):
+        self.ttl = ttl
+        self.entries = {}
+
+    def get(self, guild_id, name):
+        """The cached value, or GuildSettingsCache.MISSING if absent or expired."""
+        entry = self.entries.get((str(guild_id), name))
+        if entry is None or entry[0] < time.monotonic():
+            return self.MISSING
+        return entry[1]
+
+    def set(self, guild_id, name, value):
+        self.entries[(str(guild_id), name)] = (time.monotonic() + self.ttl, value)
+        return value
+
+    def invalidate(self, guild_id, name=None):
+        """Drops one setting of a guild, or all of them."""
+        guild_id = str(guild_id)
+        if name is not None:
+            self.entries.pop((guild_id, name), None)
+            return
+        for key in [key for key in self.entries if key[0] == guild_id]:
+            del self.entries[key]
+
+
+guild_settings = GuildSettingsCache()
@@ -0,0 +1,252 @@
+import os
+import json
+import time
+import zlib
+import sqlite3
+import asyncio
+import logging
+import threading
+
+from Data.pokemon.pokedex import pokedex
+from Data.pokemon.dex_store import slim_pokemon
+
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FILE = 'Data/pokemon/dex_bundle.db'
+POKEAPI_URL = "https://pokeapi.co/api/v2/"
+
+
+def resource_key(url):
+    """Normalizes "https://pokeapi.co/api/v2/pokemon/25/" and "pokemon/25" to the same key."""
+    url = str(url)
+    if url.startswith(POKEAPI_URL):
+        url = url[len(POKEAPI_URL):]
+    path, _, query = url.partition('?')
+    path = path.strip('/').lower()
+    return f"{path}?{query}" if query else path
+
+
+def english_entries(entries, *fields):
+    """English entries only, or the first entry when there is no English one."""
+    english = [entry for entry in entries if entry['language']['name'] == 'en']
+    return [
+        {field: entry[field] for field in fields + ('language',)}
+        for entry in (english or entries[:1])
+    ]
+
+
+def slim_species(data):
+    """The parts of a /pokemon-species payload the dex embed, its views and the evolution graph read."""
+    return {
+        'id': data['id'],
+        'name': data['name'],
+        'gender_rate': data.get('gender_rate'),
+        'is_legendary': data.get('is_legendary'),
+        'is_mythical': data.get('is_mythical'),
+        'names': [{'name': n['name'], 'language': {'name': n['language']['name']}} for n in data.get('names', [])],
+        'flavor_text_entries': english_entries(data.get('flavor_text_entries', []), 'flavor_text'),
+        'varieties': [
+            {'is_default': v.get('is_default'), 'pokemon': {'name': v['pokemon']['name'], 'url': v['pokemon']['url']}}
+            for v in data.get('varieties', [])
+        ],
+        'evolution_chain': data.get('evolution_chain'),
+    }
+
+
+def slim_form(data):
+    return {
+        'id': data['id'],
+        'name': data['name'],
+        'form_name': data.get('form_name'),
+        'names': [{'name': n['name'], 'language': {'name': n['language']['name']}} for n in data.get('names', [])],
+        'pokemon': data.get('pokemon'),
+    }
+
+
+def slim_move_payload(data):
+    """Same shape as a /move payload, trimmed to what moves.slim_move reads."""
+    return {
+        'name': data['name'],
+        'power': data.get('power'),
+        'accuracy': data.get('accuracy'),
+        'pp': data.get('pp'),
+        'effect_chance': data.get('effect_chance'),
+        'type': {'name': (data.get('type') or {}).get('name')},
+        'damage_class': {'name': (data.get('damage_class') or {}).get('name')},
+        'effect_entries': english_entries(data.get('effect_entries', []), 'short_effect'),
+    }
+
+
+class DexBundle:
+    """
+    Read-only snapshot of every PokeAPI resource the dex needs, in one SQLite file.
+
+    One compressed row per resource key, with NULL bodies recording resources
+    PokeAPI does not have so those misses are answered locally too.
+    """
+
+    def __init__(self, db_file=BUNDLE_FILE):
+        os.makedirs(os.path.dirname(db_file), exist_ok=True)
+        self.db_file = db_file
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('CREATE TABLE IF NOT EXISTS resources (key TEXT PRIMARY KEY, body BLOB)')
+            self.conn.execute('CREATE TABLE IF NOT EXISTS progress (slug TEXT PRIMARY KEY)')
+            self.conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+
+    @classmethod
+    def open(cls, db_file=BUNDLE_FILE):
+        """The bundle if one has been built, otherwise None."""
+        return cls(db_file) if os.path.exists(db_file) else None
+
+    def get(self, url):
+        """Returns (found, data); data is None for a resource recorded as missing."""
+        with self.lock:
+            row = self.conn.execute('SELECT body FROM resources WHERE key = ?', (resource_key(url),)).fetchone()
+        if row is None:
+            return False, None
+        return True, json.loads(zlib.decompress(row[0])) if row[0] is not None else None
+
+    def __contains__(self, url):
+        with self.lock:
+            return self.conn.execute('SELECT 1 FROM resources WHERE key = ?', (resource_key(url),)).fetchone() is not None
+
+    def put_many(self, items, done_slug=None):
+        """Stores (url, data) pairs and, in the same transaction, checkpoints a finished slug."""
+        rows = [
+            (resource_key(url), zlib.compress(json.dumps(data, separators=(',', ':')).encode()) if data is not None else None)
+            for url, data in items
+        ]
+        with self.lock, self.conn:
+            self.conn.executemany('INSERT OR REPLACE INTO resources (key, body) VALUES (?, ?)', rows)
+            if done_slug is not None:
+                self.conn.execute('INSERT OR IGNORE INTO progress (slug) VALUES (?)', (done_slug,))
+
+    def names(self, prefix):
+        """Names of every bundled resource under a path prefix, "move" -> every move/<name>."""
+        start = prefix.strip('/') + '/'
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT key FROM resources WHERE key >= ? AND key < ? AND body IS NOT NULL', (start, start + '\uffff')
+            ).fetchall()
+        return [row[0][len(start):] for row in rows if '/' not in row[0][len(start):] and '?' not in row[0][len(start):]]
+
+    def done_slugs(self):
+        with self.lock:
+            return {row[0] for row in self.conn.execute('SELECT slug FROM progress')}
+
+    @property
+    def version(self):
+        """Changes every time a build completes, so derived caches know to drop their entries."""
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return row[0] if row else None
+
+    def mark_complete(self):
+        with self.lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (str(int(time.time())),))
+            self.conn.execute('DELETE FROM progress')
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+async def bundle_pokemon(client, bundle, slug):
+    """
+    Fetches one Pokédex entry with its species, varieties, form and evolution chain.
+
+    Requests are strict, so only a real 404 is stored as missing; any other
+    failure raises before the slug is checkpointed and the next build retries it.
+    """
+    pokemon, form = await client.get_many(f"pokemon/{slug}", f"pokemon-form/{slug}", strict=True)
+    items = [(f"pokemon/{slug}", slim_pokemon(pokemon) if pokemon else None), (f"pokemon-form/{slug}", slim_form(form) if form else None)]
+
+    species_name = pokemon['species']['name'] if pokemon else slug
+    species_key = f"pokemon-species/{species_name}"
+    if species_key not in bundle:
+        species = await client.get(species_key, strict=True)
+        items.append((species_key, slim_species(species) if species else None))
+        if species is not None:
+            varieties = [v['pokemon']['name'] for v in species.get('varieties', [])]
+            chain_url = (species.get('evolution_chain') or {}).get('url')
+            paths = [f"pokemon/{name}" for name in varieties if f"pokemon/{name}" not in bundle]
+            if chain_url:
+                paths.append(chain_url)
+            for path, data in zip(paths, await client.get_many(*paths, strict=True)):
+                if path == chain_url:
+                    items.append((path, data))
+                else:
+                    items.append((path, slim_pokemon(data) if data else None))
+
+    await asyncio.to_thread(bundle.put_many, items, slug)
+
+
+async def build_bundle(db_file=BUNDLE_FILE, max_concurrency=16):
+    """
+    Build step: snapshots every Pokédex id plus all move summaries into the bundle.
+
+    Progress is checkpointed per slug, so an interrupted build picks up where it stopped.
+    """
+    from Data.pokemon.pokeapi import pokeapi, PokeAPIError
+
+    # Build from PokeAPI (through its cache), never from a previous bundle
+    pokeapi.bundle = None
+    bundle = DexBundle(db_file)
+    done = await asyncio.to_thread(bundle.done_slugs)
+    slugs = [slug for slug in dict.fromkeys(pokedex.columns['slug']) if slug and slug not in done]
+    print(f"Bundling {len(slugs)} Pokémon ({len(done)} already done)")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def worker(slug):
+        async with semaphore:
+            try:
+                await bundle_pokemon(pokeapi, bundle, slug)
+            except Exception as e:
+                logger.error(f"Failed to bundle {slug}: {e}")
+
+    for start in range(0, len(slugs), 100):
+        await asyncio.gather(*(worker(slug) for slug in slugs[start:start + 100]))
+        print(f"{min(start + 100, len(slugs))}/{len(slugs)}")
+
+    listing = await pokeapi.get("move?limit=10000")
+    if listing is None:
+        raise RuntimeError("Could not fetch the move list from PokeAPI")
+    # MoveDatabase.populate starts from this listing, so offline it has to be in the bundle too
+    slim_listing = {'results': [{'name': move['name'], 'url': move['url']} for move in listing['results']]}
+    await asyncio.to_thread(bundle.put_many, [("move?limit=10000", slim_listing)])
+    missing = [f"move/{move['name']}" for move in listing['results'] if f"move/{move['name']}" not in bundle]
+    print(f"Bundling {len(missing)} moves")
+
+    async def move_worker(path):
+        async with semaphore:
+            try:
+                data = await pokeapi.get(path, strict=True)
+            except PokeAPIError as e:
+                logger.error(f"Failed to bundle {path}: {e}")
+                return None
+        return path, slim_move_payload(data) if data else None
+
+    failed_moves = 0
+    for start in range(0, len(missing), 200):
+        items = await asyncio.gather(*(move_worker(path) for path in missing[start:start + 200]))
+        fetched = [item for item in items if item is not None]
+        failed_moves += len(items) - len(fetched)
+        await asyncio.to_thread(bundle.put_many, fetched)
+
+    failed = len(slugs) - (len(await asyncio.to_thread(bundle.done_slugs)) - len(done))
+    await pokeapi.close()
+    if failed or failed_moves:
+        print(f"{failed} Pokémon and {failed_moves} moves failed, run the build again to retry them")
+    else:
+        bundle.mark_complete()
+        print(f"Bundle written to {db_file} (version {bundle.version})")
+    bundle.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(build_bundle())
@@ -0,0 +1,57 @@
+import time
+from collections import OrderedDict
+
+from Data.pokemon.pokeapi import pokeapi
+
+
+class DexEmbedCache:
+    """
+    Fully rendered dex presentations: the embed as a dict plus the Pokebuttons parameters.
+
+    Keyed by (species, form, variant) where variant is None, "shiny" or "mega".
+    Everything is dropped when the offline bundle the entries were rendered from
+    is rebuilt. The bundle is rebuilt by a separate process, so its version is
+    kept in memory and re-read at most every `check_interval` seconds rather
+    than queried from SQLite on every lookup.
+    """
+
+    def __init__(self, capacity=512, check_interval=60):
+        self.capacity = capacity
+        self.check_interval = check_interval
+        self.entries = OrderedDict()
+        self.version = self.source_version()
+        self.next_check = time.monotonic() + check_interval
+
+    @staticmethod
+    def source_version():
+        return pokeapi.bundle.version if pokeapi.bundle is not None else None
+
+    def _check_version(self):
+        now = time.monotonic()
+        if now < self.next_check:
+            return
+        self.next_check = now + self.check_interval
+        version = self.source_version()
+        if version != self.version:
+            self.entries.clear()
+            self.version = version
+
+    def get(self, key):
+        self._check_version()
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def set(self, key, embed, view_params):
+        self._check_version()
+        self.entries[key] = {'embed': embed.to_dict(), 'view': view_params}
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+
+dex_embed_cache = DexEmbedCache()
@@ -0,0 +1,179 @@
+import os
+import json
+import zlib
+import sqlite3
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+
+
+logger = logging.getLogger(__name__)
+
+
+def slim_pokemon(data):
+    """Keeps only the fields of a /pokemon payload that the dex embed and its views read."""
+    sprites = data.get('sprites') or {}
+    artwork = (sprites.get('other') or {}).get('official-artwork') or {}
+    black_white = ((sprites.get('versions') or {}).get('generation-v') or {}).get('black-white') or {}
+    animated = black_white.get('animated') or {}
+
+    return {
+        'id': data['id'],
+        'name': data['name'],
+        'height': data.get('height'),
+        'weight': data.get('weight'),
+        'species': data.get('species'),
+        'types': [{'slot': t.get('slot'), 'type': {'name': t['type']['name']}} for t in data.get('types', [])],
+        'abilities': [{'ability': {'name': a['ability']['name']}, 'is_hidden': a.get('is_hidden')} for a in data.get('abilities', [])],
+        'stats': [{'base_stat': s['base_stat'], 'stat': {'name': s['stat']['name']}} for s in data.get('stats', [])],
+        'sprites': {
+            'front_default': sprites.get('front_default'),
+            'front_shiny': sprites.get('front_shiny'),
+            'front_female': sprites.get('front_female'),
+            'other': {'official-artwork': {
+                'front_default': artwork.get('front_default'),
+                'front_shiny': artwork.get('front_shiny'),
+            }},
+            'versions': {'generation-v': {'black-white': {
+                'front_default': black_white.get('front_default'),
+                'front_shiny': black_white.get('front_shiny'),
+                'animated': {
+                    'front_default': animated.get('front_default'),
+                    'front_shiny': animated.get('front_shiny'),
+                },
+            }}},
+        },
+        'moves': [
+            {
+                'move': {'name': m['move']['name'], 'url': m['move']['url']},
+                'version_group_details': [
+                    {
+                        'level_learned_at': d['level_learned_at'],
+                        'move_learn_method': {'name': d['move_learn_method']['name']},
+                        'version_group': {'name': d['version_group']['name']},
+                    }
+                    for d in m.get('version_group_details', [])
+                ],
+            }
+            for m in data.get('moves', [])
+        ],
+    }
+
+
+class DexStore:
+    """
+    Keyed store of slimmed dex records.
+
+    Reads hit an LRU memory tier before the SQLite file, one row per key.
+    Writes land in memory immediately and are persisted in batches shortly
+    after (write-behind), so a lookup never rewrites the whole cache.
+    """
+
+    def __init__(self, db_file='Data/pokemon/dex_store.db', capacity=256, flush_delay=5):
+        os.makedirs(os.path.dirname(db_file), exist_ok=True)
+        self.capacity = capacity
+        self.flush_delay = flush_delay
+        self.memory = OrderedDict()
+        self.dirty = {}
+        self.flush_task = None
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('CREATE TABLE IF NOT EXISTS records (key TEXT PRIMARY KEY, body BLOB NOT NULL)')
+
+    @staticmethod
+    def _encode(record):
+        return zlib.compress(json.dumps(record, separators=(',', ':')).encode())
+
+    @staticmethod
+    def _decode(body):
+        return json.loads(zlib.decompress(body))
+
+    def _remember(self, key, record):
+        self.memory[key] = record
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.capacity:
+            self.memory.popitem(last=False)
+
+    def _read(self, key):
+        with self.lock:
+            row = self.conn.execute('SELECT body FROM records WHERE key = ?', (key,)).fetchone()
+        return self._decode(row[0]) if row else None
+
+    def _write(self, items):
+        with self.lock, self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO records (key, body) VALUES (?, ?)',
+                [(key, self._encode(record)) for key, record in items]
+            )
+
+    async def get(self, key):
+        key = str(key).lower()
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            return self.memory[key]
+        if key in self.dirty:
+            return self.dirty[key]
+        record = await asyncio.to_thread(self._read, key)
+        if record is not None:
+            self._remember(key, record)
+        return record
+
+    async def set(self, key, record):
+        key = str(key).lower()
+        self._remember(key, record)
+        self.dirty[key] = record
+        if self.flush_task is None or self.flush_task.done():
+            self.flush_task = asyncio.create_task(self._flush_later())
+
+    async def set_many(self, keys, record):
+        """Stores the same record under several keys (id, name and the alias that was asked for)."""
+        for key in dict.fromkeys(str(key).lower() for key in keys):
+            await self.set(key, record)
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_delay)
+        await self.flush()
+
+    async def flush(self):
+        if not self.dirty:
+            return
+        # Swap the pending batch out first so writes that arrive mid-flush go to the next batch
+        pending, self.dirty = self.dirty, {}
+        try:
+            await asyncio.to_thread(self._write, list(pending.items()))
+        except sqlite3.Error as e:
+            logger.error(f"Failed to persist {len(pending)} dex records: {e}")
+            pending.update(self.dirty)
+            self.dirty = pending
+
+    async def import_legacy_json(self, file_path='Data/pokemon/pokemon.json'):
+        """One-off migration of the old monolithic pokemon.json cache."""
+        if not os.path.exists(file_path):
+            return 0
+
+        def load():
+            with open(file_path, 'r') as file:
+                return json.load(file)
+
+        try:
+            legacy = await asyncio.to_thread(load)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"Could not read {file_path}: {e}")
+            return 0
+
+        items = [(str(key).lower(), slim_pokemon(data)) for key, data in legacy.items() if 'stats' in data]
+        await asyncio.to_thread(self._write, items)
+        os.replace(file_path, file_path + '.migrated')
+        logger.info(f"Migrated {len(items)} records from {file_path}")
+        return len(items)
+
+    async def close(self):
+        if self.flush_task is not None and not self.flush_task.done():
+            self.flush_task.cancel()
+        await self.flush()
+
+
+dex_store = DexStore()
@@ -0,0 +1,185 @@
+import os
+import json
+import asyncio
+import logging
+from collections import deque
+
+from Data.pokemon.pokedex import pokedex
+from Data.pokemon.pokeapi import pokeapi
+
+
+logger = logging.getLogger(__name__)
+
+
+def describe_evolution(details):
+    """Human readable evolution method from one PokeAPI evolution_details entry."""
+    trigger = (details.get('trigger') or {}).get('name')
+    item = details.get('item')
+    known_move_type = details.get('known_move_type')
+    time_of_day = details.get('time_of_day')
+    min_level = details.get('min_level')
+    min_happiness = details.get('min_happiness')
+    method = ""
+
+    if trigger == 'level-up':
+        # Handle leveling up with specific conditions
+        if known_move_type:
+            method += f"when leveled up while knowing a {known_move_type['name'].replace('-', ' ').title()} move"
+        else:
+            method = "when leveled up"
+            if time_of_day:
+                method += f" at {time_of_day.title()} time"
+            if min_level:
+                method += f" starting from level {min_level}"
+            if min_happiness:
+                method += " while holding a Friendship Bracelet"
+    elif trigger == 'use-item':
+        # Handle evolution using a specific item
+        if item:
+            method = f"using a {item['name'].replace('-', ' ').title()}"
+    elif trigger == 'trade':
+        # Handle trade evolution with or without an item
+        if item:
+            method = f"when traded holding a {item['name'].replace('-', ' ').title()}"
+        else:
+            method = "when traded"
+
+    return method
+
+
+class EvolutionGraph:
+    """
+    Evolution DAG over species, built from the evo.to / evo.from columns.
+
+    Form rows (pikachu-starter, rattata-alola, ...) are folded into their base
+    species on both ends of an edge, the same granularity as PokeAPI chains;
+    otherwise a form's own evo columns would attach it as a second parent.
+
+    Evolution methods are not in the CSV; they are fetched from PokeAPI once per
+    family and persisted, so every later lookup is local.
+    """
+
+    def __init__(self, pokedex, methods_file='Data/pokemon/evolution_methods.json'):
+        self.pokedex = pokedex
+        self.methods_file = methods_file
+        self.children = {}
+        self.parents = {}
+
+        ids = pokedex.columns['id']
+        for pokemon_id, evolves_to, evolves_from in zip(ids, pokedex.columns['evo.to'], pokedex.columns['evo.from']):
+            species = self.species_id(pokemon_id)
+            for child in evolves_to:
+                if child in pokedex.by_id:
+                    self.add_edge(species, self.species_id(child))
+            if evolves_from is not None and evolves_from in pokedex.by_id:
+                self.add_edge(self.species_id(evolves_from), species)
+
+        self.methods = {}
+        self.fetched_families = set()
+        if os.path.exists(methods_file):
+            try:
+                with open(methods_file, 'r') as file:
+                    saved = json.load(file)
+                self.methods = saved.get('methods', {})
+                self.fetched_families = set(saved.get('families', []))
+            except (OSError, json.JSONDecodeError) as e:
+                logger.error(f"Could not load {methods_file}: {e}")
+
+    def add_edge(self, parent, child):
+        if parent == child:
+            return
+        children = self.children.setdefault(parent, [])
+        if child not in children:
+            children.append(child)
+        self.parents.setdefault(child, parent)
+
+    def slug(self, pokemon_id):
+        return self.pokedex.value(pokemon_id, 'slug')
+
+    def species_id(self, pokemon_id):
+        """Id of the base species row a form row belongs to."""
+        base = self.pokedex.by_id.get(self.pokedex.value(pokemon_id, 'dex_number'))
+        return self.pokedex.columns['id'][base] if base is not None else pokemon_id
+
+    def species_slug(self, pokemon_id):
+        """Slug of the base species a form belongs to (PokeAPI chains only know species)."""
+        dex_number = self.pokedex.value(pokemon_id, 'dex_number')
+        base = self.pokedex.by_id.get(dex_number)
+        return self.pokedex.columns['slug'][base] if base is not None else self.slug(pokemon_id)
+
+    def root(self, pokemon_id):
+        seen = {pokemon_id}
+        while pokemon_id in self.parents and self.parents[pokemon_id] not in seen:
+            pokemon_id = self.parents[pokemon_id]
+            seen.add(pokemon_id)
+        return pokemon_id
+
+    def family(self, key):
+        """
+        Breadth first walk of the whole family containing `key` (id or slug).
+
+        Returns (edges, final_forms) as species ids, or ([], []) for an unknown key.
+        A species that does not evolve is its own final form with no edges.
+        """
+        index = self.pokedex.index_of(key)
+        if index is None:
+            return [], []
+        root = self.root(self.species_id(self.pokedex.columns['id'][index]))
+
+        edges, finals = [], []
+        queue, seen = deque([root]), {root}
+        while queue:
+            current = queue.popleft()
+            children = self.children.get(current, [])
+            if not children:
+                finals.append(current)
+            for child in children:
+                edges.append((current, child))
+                if child not in seen:
+                    seen.add(child)
+                    queue.append(child)
+        return edges, finals
+
+    def method(self, parent, child):
+        return (
+            self.methods.get(f"{self.slug(parent)}>{self.slug(child)}")
+            or self.methods.get(f"{self.species_slug(parent)}>{self.species_slug(child)}")
+            or ""
+        )
+
+    async def ensure_methods(self, key):
+        """Fetches the evolution chain of key's family once and records every method in it."""
+        index = self.pokedex.index_of(key)
+        if index is None:
+            return
+        root_slug = self.slug(self.root(self.species_id(self.pokedex.columns['id'][index])))
+        if root_slug in self.fetched_families:
+            return
+
+        species = await pokeapi.get(f"pokemon-species/{root_slug}")
+        chain_url = ((species or {}).get('evolution_chain') or {}).get('url')
+        chain = await pokeapi.get(chain_url) if chain_url else None
+        if chain is None:
+            return
+
+        queue = deque([chain['chain']])
+        while queue:
+            current = queue.popleft()
+            for evolution in current.get('evolves_to', []):
+                details = evolution.get('evolution_details') or [{}]
+                key = f"{current['species']['name']}>{evolution['species']['name']}"
+                self.methods[key] = describe_evolution(details[0])
+                queue.append(evolution)
+
+        self.fetched_families.add(root_slug)
+        await asyncio.to_thread(self._save, dict(self.methods), sorted(self.fetched_families))
+
+    def _save(self, methods, families):
+        temp_path = self.methods_file + '.tmp'
+        with open(temp_path, 'w') as file:
+            json.dump({'methods': methods, 'families': families}, file)
+        os.replace(temp_path, self.methods_file)
+
+
+# Built once at startup
+evolution_graph = EvolutionGraph(pokedex)
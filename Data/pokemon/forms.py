@@ -0,0 +1,134 @@
+import os
+import json
+import asyncio
+import logging
+
+from Data.pokemon.pokedex import pokedex
+from Data.pokemon.pokeapi import pokeapi, PokeAPIError
+
+
+logger = logging.getLogger(__name__)
+
+
+def form_record(pokemon, form=None, species=None):
+    """Everything PokeSelect shows for one variety: id, size, sprites and localized names."""
+    sprites = pokemon.get('sprites') or {}
+    artwork = (sprites.get('other') or {}).get('official-artwork') or {}
+    black_white = ((sprites.get('versions') or {}).get('generation-v') or {}).get('black-white') or {}
+    # Default forms usually carry no names of their own, the species' names apply to them
+    names = (form or {}).get('names') or (species or {}).get('names') or []
+
+    return {
+        'id': pokemon['id'],
+        'name': pokemon['name'],
+        'height': pokemon.get('height'),
+        'weight': pokemon.get('weight'),
+        'artwork': artwork.get('front_default'),
+        'artwork_shiny': artwork.get('front_shiny'),
+        'thumb': black_white.get('front_default'),
+        'thumb_shiny': black_white.get('front_shiny'),
+        'names': [[n['name'], n['language']['name']] for n in names],
+    }
+
+
+class FormCatalog:
+    """
+    Every species' varieties with their sprites and names, kept in memory.
+
+    A species is prepared once (served by the offline bundle when one is built)
+    and persisted, so switching forms in PokeSelect is a dictionary lookup.
+    """
+
+    def __init__(self, file_path='Data/pokemon/forms.json', max_concurrency=8, save_delay=5):
+        self.file_path = file_path
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.save_delay = save_delay
+        self.save_task = None
+        self.species = {}
+        self.forms = {}
+        if os.path.exists(file_path):
+            try:
+                with open(file_path, 'r') as file:
+                    saved = json.load(file)
+                self.species = saved.get('species', {})
+                self.forms = saved.get('forms', {})
+            except (OSError, json.JSONDecodeError) as e:
+                logger.error(f"Could not load {file_path}: {e}")
+
+    def varieties(self, species_name):
+        """Form names of a prepared species, default form first, or None if not prepared."""
+        return self.species.get(species_name.lower())
+
+    def form(self, form_name):
+        return self.forms.get(form_name.lower())
+
+    async def prepare(self, species_name):
+        """
+        Loads a species' varieties into the catalog, returns their form names.
+
+        A species is only recorded (and persisted) when every request for it got
+        a definitive answer; after a failed request the forms fetched so far are
+        returned for this call and the species is prepared again next time.
+        """
+        species_name = species_name.lower()
+        if species_name in self.species:
+            return self.species[species_name]
+
+        async with self.semaphore:
+            try:
+                species = await pokeapi.get(f"pokemon-species/{species_name}", strict=True)
+            except PokeAPIError as e:
+                logger.error(f"Could not prepare the forms of {species_name}: {e}")
+                return []
+            if species is None:
+                return []
+            names = [variety['pokemon']['name'] for variety in species.get('varieties', [])]
+            missing = [name for name in names if name not in self.forms]
+            pokemon, forms = await asyncio.gather(
+                asyncio.gather(*(pokeapi.get(f"pokemon/{name}", strict=True) for name in missing), return_exceptions=True),
+                asyncio.gather(*(pokeapi.get(f"pokemon-form/{name}", strict=True) for name in missing), return_exceptions=True),
+            )
+
+        complete = True
+        for name, pokemon_data, form_data in zip(missing, pokemon, forms):
+            if isinstance(pokemon_data, BaseException) or isinstance(form_data, BaseException):
+                complete = False
+                logger.error(f"Could not fetch form {name} of {species_name}: {pokemon_data if isinstance(pokemon_data, BaseException) else form_data}")
+                continue
+            if pokemon_data is not None:
+                self.forms[name] = form_record(pokemon_data, form_data, species)
+        prepared = [name for name in names if name in self.forms]
+        if complete:
+            self.species[species_name] = prepared
+            self.schedule_save()
+        return prepared
+
+    async def populate(self):
+        """Prepares every species in the Pokédex, meant to run in the background."""
+        species_names = [
+            pokedex.value(dex_number, 'slug') for dex_number in dict.fromkeys(pokedex.columns['dex_number'])
+            if dex_number in pokedex.by_id
+        ]
+        missing = [name for name in species_names if name and name not in self.species]
+        await asyncio.gather(*(self.prepare(name) for name in missing))
+        logger.info(f"Form catalog ready with {len(self.species)} species ({len(missing)} prepared)")
+
+    def schedule_save(self):
+        if self.save_task is None or self.save_task.done():
+            self.save_task = asyncio.create_task(self._save_later())
+
+    async def _save_later(self):
+        await asyncio.sleep(self.save_delay)
+        await self.save()
+
+    def _write(self, snapshot):
+        temp_path = self.file_path + '.tmp'
+        with open(temp_path, 'w') as file:
+            json.dump(snapshot, file, separators=(',', ':'))
+        os.replace(temp_path, self.file_path)
+
+    async def save(self):
+        await asyncio.to_thread(self._write, {'species': dict(self.species), 'forms': dict(self.forms)})
+
+
+form_catalog = FormCatalog()
@@ -0,0 +1,141 @@
+import os
+import json
+import asyncio
+import logging
+
+from Data.pokemon.pokeapi import pokeapi
+
+
+logger = logging.getLogger(__name__)
+
+
+def slim_move(data):
+    """Summary of a /move payload: everything the Moves view shows."""
+    effect = next(
+        (entry['short_effect'] for entry in data.get('effect_entries', []) if entry['language']['name'] == 'en'),
+        'N/A'
+    )
+    if data.get('effect_chance') is not None:
+        effect = effect.replace('$effect_chance', str(data['effect_chance']))
+
+    return {
+        'name': data['name'],
+        'power': data.get('power'),
+        'accuracy': data.get('accuracy'),
+        'pp': data.get('pp'),
+        'type': (data.get('type') or {}).get('name'),
+        'damage_class': (data.get('damage_class') or {}).get('name'),
+        'effect': ' '.join(effect.split()),
+    }
+
+
+def learnset(pokemon_data, version_group=None, method='level-up'):
+    """
+    Moves a Pokémon learns by `method` in one version group, sorted by level.
+
+    Without a version group the most recent one the payload lists is used.
+    Returns (version_group, [(level, move_name), ...]).
+    """
+    by_group = {}
+    for move in pokemon_data.get('moves', []):
+        for details in move.get('version_group_details', []):
+            if details['move_learn_method']['name'] != method:
+                continue
+            by_group.setdefault(details['version_group']['name'], []).append(
+                (details['level_learned_at'], move['move']['name'])
+            )
+
+    if not by_group:
+        return None, []
+    if version_group not in by_group:
+        # Payloads list version groups oldest first
+        version_group = list(by_group)[-1]
+    return version_group, sorted(by_group[version_group])
+
+
+def version_groups(pokemon_data, method='level-up'):
+    groups = {}
+    for move in pokemon_data.get('moves', []):
+        for details in move.get('version_group_details', []):
+            if details['move_learn_method']['name'] == method:
+                groups.setdefault(details['version_group']['name'], None)
+    return list(groups)
+
+
+class MoveDatabase:
+    """
+    Every move summary the bot has seen, held in memory and persisted to a JSON file.
+
+    Missing moves are fetched with bounded concurrency, so after the first
+    warm-up the Moves view never waits on PokeAPI.
+    """
+
+    def __init__(self, file_path='Data/pokemon/moves.json', max_concurrency=8, save_delay=5):
+        self.file_path = file_path
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.save_delay = save_delay
+        self.save_task = None
+        self.moves = {}
+        if os.path.exists(file_path):
+            try:
+                with open(file_path, 'r') as file:
+                    self.moves = json.load(file)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.error(f"Could not load {file_path}: {e}")
+
+    def __contains__(self, name):
+        return name in self.moves
+
+    def get(self, name):
+        return self.moves.get(name)
+
+    async def fetch(self, name):
+        async with self.semaphore:
+            data = await pokeapi.get(f"move/{name}")
+        if data is not None:
+            self.moves[name] = slim_move(data)
+        return self.moves.get(name)
+
+    async def ensure(self, names):
+        """Fetches whichever of `names` are not known yet, returns how many were added."""
+        missing = [name for name in dict.fromkeys(names) if name not in self.moves]
+        if not missing:
+            return 0
+        await asyncio.gather(*(self.fetch(name) for name in missing))
+        self.schedule_save()
+        return len(missing)
+
+    async def populate(self):
+        """Warms the database with every move PokeAPI knows about."""
+        listing = await pokeapi.get("move?limit=10000")
+        if listing is not None:
+            names = [result['name'] for result in listing['results']]
+        elif pokeapi.bundle is not None:
+            # Bundles built before the listing was stored still hold every move/<name>
+            names = await asyncio.to_thread(pokeapi.bundle.names, "move")
+        else:
+            logger.error("Could not fetch the move list from PokeAPI")
+            return 0
+        added = await self.ensure(names)
+        logger.info(f"Move database ready with {len(self.moves)} moves ({added} fetched)")
+        return added
+
+    def schedule_save(self):
+        if self.save_task is None or self.save_task.done():
+            self.save_task = asyncio.create_task(self._save_later())
+
+    async def _save_later(self):
+        await asyncio.sleep(self.save_delay)
+        await self.save()
+
+    def _write(self, moves):
+        temp_path = self.file_path + '.tmp'
+        with open(temp_path, 'w') as file:
+            json.dump(moves, file, separators=(',', ':'))
+        os.replace(temp_path, self.file_path)
+
+    async def save(self):
+        await asyncio.to_thread(self._write, dict(self.moves))
+
+
+move_db = MoveDatabase()
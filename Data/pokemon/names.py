@@ -0,0 +1,162 @@
+import csv
+import bisect
+import unicodedata
+
+from Data.pokemon.pokedex import pokedex
+
+
+# Columns of pokemon_description.csv that hold a name for the row, in priority order.
+# When two rows share an alias the first column (and then the first row) wins.
+NAME_COLUMNS = ('slug', 'name.en', 'name.en2', 'name.ja_r', 'name.ja_t', 'name.ja', 'name.de', 'name.fr')
+
+# Characters that people leave out or type differently ("Mr. Mime", "Farfetch’d", "Type: Null")
+STRIP_CHARS = str.maketrans('', '', ".'’‘`:!?,()")
+
+
+def normalize_name(name):
+    """Normalizes a Pokémon name so different spellings of the same alias compare equal."""
+    name = unicodedata.normalize('NFKC', str(name)).casefold().strip()
+    name = name.translate(STRIP_CHARS)
+    name = '-'.join(name.replace('_', ' ').replace('-', ' ').split())
+
+    # Drop accents ("Flabébé" -> "flabebe") but leave non latin scripts untouched
+    folded = ''.join(c for c in unicodedata.normalize('NFKD', name) if not unicodedata.combining(c))
+    return folded if folded.isascii() else name
+
+
+def levenshtein(a, b, max_distance=None):
+    """Edit distance between two strings, giving up early once max_distance is exceeded."""
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    if max_distance is not None and len(a) - len(b) > max_distance:
+        return max_distance + 1
+
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        current = [i]
+        for j, cb in enumerate(b, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+
+class PokemonNameIndex:
+    """
+    Precompiled lookup tables over every name in the Pokédex CSV.
+
+    - aliases: normalized alias -> slug (exact resolution, any language)
+    - sorted_aliases: sorted alias list used as a prefix table for autocomplete
+    - deletes: SymSpell style delete index used for "did you mean" suggestions
+    """
+
+    def __init__(self, rows, max_distance=2, prefix_length=7):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.aliases = {}
+        self.alias_rank = {}
+        self.display_names = {}
+        self.is_form = {}
+        self.deletes = {}
+
+        for row in rows:
+            slug = row['slug'].strip().lower()
+            if not slug:
+                continue
+            self.display_names.setdefault(slug, row.get('name.en') or slug.replace('-', ' ').title())
+            # Alternate forms carry their own id but share the species' dex number
+            self.is_form.setdefault(slug, row.get('id') != row.get('dex_number'))
+            for rank, column in enumerate(NAME_COLUMNS):
+                value = row.get(column)
+                if value:
+                    self.add_alias(value, slug, rank)
+
+        self.sorted_aliases = sorted(self.aliases)
+        for alias in self.aliases:
+            for variant in self._deletes(alias[:self.prefix_length]):
+                self.deletes.setdefault(variant, []).append(alias)
+
+    @classmethod
+    def from_csv(cls, file_path='Data/pokemon/pokemon_description.csv', **kwargs):
+        with open(file_path, mode='r', encoding='utf-8') as csv_file:
+            return cls(csv.DictReader(csv_file), **kwargs)
+
+    def add_alias(self, name, slug, rank=0):
+        alias = normalize_name(name)
+        if not alias:
+            return
+        # "mrmime" / "tapu koko" -> "tapukoko" style spellings without separators
+        for key in {alias, alias.replace('-', '')}:
+            if rank < self.alias_rank.get(key, len(NAME_COLUMNS)):
+                self.aliases[key] = slug
+                self.alias_rank[key] = rank
+
+    def _deletes(self, word):
+        """All strings reachable from word by removing up to max_distance characters."""
+        results = {word}
+        frontier = {word}
+        for _ in range(self.max_distance):
+            next_frontier = set()
+            for item in frontier:
+                for i in range(len(item)):
+                    next_frontier.add(item[:i] + item[i + 1:])
+            results.update(next_frontier)
+            frontier = next_frontier
+        return results
+
+    def __contains__(self, name):
+        return self.resolve(name) is not None
+
+    def __len__(self):
+        return len(self.display_names)
+
+    def resolve(self, name):
+        """Returns the canonical slug for any known alias, or None."""
+        alias = normalize_name(name)
+        return self.aliases.get(alias) or self.aliases.get(alias.replace('-', ''))
+
+    def display_name(self, slug):
+        return self.display_names.get(slug, slug.replace('-', ' ').title())
+
+    def complete(self, prefix, limit=25):
+        """Returns up to `limit` (display name, slug) pairs whose aliases start with prefix."""
+        prefix = normalize_name(prefix)
+        matches = {}
+        start = bisect.bisect_left(self.sorted_aliases, prefix)
+        for alias in self.sorted_aliases[start:]:
+            if not alias.startswith(prefix) or len(matches) >= limit * 8:
+                break
+            slug = self.aliases[alias]
+            rank = (self.alias_rank[alias], len(alias))
+            matches[slug] = min(rank, matches.get(slug, rank))
+
+        # Base species before forms, then English names before other languages
+        ranked = sorted(matches, key=lambda slug: (self.is_form.get(slug, False), matches[slug], slug))
+        return [(self.display_name(slug), slug) for slug in ranked[:limit]]
+
+    def suggest(self, name, limit=5):
+        """Returns up to `limit` slugs whose aliases are within max_distance edits of name."""
+        query = normalize_name(name)
+        if not query:
+            return []
+
+        candidates = set()
+        for variant in self._deletes(query[:self.prefix_length]):
+            candidates.update(self.deletes.get(variant, ()))
+
+        scored = {}
+        for alias in candidates:
+            distance = levenshtein(query, alias, self.max_distance)
+            if distance <= self.max_distance:
+                slug = self.aliases[alias]
+                if distance < scored.get(slug, self.max_distance + 1):
+                    scored[slug] = distance
+
+        return sorted(scored, key=lambda slug: (scored[slug], slug))[:limit]
+
+
+# Built once from the shared Pokédex when the module is first imported (bot startup)
+pokemon_names = PokemonNameIndex(pokedex.rows())
@@ -0,0 +1,194 @@
+import os
+import json
+import time
+import zlib
+import sqlite3
+import asyncio
+import logging
+import threading
+
+import aiohttp
+
+from Data.pokemon.bundle import DexBundle
+
+
+logger = logging.getLogger(__name__)
+
+POKEAPI_URL = "https://pokeapi.co/api/v2/"
+
+
+class PokeAPIError(Exception):
+    """A request that got no definitive answer (timeout, 5xx, bad body), as opposed to a 404."""
+
+    def __init__(self, url, reason, cached=None):
+        super().__init__(f"PokeAPI request to {url} failed: {reason}")
+        self.cached = cached
+
+
+class PokeAPICache:
+    """
+    Persistent SQLite response cache.
+
+    One row per URL holding the compressed body (or NULL for a cached 404),
+    the validators PokeAPI sent with it and when it was last confirmed fresh.
+    """
+
+    def __init__(self, db_file='Data/pokemon/pokeapi_cache.db'):
+        os.makedirs(os.path.dirname(db_file), exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    body BLOB
+                )
+            ''')
+
+    def get(self, url):
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT etag, last_modified, fetched_at, body FROM responses WHERE url = ?', (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, fetched_at, body = row
+        data = json.loads(zlib.decompress(body)) if body is not None else None
+        return {'etag': etag, 'last_modified': last_modified, 'fetched_at': fetched_at, 'data': data}
+
+    def set(self, url, data, etag=None, last_modified=None):
+        body = zlib.compress(json.dumps(data, separators=(',', ':')).encode()) if data is not None else None
+        with self.lock, self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO responses (url, etag, last_modified, fetched_at, body) VALUES (?, ?, ?, ?, ?)',
+                (url, etag, last_modified, time.time(), body)
+            )
+
+    def touch(self, url):
+        with self.lock, self.conn:
+            self.conn.execute('UPDATE responses SET fetched_at = ? WHERE url = ?', (time.time(), url))
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+class PokeAPIClient:
+    """
+    Non-blocking PokeAPI client.
+
+    - Responses are kept in a persistent cache and served without a request while younger than `ttl`
+    - Stale entries are revalidated with If-None-Match / If-Modified-Since (a 304 costs no body)
+    - Concurrent requests for the same URL share a single in-flight request
+    - At most `max_concurrency` requests are on the wire at once
+    - A built offline bundle answers before any of the above; in offline mode nothing goes to the network
+    """
+
+    def __init__(self, cache=None, ttl=7 * 24 * 3600, missing_ttl=3600, max_concurrency=10, timeout=15, bundle=None, offline=False):
+        self.cache = cache or PokeAPICache()
+        self.bundle = bundle
+        self.offline = offline
+        self.ttl = ttl
+        self.missing_ttl = missing_ttl
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.session = None
+        self.inflight = {}
+
+    @staticmethod
+    def url(path):
+        """Accepts a full URL or a path relative to the API root ("pokemon/25")."""
+        if path.startswith('http'):
+            return path
+        path, _, query = str(path).partition('?')
+        url = POKEAPI_URL + path.strip('/').lower() + '/'
+        return f"{url}?{query}" if query else url
+
+    async def get_session(self):
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(timeout=self.timeout)
+        return self.session
+
+    async def get(self, path, strict=False):
+        """
+        Returns the decoded JSON for a resource, or None if it does not exist or cannot be fetched.
+
+        With strict=True None means PokeAPI answered 404, and a failed request
+        with nothing cached raises PokeAPIError instead.
+        """
+        url = self.url(path)
+        task = self.inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(url))
+            self.inflight[url] = task
+            task.add_done_callback(lambda _: self.inflight.pop(url, None))
+        try:
+            # Shield the shared request so one cancelled caller does not cancel it for everyone
+            return await asyncio.shield(task)
+        except PokeAPIError as e:
+            # Serve stale data rather than nothing when PokeAPI is unreachable
+            if e.cached is not None:
+                return e.cached['data']
+            if strict:
+                raise
+            return None
+
+    async def get_many(self, *paths, strict=False):
+        """Fetches independent resources concurrently, results in the same order as paths."""
+        return await asyncio.gather(*(self.get(path, strict) for path in paths))
+
+    async def _fetch(self, url):
+        if self.bundle is not None:
+            found, data = await asyncio.to_thread(self.bundle.get, url)
+            if found:
+                return data
+
+        cached = await asyncio.to_thread(self.cache.get, url)
+        if self.offline:
+            return cached['data'] if cached else None
+        if cached is not None:
+            ttl = self.ttl if cached['data'] is not None else self.missing_ttl
+            if time.time() - cached['fetched_at'] < ttl:
+                return cached['data']
+
+        headers = {}
+        if cached is not None and cached['etag']:
+            headers['If-None-Match'] = cached['etag']
+        if cached is not None and cached['last_modified']:
+            headers['If-Modified-Since'] = cached['last_modified']
+
+        try:
+            session = await self.get_session()
+            async with self.semaphore:
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304 and cached is not None:
+                        await asyncio.to_thread(self.cache.touch, url)
+                        return cached['data']
+                    if response.status == 404:
+                        await asyncio.to_thread(self.cache.set, url, None)
+                        return None
+                    if response.status != 200:
+                        logger.error(f"PokeAPI request to {url} failed with status code {response.status}")
+                        raise PokeAPIError(url, f"status code {response.status}", cached)
+                    data = await response.json(content_type=None)
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+        except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError) as e:
+            logger.error(f"PokeAPI request to {url} failed: {e}")
+            raise PokeAPIError(url, e, cached) from e
+
+        await asyncio.to_thread(self.cache.set, url, data, etag, last_modified)
+        return data
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+
+# Shared by every cog and view so they reuse one session, one cache and one set of in-flight requests.
+# Build the bundle with `python -m Data.pokemon.bundle`, then set DEX_MODE=offline to never touch the network.
+pokeapi = PokeAPIClient(bundle=DexBundle.open(), offline=os.getenv('DEX_MODE', '').lower() == 'offline')
@@ -0,0 +1,101 @@
+import csv
+
+
+# Column types of pokemon_description.csv, anything not listed is kept as a string
+INT_COLUMNS = (
+    'id', 'dex_number', 'abundance', 'gender_rate', 'height', 'weight', 'evo.from',
+    'base.hp', 'base.atk', 'base.def', 'base.satk', 'base.sdef', 'base.spd',
+    'evo.mega', 'evo.mega_x', 'evo.mega_y',
+)
+BOOL_COLUMNS = (
+    'enabled', 'catchable', 'has_gender_differences', 'mythical', 'legendary', 'ultra_beast', 'event', 'is_form',
+)
+INT_LIST_COLUMNS = ('evo.to',)
+
+
+def _parse(column, value):
+    if column in INT_COLUMNS:
+        return int(value) if value else None
+    if column in BOOL_COLUMNS:
+        return value == '1'
+    if column in INT_LIST_COLUMNS:
+        return tuple(int(item) for item in value.split())
+    return value
+
+
+class Pokedex:
+    """
+    Read-only, columnar copy of pokemon_description.csv loaded once at startup.
+
+    Every column is a typed list indexed by row number, with hash indexes for
+    O(1) lookup by id, dex number and slug.
+    """
+
+    def __init__(self, rows):
+        self.columns = {}
+        self.by_id = {}
+        self.by_slug = {}
+        self.by_dex_number = {}
+
+        for index, row in enumerate(rows):
+            for column, value in row.items():
+                self.columns.setdefault(column, []).append(_parse(column, value.strip()))
+
+            pokemon_id = self.columns['id'][index]
+            slug = self.columns['slug'][index].lower()
+            self.by_id.setdefault(pokemon_id, index)
+            self.by_slug.setdefault(slug, index)
+            self.by_dex_number.setdefault(self.columns['dex_number'][index], []).append(index)
+
+    @classmethod
+    def from_csv(cls, file_path='Data/pokemon/pokemon_description.csv'):
+        with open(file_path, mode='r', encoding='utf-8') as csv_file:
+            return cls(csv.DictReader(csv_file))
+
+    def __len__(self):
+        return len(self.columns.get('id', ()))
+
+    def __contains__(self, key):
+        return self.index_of(key) is not None
+
+    def index_of(self, key):
+        """Row number for an id (int or numeric string) or a slug, or None."""
+        if isinstance(key, int):
+            return self.by_id.get(key)
+        key = str(key).strip().lower()
+        if key.isdigit():
+            return self.by_id.get(int(key))
+        return self.by_slug.get(key)
+
+    def value(self, key, column, default=None):
+        index = self.index_of(key)
+        if index is None:
+            return default
+        value = self.columns[column][index]
+        return default if value is None else value
+
+    def row(self, index):
+        """Materializes one row as a dict of typed values."""
+        return {column: values[index] for column, values in self.columns.items()}
+
+    def rows(self):
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def get(self, key):
+        index = self.index_of(key)
+        return None if index is None else self.row(index)
+
+    def forms_of(self, dex_number):
+        """Every row (base species and alternate forms) sharing a dex number."""
+        return [self.row(index) for index in self.by_dex_number.get(int(dex_number), [])]
+
+    def description(self, key, default="Pokémon ID not found"):
+        return self.value(key, 'description', default)
+
+    def region(self, key):
+        return self.value(key, 'region') or None
+
+
+# Loaded once when the module is first imported (bot startup)
+pokedex = Pokedex.from_csv()
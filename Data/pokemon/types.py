@@ -0,0 +1,127 @@
+import os
+import json
+import asyncio
+
+import numpy as np
+
+from Data.pokemon.pokedex import pokedex
+
+
+# PokeAPI type ids 1-18, the order of the matrix rows (attacker) and columns (defender)
+TYPES = (
+    'normal', 'fighting', 'flying', 'poison', 'ground', 'rock', 'bug', 'ghost', 'steel',
+    'fire', 'water', 'grass', 'electric', 'psychic', 'ice', 'dragon', 'dark', 'fairy',
+)
+TYPE_INDEX = {name: index for index, name in enumerate(TYPES)}
+
+# The committed file was written by hand from the published Gen 6+ chart and checked cell by cell
+# against it (51 super effective, 61 not very effective, 8 immune); run the build step below to
+# replace it with PokeAPI's damage relations
+TYPE_CHART_FILE = 'Data/pokemon/type_chart.json'
+
+
+class TypeChart:
+    """
+    18x18 type effectiveness matrix, matrix[attacker, defender] -> damage multiplier.
+
+    A 19th all-ones column stands in for "no second type" so single and dual
+    typings (and every Pokémon at once) reduce to one fancy-indexed product.
+    """
+
+    def __init__(self, matrix):
+        self.matrix = np.asarray(matrix, dtype=np.float32)
+        self.padded = np.hstack([self.matrix, np.ones((len(TYPES), 1), dtype=np.float32)])
+        self.none_index = len(TYPES)
+
+    @classmethod
+    def load(cls, file_path=TYPE_CHART_FILE):
+        with open(file_path, 'r') as file:
+            data = json.load(file)
+        if tuple(data['types']) != TYPES:
+            raise ValueError(f"{file_path} was built for a different type order, rebuild it")
+        return cls(data['matrix'])
+
+    def _columns(self, types):
+        indexes = [TYPE_INDEX[t.lower()] for t in types if t and t.lower() in TYPE_INDEX][:2]
+        return (indexes + [self.none_index, self.none_index])[:2]
+
+    def defense(self, types):
+        """Multiplier of every attacking type against a single or dual typing, shape (18,)."""
+        first, second = self._columns(types)
+        return self.padded[:, first] * self.padded[:, second]
+
+    def matchups(self, types):
+        """Attacking types grouped by how much damage they deal to the typing."""
+        multipliers = self.defense(types)
+        return {
+            'double_weaknesses': [TYPES[i] for i in np.flatnonzero(multipliers == 4)],
+            'weaknesses': [TYPES[i] for i in np.flatnonzero(multipliers == 2)],
+            'resistances': [TYPES[i] for i in np.flatnonzero((multipliers > 0) & (multipliers < 1))],
+            'immunities': [TYPES[i] for i in np.flatnonzero(multipliers == 0)],
+        }
+
+    def strengths(self, types):
+        """Defending types that at least one of the typing's own attack types hits super effectively."""
+        rows = [TYPE_INDEX[t.lower()] for t in types if t and t.lower() in TYPE_INDEX]
+        if not rows:
+            return []
+        return [TYPES[i] for i in np.flatnonzero((self.matrix[rows] > 1).any(axis=0))]
+
+    def defense_table(self, first_types, second_types=None):
+        """
+        Vectorized defense() for many typings at once.
+
+        Takes two equally long arrays of type indexes (-1 or None for no second type)
+        and returns a (len, 18) array of incoming multipliers.
+        """
+        first = np.asarray(first_types, dtype=np.int64)
+        if second_types is None:
+            second = np.full_like(first, self.none_index)
+        else:
+            second = np.asarray([self.none_index if t is None or t < 0 else t for t in second_types], dtype=np.int64)
+        return (self.padded[:, first] * self.padded[:, second]).T
+
+
+def pokedex_defense_table(chart):
+    """(pokedex row count, 18) incoming multipliers for every Pokémon in the Pokédex."""
+    first = [TYPE_INDEX.get((t or '').lower(), chart.none_index) for t in pokedex.columns['type.0']]
+    second = [TYPE_INDEX.get((t or '').lower(), chart.none_index) for t in pokedex.columns['type.1']]
+    return chart.defense_table(first, second)
+
+
+async def build_type_chart(file_path=TYPE_CHART_FILE):
+    """Build step: fetches every type's damage relations from PokeAPI and writes the matrix."""
+    from Data.pokemon.pokeapi import pokeapi
+
+    relations = await pokeapi.get_many(*(f"type/{name}" for name in TYPES))
+    matrix = [[1.0] * len(TYPES) for _ in TYPES]
+    for attacker, data in zip(TYPES, relations):
+        if data is None:
+            raise RuntimeError(f"Could not fetch damage relations for {attacker}")
+        damage = data['damage_relations']
+        for key, multiplier in (('double_damage_to', 2.0), ('half_damage_to', 0.5), ('no_damage_to', 0.0)):
+            for defender in damage[key]:
+                if defender['name'] in TYPE_INDEX:
+                    matrix[TYPE_INDEX[attacker]][TYPE_INDEX[defender['name']]] = multiplier
+    await pokeapi.close()
+
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, 'w') as file:
+        json.dump({'types': list(TYPES), 'matrix': matrix}, file)
+    print(f"Type chart written to {file_path}")
+
+
+# Loaded once at startup, the file ships with the repo and is rebuilt with `python -m Data.pokemon.types`
+# None only while the chart has not been built yet; the Pokémon cog refuses to load without it
+type_chart = TypeChart.load() if os.path.exists(TYPE_CHART_FILE) else None
+
+
+def require_type_chart():
+    """The loaded chart, or a clear error naming the build step instead of a later AttributeError."""
+    if type_chart is None:
+        raise RuntimeError(f"{TYPE_CHART_FILE} is missing, build it with `python -m Data.pokemon.types`")
+    return type_chart
+
+
+if __name__ == "__main__":
+    asyncio.run(build_type_chart())
@@ -0,0 +1,116 @@
+import logging
+
+from Data.quest_matcher import compile_quest
+
+
+logger = logging.getLogger(__name__)
+
+
+class ActiveQuestIndex:
+    """
+    In-memory table of every member's open quests, guild -> channel -> user -> {quest_id: quest}.
+
+    Quest_Checker looks a message up here before touching the database, so
+    messages in channels without a quest for their author cost one dict lookup.
+    Quest_Data keeps it in step with every quest write; until the first
+    warm-up has finished `ready` is False and callers read from Mongo instead.
+    """
+
+    def __init__(self):
+        self.guilds = {}
+        # guild -> user -> {quest_id: channel_id}, so one member's quests are found without a guild scan
+        self.locations = {}
+        self.ready = False
+
+    @staticmethod
+    def _channel(quest):
+        try:
+            return int(quest.get('channel_id'))
+        except (TypeError, ValueError):
+            return None
+
+    def quests_for(self, guild_id, channel_id, user_id):
+        """Open quests of a user bound to a channel, an empty list for nearly every message."""
+        channels = self.guilds.get(str(guild_id))
+        if not channels:
+            return []
+        users = channels.get(int(channel_id))
+        if not users:
+            return []
+        quests = users.get(str(user_id))
+        return list(quests.values()) if quests else []
+
+    def add(self, guild_id, user_id, quest):
+        channel_id = self._channel(quest)
+        if channel_id is None:
+            return
+        guild_id, user_id = str(guild_id), str(user_id)
+        # A quest re-added with another channel must not stay listed under the old one
+        self.remove(guild_id, user_id, quest['quest_id'])
+        users = self.guilds.setdefault(guild_id, {}).setdefault(channel_id, {})
+        users.setdefault(user_id, {})[quest['quest_id']] = quest
+        self.locations.setdefault(guild_id, {}).setdefault(user_id, {})[quest['quest_id']] = channel_id
+        if quest.get('method') == 'message' and isinstance(quest.get('content'), str):
+            # Matched on every message in the channel, so normalize it now rather than then
+            compile_quest(quest['content'])
+
+    def load(self, guild_id, user_id, quests):
+        """Replaces everything indexed for a member with their stored quest list."""
+        self.clear_user(guild_id, user_id)
+        for quest in quests or []:
+            self.add(guild_id, user_id, quest)
+
+    def _unlink(self, guild_id, channel_id, user_id, quest_id):
+        """Drops one quest from the channel table, pruning emptied levels."""
+        channels = self.guilds.get(guild_id)
+        users = channels.get(channel_id) if channels else None
+        quests = users.get(user_id) if users else None
+        if quests is None:
+            return
+        quests.pop(quest_id, None)
+        if not quests:
+            del users[user_id]
+            if not users:
+                del channels[channel_id]
+                if not channels:
+                    del self.guilds[guild_id]
+
+    def remove(self, guild_id, user_id, quest_id):
+        guild_id, user_id = str(guild_id), str(user_id)
+        members = self.locations.get(guild_id)
+        located = members.get(user_id) if members else None
+        if not located or quest_id not in located:
+            return
+        self._unlink(guild_id, located.pop(quest_id), user_id, quest_id)
+        if not located:
+            del members[user_id]
+            if not members:
+                del self.locations[guild_id]
+
+    def remove_quest(self, guild_id, quest_id):
+        """Drops a quest from every member of the guild."""
+        for user_id in list(self.locations.get(str(guild_id), {})):
+            self.remove(guild_id, user_id, quest_id)
+
+    def clear_user(self, guild_id, user_id):
+        for quest_id in list(self.locations.get(str(guild_id), {}).get(str(user_id), {})):
+            self.remove(guild_id, user_id, quest_id)
+
+    def clear_guild(self, guild_id):
+        self.guilds.pop(str(guild_id), None)
+        self.locations.pop(str(guild_id), None)
+
+    def set_progress(self, guild_id, user_id, quest_id, progress):
+        guild_id, user_id = str(guild_id), str(user_id)
+        channel_id = self.locations.get(guild_id, {}).get(user_id, {}).get(quest_id)
+        if channel_id is None:
+            return
+        quest = self.guilds[guild_id][channel_id][user_id].get(quest_id)
+        if quest is not None:
+            quest['progress'] = progress
+
+    def __len__(self):
+        return sum(len(located) for members in self.locations.values() for located in members.values())
+
+
+active_quests = ActiveQuestIndex()
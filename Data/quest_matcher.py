@@ -0,0 +1,158 @@
+import re
+import functools
+from collections import Counter
+
+from fuzzywuzzy import fuzz
+
+
+MATCH_THRESHOLD = 88
+# The C edit distance beats a Python histogram pass on short pairs, below this many cells it runs directly
+HISTOGRAM_MIN_CELLS = 2500
+PLACEHOLDER = '{member}'
+
+_WHITESPACE = re.compile(r'\s+')
+_MENTION = re.compile(r'<@!?(\d+)>')
+
+
+def normalize(text):
+    return _WHITESPACE.sub(' ', text.strip()).lower()
+
+
+class CompiledQuest:
+    """A message quest's text normalized once, with what the length/histogram bound needs."""
+
+    __slots__ = ('template', 'has_member', 'placeholders', 'static_length', 'static_histogram')
+
+    def __init__(self, content):
+        self.template = normalize(content)
+        self.placeholders = self.template.count(PLACEHOLDER)
+        self.has_member = PLACEHOLDER in content
+        static = self.template.replace(PLACEHOLDER, '')
+        self.static_length = len(static)
+        self.static_histogram = Counter(static)
+
+    def text(self, mention):
+        """The normalized quest text as the message would have to read, {member} filled when possible."""
+        if mention is None or not self.placeholders:
+            return self.template
+        return self.template.replace(PLACEHOLDER, mention)
+
+
+@functools.lru_cache(maxsize=4096)
+def compile_quest(content):
+    return CompiledQuest(content)
+
+
+class MessageText:
+    """A message's normalized text, its length, character histogram and first mention, computed once."""
+
+    __slots__ = ('text', 'length', 'mention', '_histogram')
+
+    def __init__(self, content):
+        member_ids = _MENTION.findall(content)
+        self.mention = f'<@{member_ids[0]}>' if member_ids else None
+        self.text = normalize(content)
+        self.length = len(self.text)
+        self._histogram = None
+
+    @property
+    def histogram(self):
+        # Most messages are ruled out by length alone and never need it
+        if self._histogram is None:
+            self._histogram = Counter(self.text)
+        return self._histogram
+
+
+def similarity_bound(compiled, message, threshold=MATCH_THRESHOLD):
+    """
+    Upper bound of fuzz.ratio for this pair, in percent.
+
+    ratio is 2 * matches / (len_a + len_b) and matching characters can not
+    outnumber the characters the two strings have in common, so the histogram
+    overlap bounds it without running the edit distance. The histogram is only
+    consulted for long pairs the cheaper length bound still allows.
+    """
+    quest_length = compiled.static_length + compiled.placeholders * len(message.mention or PLACEHOLDER)
+    total = quest_length + message.length
+    if not total:
+        return 100
+    length_bound = 200 * min(quest_length, message.length) / total
+    if length_bound < threshold - 0.5 or quest_length * message.length < HISTOGRAM_MIN_CELLS:
+        return length_bound
+
+    quest_histogram = compiled.static_histogram
+    if compiled.placeholders:
+        quest_histogram = quest_histogram.copy()
+        for char in message.mention or PLACEHOLDER:
+            quest_histogram[char] += compiled.placeholders
+    common = sum(min(count, message.histogram[char]) for char, count in quest_histogram.items())
+    return 200 * common / total
+
+
+def match_quests(content, quests, threshold=MATCH_THRESHOLD):
+    """
+    Message quests among `quests` whose text the message matches at `threshold` or above.
+
+    The message is normalized once for all quests. A pair whose bound already
+    rules out the threshold skips the Levenshtein computation.
+    """
+    message = MessageText(content)
+    matched = []
+    for quest in quests:
+        compiled = compile_quest(quest['content'])
+        # fuzz.ratio rounds to the nearest integer, so 87.5 still reaches 88
+        if similarity_bound(compiled, message, threshold) < threshold - 0.5:
+            continue
+        if fuzz.ratio(message.text, compiled.text(message.mention)) >= threshold:
+            matched.append(quest)
+    return matched
+
+
+def naive_match(content, quest_content, threshold=MATCH_THRESHOLD):
+    """The per-quest comparison handle_message_quest used to run, kept as the benchmark baseline."""
+    member_ids = re.findall(r'<@!?(\d+)>', content)
+    quest_content = quest_content.replace('{member}', f'<@{member_ids[0]}>' if member_ids else '{member}')
+    normalized_message_content = re.sub(r'\s+', ' ', content.strip()).lower()
+    normalized_quest_content = re.sub(r'\s+', ' ', quest_content.strip()).lower()
+    return fuzz.ratio(normalized_message_content, normalized_quest_content) >= threshold
+
+
+def benchmark(content_file='Data/commands/quest/quest_content.txt', quests_per_user=10, rounds=2000):
+    """Times the naive per-quest loop against match_quests on chat-like messages and checks they agree."""
+    import random
+    import time
+
+    with open(content_file, 'r') as file:
+        templates = [line for line in file if line.strip()]
+    random.seed(0)
+    quests = [{'content': content} for content in random.sample(templates, quests_per_user)]
+    messages = [
+        'lol same', 'anyone up for a game tonight?', 'hi <@1234567890>', 'brb',
+        quests[0]['content'].replace('{member}', '<@1234567890>'),
+        'What is everyone doing this weekend, any plans?', 'gm <@!42>',
+        'ok so here is the whole story, we went to the station and the train was late again so we ' * 3,
+        quests[1]['content'].replace('{member}', '<@42>').upper(),
+    ]
+    workload = [random.choice(messages) for _ in range(rounds)]
+
+    for message in messages:
+        expected = [quest for quest in quests if naive_match(message, quest['content'])]
+        assert match_quests(message, quests) == expected, message
+
+    start = time.perf_counter()
+    for message in workload:
+        [quest for quest in quests if naive_match(message, quest['content'])]
+    naive = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for message in workload:
+        match_quests(message, quests)
+    compiled = time.perf_counter() - start
+
+    print(f"{rounds} messages x {quests_per_user} quests")
+    print(f"naive:    {naive * 1e6 / rounds:8.1f} us/message")
+    print(f"compiled: {compiled * 1e6 / rounds:8.1f} us/message ({naive / compiled:.1f}x)")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,104 @@
+import asyncio
+import logging
+
+from pymongo import ASCENDING, IndexModel, UpdateOne
+
+
+logger = logging.getLogger(__name__)
+
+DB_NAME = 'Quest'
+MEMBERS_COLLECTION = 'Members'
+COUNTERS_COLLECTION = 'Counters'
+
+# One document per (guild, user): {guild_id, user_id, quests: [...], inventory: {...}, stella_points}
+MEMBER_INDEXES = [
+    IndexModel([('guild_id', ASCENDING), ('user_id', ASCENDING)], unique=True, name='guild_user'),
+    IndexModel([('guild_id', ASCENDING), ('quests.quest_id', ASCENDING)], name='guild_quest'),
+    IndexModel([('guild_id', ASCENDING), ('quests.channel_id', ASCENDING)], name='guild_quest_channel'),
+]
+
+
+def member_filter(guild_id, user_id):
+    return {'guild_id': str(guild_id), 'user_id': str(user_id)}
+
+
+def counter_id(guild_id):
+    """Counter document id for a guild's quest IDs, shared by guild and personal quests."""
+    return f"quest:{guild_id}"
+
+
+async def ensure_member_indexes(db):
+    await db[MEMBERS_COLLECTION].create_indexes(MEMBER_INDEXES)
+
+
+def legacy_member_updates(guild_id, members):
+    """
+    Upserts moving one legacy `Servers.members` map into per-member documents.
+
+    Quests are merged by ID into any list the member already has, points are
+    added and the legacy inventory is only used when the member has none yet.
+    The member is marked `legacy_migrated` in the same update, so applying it
+    again (a rerun after an interrupted guild) does not credit points twice.
+    """
+    updates = []
+    for user_id, member in members.items():
+        member = member or {}
+        held_ids = {'$ifNull': ['$quests.quest_id', []]}
+        update = [{'$set': {
+            'inventory': {'$ifNull': ['$inventory', {'$literal': member.get('inventory', {})}]},
+            'quests': {'$concatArrays': [
+                {'$ifNull': ['$quests', []]},
+                {'$filter': {
+                    'input': {'$literal': member.get('quests') or []},
+                    'cond': {'$not': [{'$in': ['$$this.quest_id', held_ids]}]}
+                }}
+            ]},
+            'stella_points': {'$add': [
+                {'$ifNull': ['$stella_points', 0]},
+                {'$cond': [{'$eq': ['$legacy_migrated', True]}, 0, member.get('stella_points', 0)]}
+            ]},
+            'legacy_migrated': True,
+        }}]
+        updates.append(UpdateOne(member_filter(guild_id, user_id), update, upsert=True))
+    return updates
+
+
+async def migrate_members(db, batch_size=1000):
+    """
+    Splits every guild document's embedded `members` map into the Members collection.
+
+    A guild's map is unset only after all of its members were written, so an
+    interrupted run can simply be started again.
+    """
+    await ensure_member_indexes(db)
+    servers = db['Servers']
+    members = db[MEMBERS_COLLECTION]
+    migrated_guilds = migrated_members = 0
+
+    async for guild in servers.find({'members': {'$exists': True}}, {'guild_id': 1, 'members': 1}):
+        guild_id = guild.get('guild_id')
+        if guild_id is None:
+            continue
+        updates = legacy_member_updates(guild_id, guild.get('members') or {})
+        for start in range(0, len(updates), batch_size):
+            await members.bulk_write(updates[start:start + batch_size], ordered=False)
+        await servers.update_one({'_id': guild['_id']}, {'$unset': {'members': ''}})
+        migrated_guilds += 1
+        migrated_members += len(updates)
+        logger.info(f"Migrated {len(updates)} members of guild {guild_id}")
+
+    return migrated_guilds, migrated_members
+
+
+async def main():
+    from Data.database import database
+
+    try:
+        guilds, members = await migrate_members(database[DB_NAME])
+        print(f"Migrated {members} members from {guilds} guilds into {DB_NAME}.{MEMBERS_COLLECTION}")
+    finally:
+        database.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
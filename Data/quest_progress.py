@@ -0,0 +1,89 @@
+import asyncio
+import logging
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+
+from Data.quest_members import member_filter
+
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressBuffer:
+    """
+    Write-behind accumulator for quest progress.
+
+    Increments are summed per (guild, user, quest) and written as `$inc`
+    updates in one bulk_write every `interval` seconds, so a burst of matching
+    messages costs one write and concurrent messages can never move progress
+    backwards. Increments that fail to write are kept for the next flush;
+    after a partial bulk failure only the updates the server rejected are
+    kept, since the others have already been applied.
+    """
+
+    def __init__(self, collection, interval=2.0):
+        self.collection = collection
+        self.interval = interval
+        self.pending = {}
+        self.task = None
+
+    def add(self, guild_id, user_id, quest_id, amount=1):
+        key = (str(guild_id), str(user_id), quest_id)
+        self.pending[key] = self.pending.get(key, 0) + amount
+
+    def discard(self, guild_id, user_id, quest_id):
+        """Forgets pending increments of a quest that is being removed anyway."""
+        self.pending.pop((str(guild_id), str(user_id), quest_id), None)
+
+    async def flush(self, key=None):
+        """Writes every pending increment, or only the given (guild_id, user_id, quest_id)."""
+        if key is not None:
+            key = (str(key[0]), str(key[1]), key[2])
+            batch = {key: self.pending.pop(key)} if key in self.pending else {}
+        else:
+            batch, self.pending = self.pending, {}
+        if not batch:
+            return
+
+        items = list(batch.items())
+        updates = [
+            UpdateOne(
+                dict(member_filter(guild_id, user_id), **{'quests.quest_id': quest_id}),
+                {'$inc': {'quests.$.progress': amount}}
+            )
+            for (guild_id, user_id, quest_id), amount in items
+        ]
+        try:
+            await self.collection.bulk_write(updates, ordered=False)
+            logger.debug(f"Flushed progress for {len(updates)} quests.")
+        except BulkWriteError as e:
+            # Unordered: everything not listed in writeErrors was applied and must not be sent again
+            failed = [error['index'] for error in e.details.get('writeErrors', [])]
+            logger.error(f"Error occurred while flushing quest progress, keeping {len(failed)} of {len(updates)} updates: {e}")
+            for index in failed:
+                self.add(*items[index][0], amount=items[index][1])
+        except PyMongoError as e:
+            logger.error(f"Error occurred while flushing quest progress, keeping {len(updates)} updates: {e}")
+            for batch_key, amount in items:
+                self.add(*batch_key, amount=amount)
+
+    def start(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+    async def stop(self):
+        """Stops the periodic flush and writes whatever is still pending."""
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+        await self.flush()
@@ -0,0 +1,114 @@
+import asyncio
+import hashlib
+import logging
+import functools
+from io import BytesIO
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+
+logger = logging.getLogger(__name__)
+
+
+class PNGCache:
+    """LRU of rendered PNG bytes keyed by a hash of everything the render depends on, bounded in bytes."""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries = OrderedDict()
+
+    @staticmethod
+    def digest(key):
+        return hashlib.sha256(repr(key).encode()).hexdigest()
+
+    def get(self, digest):
+        data = self.entries.get(digest)
+        if data is not None:
+            self.entries.move_to_end(digest)
+        return data
+
+    def set(self, digest, data):
+        if digest in self.entries:
+            self.size -= len(self.entries.pop(digest))
+        self.entries[digest] = data
+        self.size += len(data)
+        while self.size > self.max_bytes and self.entries:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+
+
+class RenderService:
+    """
+    Runs Pillow work off the event loop and hands back PNG bytes.
+
+    Jobs go to a small thread pool: Pillow releases the GIL in its resize,
+    composite and encode paths, and threads share the process-wide asset
+    cache, which worker processes could not. At most `max_workers + max_queue`
+    jobs are admitted at once; a job that cannot start or finish within its
+    timeout raises asyncio.TimeoutError.
+
+    Renders given a `cache_key` are stored by its hash and later calls with an
+    identical key are answered from memory without touching the pool.
+    """
+
+    def __init__(self, max_workers=4, max_queue=16, timeout=30, cache=None):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='render')
+        self.cache = cache or PNGCache()
+        self.slots = asyncio.Semaphore(max_workers + max_queue)
+        self.timeout = timeout
+        self.pending = 0
+
+    @staticmethod
+    def _run(func, args, kwargs):
+        result = func(*args, **kwargs)
+        if isinstance(result, Image.Image):
+            buffer = BytesIO()
+            result.save(buffer, format='PNG')
+            return buffer.getvalue()
+        return result
+
+    async def render(self, func, *args, timeout=None, cache_key=None, **kwargs):
+        """Calls func(*args, **kwargs) on a worker; an Image result is encoded to PNG bytes."""
+        if cache_key is not None:
+            digest = self.cache.digest(cache_key)
+            cached = self.cache.get(digest)
+            if cached is not None:
+                return cached
+            result = await self.render(func, *args, timeout=timeout, **kwargs)
+            if isinstance(result, bytes):
+                self.cache.set(digest, result)
+            return result
+
+        timeout = timeout or self.timeout
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        await asyncio.wait_for(self.slots.acquire(), timeout)
+        self.pending += 1
+        future = loop.run_in_executor(self.executor, functools.partial(self._run, func, args, kwargs))
+
+        def release(_):
+            # The slot is held until the worker is really done, even if the caller stopped waiting
+            self.pending -= 1
+            self.slots.release()
+
+        future.add_done_callback(release)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), max(deadline - loop.time(), 0))
+        except asyncio.TimeoutError:
+            logger.error(f"Render job {getattr(func, '__qualname__', func)} timed out after {timeout}s")
+            raise
+
+    @property
+    def queue_depth(self):
+        """Jobs admitted and not finished yet, running or waiting for a worker."""
+        return self.pending
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+render_service = RenderService()
@@ -0,0 +1,90 @@
+import asyncio
+import logging
+import zlib
+
+
+logger = logging.getLogger(__name__)
+
+
+class KeyedWorkQueue:
+    """
+    Bounded background pipeline with per-key ordering.
+
+    Every job carries a key (a user ID for quest events). Jobs with the same
+    key always go to the same worker and run one after another in submission
+    order, while different keys are processed in parallel by `workers` tasks.
+    When a worker's share of `max_size` is full the job is dropped and
+    counted, so a backlog can never grow without bound. With `max_wait` > 0
+    `submit` first waits up to that many seconds for room; that wait holds up
+    the caller (a gateway event handler for quest events), so it is off by
+    default.
+    """
+
+    def __init__(self, workers=4, max_size=1000, max_wait=0.0, name='work'):
+        self.name = name
+        self.max_wait = max_wait
+        self.queues = [asyncio.Queue(maxsize=max(1, max_size // workers)) for _ in range(workers)]
+        self.tasks = []
+        self.processed = 0
+        self.failed = 0
+        self.dropped = 0
+
+    def _queue_for(self, key):
+        return self.queues[zlib.crc32(str(key).encode()) % len(self.queues)]
+
+    async def submit(self, key, func, *args, **kwargs):
+        """Queues func(*args, **kwargs); returns False if the job was dropped."""
+        queue = self._queue_for(key)
+        job = (func, args, kwargs)
+        try:
+            queue.put_nowait(job)
+        except asyncio.QueueFull:
+            try:
+                if self.max_wait <= 0:
+                    raise asyncio.TimeoutError
+                await asyncio.wait_for(queue.put(job), self.max_wait)
+            except asyncio.TimeoutError:
+                self.dropped += 1
+                logger.warning(f"{self.name} queue full ({self.queue_depth} pending), dropped a job for {key}")
+                return False
+        return True
+
+    async def _worker(self, queue):
+        while True:
+            func, args, kwargs = await queue.get()
+            try:
+                await func(*args, **kwargs)
+                self.processed += 1
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"{self.name} job {getattr(func, '__qualname__', func)} failed: {e}")
+            finally:
+                queue.task_done()
+
+    def start(self):
+        if not self.tasks:
+            self.tasks = [asyncio.create_task(self._worker(queue)) for queue in self.queues]
+
+    async def stop(self, drain_timeout=10):
+        """Lets queued jobs finish for up to drain_timeout seconds, then cancels the workers."""
+        try:
+            await asyncio.wait_for(asyncio.gather(*(queue.join() for queue in self.queues)), drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"{self.name} queue stopped with {self.queue_depth} jobs left")
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
+    @property
+    def queue_depth(self):
+        """Jobs waiting for a worker, across all workers."""
+        return sum(queue.qsize() for queue in self.queues)
+
+    def metrics(self):
+        return {
+            'queue_depth': self.queue_depth,
+            'processed': self.processed,
+            'failed': self.failed,
+            'dropped': self.dropped,
+        }
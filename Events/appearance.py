@@ -1,9 +1,13 @@
 import os
+from io import BytesIO
+
 import discord
 from PIL import Image, ImageDraw
 from discord.ext import commands
 
 from Imports.log_imports import logger
+from Data.assets import assets
+from Data.render import render_service
 import asyncio
 
 class AvatarChanger(commands.Cog):
@@ -11,50 +15,57 @@ class AvatarChanger(commands.Cog):
         self.bot = bot
         self.emojis_folder = 'Data/Emojis'  # Path to the folder containing image files
         self.output_folder = 'Data/Emojis/output'  # Path for output grid images
+        self.rendered_grids = {}  # output filename -> PNG bytes of the last render
+        self.emoji_listing = (None, [])  # (folder mtime, sorted image names)
 
         # Ensure the emojis and output directories exist
         os.makedirs(self.emojis_folder, exist_ok=True)
         os.makedirs(self.output_folder, exist_ok=True)
 
-    async def compose_grid(self, images, output_filename, ctx, grid_index):
-        try:
-            images_per_row = 5  # Number of images per row
-            spacing = 10  # Spacing between images
-            img_width, img_height = 512, 512  # Image size for high resolution
+    def list_emojis(self):
+        """Image files in the emoji folder, sorted; only re-listed when the folder changes."""
+        mtime = os.path.getmtime(self.emojis_folder)
+        if self.emoji_listing[0] != mtime:
+            images = sorted(f for f in os.listdir(self.emojis_folder) if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif')))
+            self.emoji_listing = (mtime, images)
+        return list(self.emoji_listing[1])
 
-            # Calculate total rows needed
-            total_rows = (len(images) + images_per_row - 1) // images_per_row
+    def render_grid(self, images):
+        """Composes the circular emoji thumbnails into one grid image (blocking, runs on the render pool)."""
+        images_per_row = 5  # Number of images per row
+        spacing = 10  # Spacing between images
+        img_width, img_height = 512, 512  # Image size for high resolution
 
-            # Calculate composite image size
-            composite_width = img_width * images_per_row + spacing * (images_per_row - 1)
-            composite_height = img_height * total_rows + spacing * (total_rows - 1)
-            composite_image = Image.new('RGBA', (composite_width, composite_height), color=(255, 255, 255, 0))
+        # Calculate total rows needed
+        total_rows = (len(images) + images_per_row - 1) // images_per_row
 
-            # Paste images onto the composite image with circular masks
-            x_offset, y_offset = 0, 0
-            for i, img_path in enumerate(images):
-                img = Image.open(os.path.join(self.emojis_folder, img_path)).resize((img_width, img_height), Image.LANCZOS)
-                img = img.convert("RGBA")
+        # Calculate composite image size
+        composite_width = img_width * images_per_row + spacing * (images_per_row - 1)
+        composite_height = img_height * total_rows + spacing * (total_rows - 1)
+        composite_image = Image.new('RGBA', (composite_width, composite_height), color=(255, 255, 255, 0))
 
-                # Create a circular mask
-                mask = Image.new('L', (img_width, img_height), 0)
-                draw = ImageDraw.Draw(mask)
-                draw.ellipse((0, 0, img_width, img_height), fill=255)
+        # Paste the circular thumbnails, each one is resized and masked once per file version
+        x_offset, y_offset = 0, 0
+        for i, img_path in enumerate(images):
+            img = assets.circle_thumbnail(os.path.join(self.emojis_folder, img_path), (img_width, img_height))
 
-                # Apply the circular mask to the image
-                img = Image.composite(img, Image.new('RGBA', img.size, (255, 255, 255, 0)), mask)
+            # Position the image in the composite grid
+            composite_image.paste(img, (x_offset, y_offset))
 
-                # Position the image in the composite grid
-                composite_image.paste(img, (x_offset, y_offset))
+            # Update offsets for the next image
+            x_offset += img_width + spacing
+            if (i + 1) % images_per_row == 0:
+                x_offset = 0
+                y_offset += img_height + spacing
 
-                # Update offsets for the next image
-                x_offset += img_width + spacing
-                if (i + 1) % images_per_row == 0:
-                    x_offset = 0
-                    y_offset += img_height + spacing
+        return composite_image
 
-            # Save the composite grid image
-            composite_image.save(os.path.join(self.output_folder, output_filename), "PNG")
+    async def compose_grid(self, images, output_filename, ctx, grid_index):
+        try:
+            # The LANCZOS resizes and masking run on the render pool, not the event loop
+            paths = [os.path.join(self.emojis_folder, img_path) for img_path in images]
+            grid_bytes = await render_service.render(self.render_grid, images, cache_key=('emoji_grid', tuple(images), assets.signature(*paths)))
+            self.rendered_grids[output_filename] = grid_bytes
 
             # Send the grid image with navigation buttons if there are more than 5 images
             if len(images) > 5:
@@ -68,9 +79,9 @@ class AvatarChanger(commands.Cog):
                 next_button.callback = self.create_grid_callback(ctx, grid_index + 1)
                 view.add_item(next_button)
 
-                grid_message = await ctx.send(file=discord.File(os.path.join(self.output_folder, output_filename)), view=view)
+                grid_message = await ctx.send(file=discord.File(BytesIO(grid_bytes), filename=output_filename), view=view)
             else:
-                grid_message = await ctx.send(file=discord.File(os.path.join(self.output_folder, output_filename)))
+                grid_message = await ctx.send(file=discord.File(BytesIO(grid_bytes), filename=output_filename))
 
             # Add reactions for navigation if there are more than 0 images
             if len(images) > 0:
@@ -99,7 +110,7 @@ class AvatarChanger(commands.Cog):
                     grid_index += 1
 
                 # Ensure grid_index stays within valid bounds
-                images = [f for f in os.listdir(self.emojis_folder) if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif'))]
+                images = self.list_emojis()
                 total_images = len(images)
                 total_pages = (total_images + 4) // 5  # Calculate total pages (5 images per page)
 
@@ -142,8 +153,7 @@ class AvatarChanger(commands.Cog):
     async def update_grid_message(self, ctx, grid_index, total_pages):
         # Update the existing grid message with new navigation buttons
         try:
-            images = [f for f in os.listdir(self.emojis_folder) if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif'))]
-            images.sort()  # Sort filenames alphabetically
+            images = self.list_emojis()
 
             images_per_page = 5  # Number of images per page
             img_width, img_height = 256, 256  # Image size for high resolution
@@ -200,8 +210,7 @@ class AvatarChanger(commands.Cog):
     @commands.is_owner()
     async def grid_command(self, ctx):
      try:
-        images = [f for f in os.listdir(self.emojis_folder) if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif'))]
-        images.sort()  # Sort filenames alphabetically
+        images = self.list_emojis()
 
         if not images:
             await ctx.send("No images found in the folder.")
@@ -243,7 +252,7 @@ class AvatarChanger(commands.Cog):
                     embed.set_thumbnail(url="attachment://grid_output.png")
 
                     # Send embed with the grid image as attachment
-                    file = discord.File(os.path.join(self.output_folder, output_filename))
+                    file = discord.File(BytesIO(self.rendered_grids[output_filename]), filename=output_filename)
                     await grid_message.edit(content=None, embed=embed, attachments=[file])
                     await grid_message.clear_reactions()
 
@@ -1,9 +1,15 @@
 import re
-from fuzzywuzzy import fuzz
+import os
+import asyncio
 import logging
 from datetime import datetime, timedelta
 
 from Cogs.quest import Quest_Data
+from Data.channel_activity import channel_activity
+from Data.quest_index import active_quests
+from Data.quest_matcher import compile_quest, match_quests
+from Data.quest_progress import ProgressBuffer
+from Data.work_queue import KeyedWorkQueue
 from Imports.discord_imports import *
 from Data.const import Quest_Progress, error_custom_embed, primary_color, QuestEmbed, Quest_Prompt, Quest_Completed_Embed
 
@@ -13,74 +19,106 @@ class Quest_Checker(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.quest_data = Quest_Data(bot)
+        self.progress_buffer = ProgressBuffer(self.quest_data.members)
+        # Quest events of one user are handled in order, different users in parallel
+        self.event_queue = KeyedWorkQueue(
+            workers=int(os.getenv('QUEST_WORKERS', 4)),
+            max_wait=float(os.getenv('QUEST_QUEUE_MAX_WAIT', 0)),
+            name='Quest event'
+        )
         logger.debug("Quest_Checker initialized")
 
     async def cog_load(self):
-        # Start the background task in the async cog_load method
-        self.process_message_queue.start()
+        self.event_queue.start()
+        self.progress_buffer.start()
+        if not active_quests.ready:
+            asyncio.create_task(self.quest_data.load_active_quests())
+
+    async def cog_unload(self):
+        await self.event_queue.stop()
+        await self.progress_buffer.stop()
+
+    @commands.command(hidden=True)
+    @commands.is_owner()
+    async def quest_queue(self, ctx):
+        """Shows the quest event queue's depth and counters and the unflushed progress."""
+        metrics = self.event_queue.metrics()
+        await ctx.send(
+            f"Quest events: {metrics['queue_depth']} queued, {metrics['processed']} processed, "
+            f"{metrics['failed']} failed, {metrics['dropped']} dropped\n"
+            f"Progress buffer: {len(self.progress_buffer.pending)} quests pending"
+        )
+
+    def has_candidate_quests(self, guild_id, channel_id, user_id):
+        """False only when the warm index proves the user has no quest in this channel."""
+        return not active_quests.ready or bool(active_quests.quests_for(guild_id, channel_id, user_id))
+
+    async def channel_quests(self, guild_id, channel_id, user_id):
+        """The user's quests bound to this channel, from the in-memory index once it is warm."""
+        if active_quests.ready:
+            return active_quests.quests_for(guild_id, channel_id, user_id)
+        quests = await self.quest_data.find_quests_by_user_and_server(user_id, guild_id) or []
+        return [quest for quest in quests if int(quest['channel_id']) == channel_id]
 
     @commands.Cog.listener()
     async def on_message(self, message):
-        if message.author.bot:
+        if message.guild is not None:
+            channel_activity.record(message.guild.id, message.channel.id, None if message.author.bot else message.author.id)
+        if message.author.bot or message.guild is None:
             return
-        
+        if self.has_candidate_quests(message.guild.id, message.channel.id, message.author.id):
+            await self.event_queue.submit(message.author.id, self.process_message, message)
+
+    async def process_message(self, message):
         try:
             guild_id = str(message.guild.id)
             user_id = str(message.author.id)
 
-            quests = await self.quest_data.find_quests_by_user_and_server(user_id, guild_id)
+            quests = await self.channel_quests(guild_id, message.channel.id, user_id)
 
             if not quests:
                 return
 
-            for quest in quests:
-                if quest['action'] == 'send':
-                    if int(quest['channel_id']) == message.channel.id:
-                        if quest['method'] == 'message':
-                            await self.handle_message_quest(quest, message, user_id, guild_id)
-                        elif quest['method'] == 'emoji':
-                            await self.handle_emoji_quest(quest, message, user_id, guild_id)
+            send_quests = [
+                quest for quest in quests
+                if quest['action'] == 'send' and int(quest['channel_id']) == message.channel.id
+            ]
+
+            # All message quests are matched against the message in one pass
+            message_quests = [quest for quest in send_quests if quest['method'] == 'message']
+            for quest in match_quests(message.content, message_quests) if message_quests else []:
+                await self.handle_message_quest(quest, message, user_id, guild_id)
+
+            for quest in send_quests:
+                if quest['method'] == 'emoji':
+                    await self.handle_emoji_quest(quest, message, user_id, guild_id)
         except Exception as e:
             logger.error("An error occurred in on_message:")
             logger.error(e)
 
     async def handle_message_quest(self, quest, message, user_id, guild_id):
-        quest_content = quest['content']  # Quest content with {member}
-
-        member_id_pattern = r'<@!?(\d+)>'
-        message_content = message.content
-        member_ids = re.findall(member_id_pattern, message_content)
-        for member_id in member_ids:
-            message_content = message_content.replace(f'<@{member_id}>', f'<@{member_id}>')  # Ensure mentions are properly formatted
-
-        quest_content_replaced = quest_content.replace('{member}', f'<@{member_ids[0]}>' if member_ids else '{member}')  # Replace {member} with a placeholder for mention
-
-        # Normalize the message content and the quest content for comparison
-        normalized_message_content = re.sub(r'\s+', ' ', message_content.strip()).lower()
-        normalized_quest_content = re.sub(r'\s+', ' ', quest_content_replaced.strip()).lower()
+        """Counts a message already matched to the quest's content by match_quests."""
+        has_member = compile_quest(quest['content']).has_member
 
-        # Use fuzzy matching to compare the quest content with the message content
-        similarity_ratio = fuzz.ratio(normalized_message_content, normalized_quest_content)
+        mentions = [member for member in message.mentions if member.id != message.author.id and not member.bot]
 
-        # Check if the similarity ratio is above a certain threshold (e.g., 88)
-        if similarity_ratio >= 88:
-            mentions = [member for member in message.mentions if member.id != message.author.id and not member.bot]
-
-            if '{member}' in quest_content and not mentions:
-                return
-
-            if '{member}' not in quest_content or (mentions and mentions[0].id != message.author.id and not mentions[0].bot):
-                # Update quest progress
-                quest['progress'] += 1
-                await message.add_reaction('<:anyasus:1244195699331960863>')
-                await self.update_quest_progress(guild_id, user_id, quest['quest_id'], quest['progress'])
+        if has_member and not mentions:
+            return
 
-            if quest['progress'] >= quest['times']:
-                times = quest['times']
-                user = message.author
-                quest_id = quest['quest_id']
-                reward = quest['reward']
-                await self.complete_quest(guild_id, user_id, quest, times, user, quest_id, message, method='sent', reward=reward)
+        if not has_member or (mentions and mentions[0].id != message.author.id and not mentions[0].bot):
+            # Update quest progress
+            quest['progress'] += 1
+            await message.add_reaction('<:anyasus:1244195699331960863>')
+            self.progress_buffer.add(guild_id, user_id, quest['quest_id'])
+
+        if quest['progress'] >= quest['times']:
+            times = quest['times']
+            user = message.author
+            quest_id = quest['quest_id']
+            reward = quest['reward']
+            if await self.complete_quest(guild_id, user_id, quest, times, user, quest_id, message, method='sent', reward=reward):
+                # Completed: increments still buffered for it are moot, on failure they stay and get flushed
+                self.progress_buffer.discard(guild_id, user_id, quest['quest_id'])
                 for _ in range(1):
                     await self.quest_data.add_new_quest(guild_id, message.author)
 
@@ -97,28 +135,32 @@ class Quest_Checker(commands.Cog):
         if quest_emoji in message_emoji_names or quest_emoji in unicode_emojis:
             quest['progress'] += 1
             await message.add_reaction('<:anyasus:1244195699331960863>')
-            await self.update_quest_progress(guild_id, user_id, quest['quest_id'], quest['progress'])
+            self.progress_buffer.add(guild_id, user_id, quest['quest_id'])
 
             if quest['progress'] >= quest['times']:
                 times = quest['times']
                 user = message.author
                 quest_id = quest['quest_id']
                 reward = quest['reward']
-                await self.complete_quest(guild_id, user_id, quest, times, user, quest_id, message, method='sent emoji', reward=reward)
-                for _ in range(1):
-                    await self.quest_data.add_new_quest(guild_id, message.author)
+                if await self.complete_quest(guild_id, user_id, quest, times, user, quest_id, message, method='sent emoji', reward=reward):
+                    self.progress_buffer.discard(guild_id, user_id, quest['quest_id'])
+                    for _ in range(1):
+                        await self.quest_data.add_new_quest(guild_id, message.author)
 
     @commands.Cog.listener()
     async def on_reaction_add(self, reaction, user):
-        if user.bot:
+        if user.bot or reaction.message.guild is None:
             return
+        if self.has_candidate_quests(reaction.message.guild.id, reaction.message.channel.id, user.id):
+            await self.event_queue.submit(user.id, self.process_reaction, reaction, user)
 
+    async def process_reaction(self, reaction, user):
         try:
             message = reaction.message
             guild_id = str(message.guild.id)
             user_id = str(user.id)
 
-            quests = await self.quest_data.find_quests_by_user_and_server(user_id, guild_id)
+            quests = await self.channel_quests(guild_id, message.channel.id, user_id)
 
             if not quests:
                 return
@@ -135,7 +177,7 @@ class Quest_Checker(commands.Cog):
                         if quest_emoji == reaction_emoji:
                             quest['progress'] += 1
                             await message.add_reaction('<:anyasus:1244195699331960863>')
-                            await self.update_quest_progress(guild_id, user_id, quest['quest_id'], quest['progress'])
+                            self.progress_buffer.add(guild_id, user_id, quest['quest_id'])
                             user = await self.bot.fetch_user(user_id)
 
                             if quest['progress'] >= quest['times']:
@@ -143,9 +185,10 @@ class Quest_Checker(commands.Cog):
                                 user = user
                                 quest_id = quest['quest_id']
                                 reward = quest['reward']
-                                await self.complete_quest(guild_id, user_id, quest, times, user, quest_id, message, method='reaction', reward=reward)
-                                for _ in range(1):
-                                    await self.quest_data.add_new_quest(guild_id, user)
+                                if await self.complete_quest(guild_id, user_id, quest, times, user, quest_id, message, method='reaction', reward=reward):
+                                    self.progress_buffer.discard(guild_id, user_id, quest['quest_id'])
+                                    for _ in range(1):
+                                        await self.quest_data.add_new_quest(guild_id, user)
         except Exception as e:
             logger.error("An error occurred in on_reaction_add:")
             logger.error(e)
@@ -153,44 +196,24 @@ class Quest_Checker(commands.Cog):
     async def complete_quest(self, guild_id, user_id, quest, times, user_mention, quest_id, message, method=None, reward='N/A'):
         try:
             logger.debug(f"Completing quest: {quest_id} for user_id: {user_id} in guild_id: {guild_id}")
+            # Pull the quest and credit the reward atomically, a quest can only pay out once
+            balance = await self.quest_data.complete_quest_for_user(guild_id, user_id, quest['quest_id'], quest['reward'])
+            if balance is None:
+                return False
+            logger.debug(f"Quest {quest['quest_id']} deleted for user {user_id} in guild {guild_id}.")
+
             channel = self.bot.get_channel(int(quest['channel_id']))
             if channel:
-                await self.quest_data.add_balance(user_id, guild_id, quest['reward'])
-
-                await self.quest_data.initialize_balance(user_id, guild_id)
-                balance = await self.quest_data.get_balance(user_id, guild_id)
-                balance_with_commas = "{:,}".format(balance)
-                
                 embed = await Quest_Completed_Embed.create_embed(
                     self.bot, quest['content'], channel.mention, times, user_mention, quest_id, method, reward, balance
                 )
                 await channel.send(embed=embed, reference=message)
-                
-            # Add balance to user's account
-
-            await self.quest_data.delete_quest_for_user(guild_id, user_id, quest['quest_id'])
-            logger.debug(f"Quest {quest['quest_id']} deleted for user {user_id} in guild {guild_id}.")
+            return True
 
         except Exception as e:
             logger.error(f"Error occurred while completing quest: {e}")
             traceback.print_exc()
-
-    async def update_quest_progress(self, guild_id, user_id, quest_id, progress):
-        try:
-            logger.debug(f"Updating progress for quest_id: {quest_id} for user_id: {user_id} in guild_id: {guild_id} to progress: {progress}")
-            await self.quest_data.update_quest_progress(guild_id, user_id, quest_id, progress)
-            logger.debug(f"Quest {quest_id} progress updated for user {user_id} in guild {guild_id}.")
-        except Exception as e:
-            logger.error(f"Error occurred while updating quest progress: {e}")
-            traceback.print_exc()
-
-
-    @tasks.loop(seconds=5)
-    async def process_message_queue(self):
-        await self.bot.wait_until_ready()
-        while not self.bot.is_closed():
-            # Perform necessary background tasks here
-            await asyncio.sleep(5)  # Example delay for demonstration
+            return False
 
 async def setup(bot):
     await bot.add_cog(Quest_Checker(bot))
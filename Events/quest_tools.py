@@ -4,10 +4,11 @@ import logging
 import os
 import random
 from datetime import datetime, timedelta
-import motor.motor_asyncio
 from pymongo.errors import PyMongoError
 import redis
 from Cogs.quest import Quest_Data
+from Data.database import database
+from Data.quest_members import MEMBERS_COLLECTION, member_filter
 from Imports.discord_imports import * 
 from datetime import datetime, timedelta, timezone
 
@@ -31,17 +32,9 @@ def timestamp_gen(timestamp: int) -> str:
 class DatabaseManager:
 
     def __init__(self, db_name):
-        # Retrieve the MongoDB URI from environment variables
-        mongo_url = os.getenv('MONGO_URI')
-
-        if not mongo_url:
-            raise ValueError("No MONGO_URI found in environment variables")
-
-        # Initialize MongoDB connection
-        self.mongoConnect = motor.motor_asyncio.AsyncIOMotorClient(mongo_url)
+        self.mongoConnect = database.client
         self.db = self.mongoConnect[db_name]
-        db_name = 'Quest'  # Or set this dynamically based on your setup
-        
+
 
     def get_collection(self, collection_name):
         """Returns a MongoDB collection."""
@@ -51,13 +44,11 @@ class DatabaseManager:
         """Retrieve the stella points balance of a user."""
         logger.debug(f"Fetching balance for user {user_id} in guild {guild_id}")
         try:
-            server_collection = self.db['Servers']
-            user_balance_key = f"members.{user_id}.stella_points"
-            user_data = await server_collection.find_one(
-                {'guild_id': guild_id},
-                {user_balance_key: 1, '_id': 0}
+            user_data = await self.get_collection(MEMBERS_COLLECTION).find_one(
+                member_filter(guild_id, user_id),
+                {'stella_points': 1, '_id': 0}
             )
-            balance = user_data.get('members', {}).get(user_id, {}).get('stella_points', 0)
+            balance = (user_data or {}).get('stella_points', 0)
             logger.info(f"User {user_id} balance fetched: {balance}")
             return balance
         except PyMongoError as e:
@@ -68,10 +59,9 @@ class DatabaseManager:
         """Update the stella points balance of a user."""
         logger.debug(f"Updating balance for user {user_id} in guild {guild_id} to {new_balance}")
         try:
-            server_collection = self.db['Servers']
-            result = await server_collection.update_one(
-                {'guild_id': guild_id},
-                {'$set': {f'members.{user_id}.stella_points': new_balance}}
+            result = await self.get_collection(MEMBERS_COLLECTION).update_one(
+                member_filter(guild_id, user_id),
+                {'$set': {'stella_points': new_balance}}
             )
             if result.modified_count > 0:
                 logger.info(f"Updated balance for user {user_id} in guild {guild_id}. New balance: {new_balance}")
@@ -88,10 +78,9 @@ class DatabaseManager:
         current_balance = await self.get_balance(user_id, guild_id)
 
         # Update the balance by adding stolen points
-        server_collection = self.db['Servers']
-        result = await server_collection.update_one(
-            {'guild_id': guild_id},
-            {'$inc': {f'members.{user_id}.stella_points': stolen_points}}
+        result = await self.get_collection(MEMBERS_COLLECTION).update_one(
+            member_filter(guild_id, user_id),
+            {'$inc': {'stella_points': stolen_points}}
         )
         
         if result.modified_count > 0:
@@ -315,13 +304,10 @@ class ToolHandler:
 
      try:
         # Fetch the user's inventory from the database
-        db = self.quest_data.mongoConnect[self.quest_data.DB_NAME]
-        server_collection = db['Servers']
-
         # Query to find the user and their inventory
-        user_data = await server_collection.find_one(
-            {'guild_id': guild_id, f'members.{user_id}': {'$exists': True}},
-            {f'members.{user_id}.inventory': 1}  # Fetch the inventory only
+        user_data = await self.quest_data.members.find_one(
+            member_filter(guild_id, user_id),
+            {'inventory': 1}  # Fetch the inventory only
         )
         logger.debug(f"user_data is: {user_data}")
 
@@ -329,8 +315,7 @@ class ToolHandler:
             logger.warning(f"No data found for user {user_id} in guild {guild_id}.")
             return False
 
-        # Extract the inventory from the nested structure
-        inventory = user_data.get('members', {}).get(str(user_id), {}).get('inventory', {})
+        inventory = user_data.get('inventory', {})
         logger.debug(f"Inventory: {inventory}")
 
         # Check for the tool in the nested 'tool' section of the inventory
@@ -375,14 +360,10 @@ class ToolHandler:
      logger.debug(f"Removing 1 quantity of {tool} from user {user_id} in guild {guild_id}.")
 
      try:
-        # Connect to the database
-        db = self.quest_data.mongoConnect[self.quest_data.DB_NAME]
-        server_collection = db['Servers']
-
         # Fetch the user's inventory
-        user_data = await server_collection.find_one(
-            {'guild_id': guild_id, f'members.{user_id}': {'$exists': True}},
-            {f'members.{user_id}.inventory': 1}
+        user_data = await self.quest_data.members.find_one(
+            member_filter(guild_id, user_id),
+            {'inventory': 1}
         )
         logger.debug(f"user_data is: {user_data}")
 
@@ -391,7 +372,7 @@ class ToolHandler:
             return False
 
         # Extract the inventory and the tool
-        inventory = user_data.get('members', {}).get(str(user_id), {}).get('inventory', {})
+        inventory = user_data.get('inventory', {})
         tools = inventory.get('tool', {})
         tool_lower = tool.lower()
         matching_tool = next((key for key in tools if key.lower() == tool_lower), None)
@@ -409,10 +390,10 @@ class ToolHandler:
         # Decrement quantity by 1
         new_quantity = current_quantity - 1
         update_query = {
-            f'members.{user_id}.inventory.tool.{matching_tool}.quantity': new_quantity
+            f'inventory.tool.{matching_tool}.quantity': new_quantity
         }
-        await server_collection.update_one(
-            {'guild_id': guild_id, f'members.{user_id}': {'$exists': True}},
+        await self.quest_data.members.update_one(
+            member_filter(guild_id, user_id),
             {'$set': update_query}
         )
         logger.info(f"Decremented {tool} quantity by 1 for user {user_id}. New quantity: {new_quantity}.")
@@ -495,15 +476,12 @@ class ToolBot(commands.Cog):
             # Fetch the message author's inventory (not the mentioned user's inventory)
             guild_id = str(message.guild.id)
             user_id = str(message.author.id)  # Fetching the inventory of the message author
-            db = self.quest_data.mongoConnect[self.quest_data.DB_NAME]
-            server_collection = db['Servers']
-
-            user_data = await server_collection.find_one(
-                {'guild_id': guild_id, f'members.{user_id}': {'$exists': True}},
-                {f'members.{user_id}.inventory.tool'}
+            user_data = await self.quest_data.members.find_one(
+                member_filter(guild_id, user_id),
+                {'inventory.tool': 1}
             )
 
-            inventory = user_data.get('members', {}).get(user_id, {}).get('inventory', {}).get('tool', {})
+            inventory = (user_data or {}).get('inventory', {}).get('tool', {})
 
             # Log the inventory to show what tools are available
             if inventory:
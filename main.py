@@ -7,7 +7,6 @@ import requests
 from aiohttp import web
 
 import pymongo
-from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo.errors import ConfigurationError
 
 # Print loaded environment variables
@@ -24,6 +23,8 @@ from Imports.depend_imports import *
 from Imports.discord_imports import *
 from Imports.log_imports import logger
 from Cogs.pokemon import PokemonPredictor
+from Data.database import database
+from Data.render import render_service
 
 
 class BotSetup(commands.AutoShardedBot):
@@ -38,13 +39,24 @@ class BotSetup(commands.AutoShardedBot):
             shard_count=1,
             shard_reconnect_interval=10
         )
-        self.mongoConnect = None
+        # One client and pool for the whole bot, cogs reach it through Data.database
+        self.database = database
         self.DB_NAME = 'Bot'
         self.COLLECTION_NAME = 'information'
 
+    @property
+    def mongoConnect(self):
+        return self.database.client
+
     async def on_ready(self):
         print(f"\033[92mLogged in as {self.user} (ID: {self.user.id})\033[0m")
 
+    async def close(self):
+        await super().close()
+        # Queued renders and the pool threads must not outlive the bot
+        render_service.shutdown()
+        self.database.close()
+
     async def start_bot(self):
         await self.setup()
         try:
@@ -0,0 +1,47 @@
+from Data.channel_activity import ChannelActivity
+
+
+def test_ranks_by_authors_then_messages():
+    activity = ChannelActivity(window=600, bucket=60)
+    for _ in range(5):
+        activity.record(1, 100, author_id=1, now=0)
+    activity.record(1, 200, author_id=1, now=0)
+    activity.record(1, 200, author_id=2, now=30)
+    activity.record(1, 300, author_id=3, now=30)
+
+    assert activity.ranked(1, now=60) == [(200, 2, 2), (100, 5, 1), (300, 1, 1)]
+
+
+def test_bot_messages_count_without_authors():
+    activity = ChannelActivity(window=600, bucket=60)
+    activity.record(1, 100, now=0)
+    activity.record(1, 100, author_id=7, now=0)
+
+    assert activity.ranked(1, now=0) == [(100, 2, 1)]
+
+
+def test_window_slides_and_expired_channels_are_dropped():
+    activity = ChannelActivity(window=600, bucket=60)
+    activity.record(1, 100, author_id=1, now=0)
+    activity.record(1, 200, author_id=1, now=0)
+    activity.record(1, 200, author_id=2, now=540)
+
+    assert activity.ranked(1, now=600) == [(200, 1, 1)]
+    assert 100 not in activity.guilds['1']
+
+
+def test_reused_slot_is_reset():
+    activity = ChannelActivity(window=120, bucket=60)
+    activity.record(1, 100, author_id=1, now=0)
+    activity.record(1, 100, author_id=2, now=120)
+
+    assert activity.ranked(1, now=120) == [(100, 1, 1)]
+
+
+def test_filter_by_channel_ids():
+    activity = ChannelActivity(window=600, bucket=60)
+    activity.record(1, 100, author_id=1, now=0)
+    activity.record(1, 200, author_id=1, now=0)
+
+    assert activity.ranked(1, channel_ids={200}, now=0) == [(200, 1, 1)]
+    assert activity.ranked(2, now=0) == []
@@ -0,0 +1,56 @@
+from Data.pokemon.names import PokemonNameIndex, levenshtein, normalize_name
+
+
+ROWS = [
+    {'slug': 'mr-mime', 'name.en': 'Mr. Mime', 'name.ja': 'バリヤード', 'name.de': 'Pantimos', 'id': '122', 'dex_number': '122'},
+    {'slug': 'flabebe', 'name.en': 'Flabébé', 'name.fr': 'Flabébé', 'id': '669', 'dex_number': '669'},
+    {'slug': 'tapu-koko', 'name.en': 'Tapu Koko', 'id': '785', 'dex_number': '785'},
+    {'slug': 'pikachu', 'name.en': 'Pikachu', 'id': '25', 'dex_number': '25'},
+    {'slug': 'pikachu-gmax', 'name.en': 'Gigantamax Pikachu', 'id': '10199', 'dex_number': '25'},
+    {'slug': 'pichu', 'name.en': 'Pichu', 'name.de': 'Shared', 'id': '172', 'dex_number': '172'},
+    {'slug': 'shared-mon', 'name.en': 'Shared', 'id': '999', 'dex_number': '999'},
+]
+
+
+def test_normalize_name():
+    assert normalize_name('  Mr. Mime ') == 'mr-mime'
+    assert normalize_name('Farfetch’d') == 'farfetchd'
+    assert normalize_name('Type: Null') == 'type-null'
+    assert normalize_name('Flabébé') == 'flabebe'
+    assert normalize_name('バリヤード') == 'バリヤード'
+
+
+def test_levenshtein():
+    assert levenshtein('pikachu', 'pikachu') == 0
+    assert levenshtein('pikachu', 'pikchu') == 1
+    assert levenshtein('kitten', 'sitting') == 3
+    assert levenshtein('a', 'abcdef', max_distance=2) == 3
+
+
+def test_resolve_any_spelling_and_language():
+    index = PokemonNameIndex(ROWS)
+    for name in ('Mr. Mime', 'mr mime', 'MRMIME', 'バリヤード', 'pantimos'):
+        assert index.resolve(name) == 'mr-mime'
+    assert index.resolve('flabebe') == 'flabebe'
+    assert index.resolve('tapukoko') == 'tapu-koko'
+    assert index.resolve('missingno') is None
+    assert 'Pikachu' in index and 'missingno' not in index
+
+
+def test_higher_priority_column_wins_shared_alias():
+    # 'Shared' is Pichu's German name but another row's English name
+    assert PokemonNameIndex(ROWS).resolve('shared') == 'shared-mon'
+
+
+def test_complete_lists_species_before_forms():
+    index = PokemonNameIndex(ROWS)
+    assert index.complete('pi') == [('Pichu', 'pichu'), ('Pikachu', 'pikachu'), ('Gigantamax Pikachu', 'pikachu-gmax')]
+    assert index.complete('pika', limit=1) == [('Pikachu', 'pikachu')]
+    assert index.complete('zz') == []
+
+
+def test_suggest_close_names():
+    index = PokemonNameIndex(ROWS)
+    assert index.suggest('pikachuu')[0] == 'pikachu'
+    assert index.suggest('tapu kok') == ['tapu-koko']
+    assert index.suggest('zzzzzz') == []
@@ -0,0 +1,94 @@
+from Data.quest_index import ActiveQuestIndex
+
+
+def quest(quest_id, channel_id, **fields):
+    return dict(quest_id=quest_id, channel_id=channel_id, method='reaction', content='👍', **fields)
+
+
+def test_add_and_lookup():
+    index = ActiveQuestIndex()
+    index.add(1, 10, quest(1, '100'))
+    index.add(1, 10, quest(2, 200))
+
+    assert [q['quest_id'] for q in index.quests_for('1', 100, '10')] == [1]
+    assert [q['quest_id'] for q in index.quests_for(1, '200', 10)] == [2]
+    assert index.quests_for(1, 100, 11) == []
+    assert index.quests_for(2, 100, 10) == []
+    assert len(index) == 2
+
+
+def test_quest_without_channel_is_ignored():
+    index = ActiveQuestIndex()
+    index.add(1, 10, quest(1, None))
+    index.add(1, 10, quest(2, 'not a channel'))
+    assert len(index) == 0
+    assert index.guilds == {} and index.locations == {}
+
+
+def test_readd_moves_quest_to_new_channel():
+    index = ActiveQuestIndex()
+    index.add(1, 10, quest(1, 100))
+    index.add(1, 10, quest(1, 200))
+
+    assert index.quests_for(1, 100, 10) == []
+    assert [q['channel_id'] for q in index.quests_for(1, 200, 10)] == [200]
+    assert len(index) == 1
+
+
+def test_remove_prunes_empty_levels():
+    index = ActiveQuestIndex()
+    index.add(1, 10, quest(1, 100))
+    index.remove(1, 10, 1)
+    index.remove(1, 10, 1)
+
+    assert index.guilds == {}
+    assert index.locations == {}
+
+
+def test_remove_quest_from_every_member():
+    index = ActiveQuestIndex()
+    for user_id in (10, 11, 12):
+        index.add(1, user_id, quest(1, 100))
+        index.add(1, user_id, quest(2, 100))
+    index.add(2, 10, quest(1, 100))
+
+    index.remove_quest(1, 1)
+
+    assert all([q['quest_id'] for q in index.quests_for(1, 100, u)] == [2] for u in (10, 11, 12))
+    assert len(index.quests_for(2, 100, 10)) == 1
+    assert len(index) == 4
+
+
+def test_load_replaces_member_quests():
+    index = ActiveQuestIndex()
+    index.add(1, 10, quest(1, 100))
+    index.add(1, 11, quest(1, 100))
+    index.load(1, 10, [quest(2, 300), quest(3, 300)])
+
+    assert index.quests_for(1, 100, 10) == []
+    assert sorted(q['quest_id'] for q in index.quests_for(1, 300, 10)) == [2, 3]
+    assert len(index.quests_for(1, 100, 11)) == 1
+
+
+def test_clear_user_and_guild():
+    index = ActiveQuestIndex()
+    index.add(1, 10, quest(1, 100))
+    index.add(1, 11, quest(2, 100))
+    index.add(2, 10, quest(3, 100))
+
+    index.clear_user(1, 10)
+    assert index.quests_for(1, 100, 10) == []
+    assert len(index) == 2
+
+    index.clear_guild(1)
+    assert index.quests_for(1, 100, 11) == []
+    assert len(index) == 1
+
+
+def test_set_progress_updates_indexed_quest():
+    index = ActiveQuestIndex()
+    index.add(1, 10, quest(1, 100, progress=0))
+    index.set_progress(1, 10, 1, 3)
+    index.set_progress(1, 10, 99, 3)
+
+    assert index.quests_for(1, 100, 10)[0]['progress'] == 3
@@ -0,0 +1,54 @@
+import random
+
+from fuzzywuzzy import fuzz
+
+from Data.quest_matcher import MessageText, compile_quest, match_quests, naive_match, similarity_bound
+
+
+QUESTS = [
+    'Hey {member}, how was your day?',
+    'good morning everyone',
+    'Did anyone watch the game last night? It was wild',
+    '{member} and {member} should team up',
+]
+
+MESSAGES = [
+    'hey <@123>, how was your day?',
+    'HEY    <@!123>,  how was your day',
+    'good morning everyone!',
+    'gm',
+    'did anyone watch the game last night? it was wild',
+    'did anyone watch the game last week? it was mild',
+    '<@42> and <@42> should team up',
+    'lol',
+    '',
+    'a much longer message that goes on and on about nothing in particular at all ' * 3,
+]
+
+
+def test_bound_never_below_ratio():
+    random.seed(0)
+    alphabet = 'ab cde<@>1{member}'
+    contents = QUESTS + [''.join(random.choice(alphabet) for _ in range(random.randint(0, 80))) for _ in range(50)]
+    messages = MESSAGES + [''.join(random.choice(alphabet) for _ in range(random.randint(0, 80))) for _ in range(50)]
+    for content in contents:
+        compiled = compile_quest(content)
+        for text in messages:
+            message = MessageText(text)
+            ratio = fuzz.ratio(message.text, compiled.text(message.mention))
+            # threshold=0 always takes the histogram path for long pairs as well
+            for threshold in (0, 88):
+                assert similarity_bound(compiled, message, threshold) >= ratio - 0.5, (content, text)
+
+
+def test_matches_agree_with_naive_comparison():
+    quests = [{'content': content} for content in QUESTS]
+    for text in MESSAGES:
+        expected = [quest for quest in quests if naive_match(text, quest['content'])]
+        assert match_quests(text, quests) == expected, text
+
+
+def test_member_placeholder_is_filled_from_mention():
+    quests = [{'content': QUESTS[0]}]
+    assert match_quests('hey <@123>, how was your day?', quests) == quests
+    assert match_quests('what are you doing today?', quests) == []
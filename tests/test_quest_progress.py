@@ -0,0 +1,96 @@
+import asyncio
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+
+from Data.quest_progress import ProgressBuffer
+
+
+class FakeCollection:
+    def __init__(self, error=None):
+        self.error = error
+        self.calls = []
+
+    async def bulk_write(self, updates, ordered=True):
+        self.calls.append(updates)
+        if self.error is not None:
+            raise self.error
+
+
+def inc(guild_id, user_id, quest_id, amount):
+    return UpdateOne(
+        {'guild_id': guild_id, 'user_id': user_id, 'quests.quest_id': quest_id},
+        {'$inc': {'quests.$.progress': amount}}
+    )
+
+
+def test_add_coalesces_increments():
+    buffer = ProgressBuffer(FakeCollection())
+    buffer.add(1, 10, 5)
+    buffer.add('1', '10', 5, amount=2)
+    buffer.add(1, 11, 5)
+
+    assert buffer.pending == {('1', '10', 5): 3, ('1', '11', 5): 1}
+
+
+def test_discard_forgets_pending_quest():
+    buffer = ProgressBuffer(FakeCollection())
+    buffer.add(1, 10, 5)
+    buffer.add(1, 10, 6)
+    buffer.discard(1, 10, 5)
+    buffer.discard(1, 10, 7)
+
+    assert buffer.pending == {('1', '10', 6): 1}
+
+
+def test_flush_writes_one_bulk_of_inc_updates():
+    collection = FakeCollection()
+    buffer = ProgressBuffer(collection)
+    buffer.add(1, 10, 5, amount=3)
+    buffer.add(1, 11, 5)
+
+    asyncio.run(buffer.flush())
+
+    assert collection.calls == [[inc('1', '10', 5, 3), inc('1', '11', 5, 1)]]
+    assert buffer.pending == {}
+
+
+def test_flush_single_key():
+    collection = FakeCollection()
+    buffer = ProgressBuffer(collection)
+    buffer.add(1, 10, 5)
+    buffer.add(1, 11, 5)
+
+    asyncio.run(buffer.flush((1, 10, 5)))
+    asyncio.run(buffer.flush((1, 12, 5)))
+
+    assert collection.calls == [[inc('1', '10', 5, 1)]]
+    assert buffer.pending == {('1', '11', 5): 1}
+
+
+def test_flush_nothing_pending_skips_write():
+    collection = FakeCollection()
+    asyncio.run(ProgressBuffer(collection).flush())
+    assert collection.calls == []
+
+
+def test_partial_failure_keeps_only_rejected_updates():
+    error = BulkWriteError({'writeErrors': [{'index': 1, 'code': 2, 'errmsg': 'rejected'}]})
+    buffer = ProgressBuffer(FakeCollection(error))
+    buffer.add(1, 10, 5, amount=2)
+    buffer.add(1, 11, 5, amount=4)
+    buffer.add(1, 12, 5)
+
+    asyncio.run(buffer.flush())
+
+    assert buffer.pending == {('1', '11', 5): 4}
+
+
+def test_failed_write_keeps_everything_and_merges_new_increments():
+    buffer = ProgressBuffer(FakeCollection(PyMongoError('down')))
+    buffer.add(1, 10, 5, amount=2)
+
+    asyncio.run(buffer.flush())
+    buffer.add(1, 10, 5)
+
+    assert buffer.pending == {('1', '10', 5): 3}
@@ -0,0 +1,54 @@
+import numpy as np
+
+from Data.pokemon.types import TYPE_INDEX, TYPES, TypeChart, type_chart
+
+
+def test_single_type_matchups():
+    matchups = type_chart.matchups(['Ghost'])
+    assert matchups['immunities'] == ['normal', 'fighting']
+    assert matchups['weaknesses'] == ['ghost', 'dark']
+    assert matchups['resistances'] == ['poison', 'bug']
+    assert matchups['double_weaknesses'] == []
+
+
+def test_dual_type_matchups():
+    matchups = type_chart.matchups(['grass', 'ice'])
+    assert matchups['double_weaknesses'] == ['fire']
+    assert 'flying' in matchups['weaknesses']
+    assert matchups['resistances'] == ['ground', 'water', 'grass', 'electric']
+
+    # Immunity wins over a weakness of the other type
+    assert type_chart.matchups(['water', 'ground'])['immunities'] == ['electric']
+    assert type_chart.matchups(['water', 'ground'])['double_weaknesses'] == ['grass']
+
+
+def test_unknown_and_missing_types_are_ignored():
+    assert np.array_equal(type_chart.defense(['fire', None]), type_chart.defense(['fire']))
+    assert np.array_equal(type_chart.defense(['fire', '???']), type_chart.defense(['fire']))
+    assert np.array_equal(type_chart.defense([]), np.ones(len(TYPES)))
+
+
+def test_defense_table_matches_defense():
+    typings = [('fire', None), ('water', 'ground'), ('dragon', 'fairy'), ('normal', 'ghost')]
+    first = [TYPE_INDEX[a] for a, _ in typings]
+    second = [TYPE_INDEX[b] if b else -1 for _, b in typings]
+
+    table = type_chart.defense_table(first, second)
+
+    assert table.shape == (len(typings), len(TYPES))
+    for row, (a, b) in zip(table, typings):
+        assert np.array_equal(row, type_chart.defense([a, b]))
+    assert np.array_equal(type_chart.defense_table(first)[0], type_chart.defense(['fire']))
+
+
+def test_strengths():
+    assert type_chart.strengths(['electric']) == ['flying', 'water']
+    assert type_chart.strengths([]) == []
+
+
+def test_custom_matrix():
+    matrix = np.ones((len(TYPES), len(TYPES)))
+    matrix[TYPE_INDEX['fire'], TYPE_INDEX['grass']] = 2
+    chart = TypeChart(matrix)
+    assert chart.matchups(['grass'])['weaknesses'] == ['fire']
+    assert chart.matchups(['grass', 'grass'])['double_weaknesses'] == ['fire']
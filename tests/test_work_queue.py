@@ -0,0 +1,79 @@
+import asyncio
+
+from Data.work_queue import KeyedWorkQueue
+
+
+def test_jobs_with_same_key_run_in_order():
+    async def run():
+        queue = KeyedWorkQueue(workers=4, max_size=100)
+        seen = []
+
+        async def job(key, n):
+            await asyncio.sleep(0)
+            seen.append((key, n))
+
+        queue.start()
+        for n in range(10):
+            for key in ('a', 'b', 'c'):
+                assert await queue.submit(key, job, key, n)
+        await queue.stop()
+        return queue, seen
+
+    queue, seen = asyncio.run(run())
+    for key in ('a', 'b', 'c'):
+        assert [n for k, n in seen if k == key] == list(range(10))
+    assert queue.metrics() == {'queue_depth': 0, 'processed': 30, 'failed': 0, 'dropped': 0}
+
+
+def test_full_queue_drops_immediately():
+    async def run():
+        queue = KeyedWorkQueue(workers=1, max_size=2)
+
+        async def job():
+            pass
+
+        results = [await queue.submit('a', job) for _ in range(4)]
+        return queue, results
+
+    queue, results = asyncio.run(run())
+    assert results == [True, True, False, False]
+    assert queue.dropped == 2
+    assert queue.queue_depth == 2
+
+
+def test_max_wait_waits_for_room():
+    async def run():
+        queue = KeyedWorkQueue(workers=1, max_size=1, max_wait=1.0)
+
+        async def job():
+            pass
+
+        assert await queue.submit('a', job)
+        queue.start()
+        accepted = await queue.submit('a', job)
+        await queue.stop()
+        return queue, accepted
+
+    queue, accepted = asyncio.run(run())
+    assert accepted
+    assert queue.dropped == 0 and queue.processed == 2
+
+
+def test_failed_job_is_counted_and_worker_keeps_going():
+    async def run():
+        queue = KeyedWorkQueue(workers=1, max_size=10)
+
+        async def boom():
+            raise ValueError('boom')
+
+        async def ok():
+            pass
+
+        queue.start()
+        await queue.submit('a', boom)
+        await queue.submit('a', ok)
+        await queue.stop()
+        return queue
+
+    queue = asyncio.run(run())
+    assert queue.failed == 1 and queue.processed == 1